@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""Vector Index Benchmark
+
+Measure what HNSW index parameters cost and buy on synthetic catalogs.
+
+Catalogs are drawn from a Gaussian mixture at the configured vector
+dimension, exact ground truth is computed with blocked NumPy matrix
+multiplies, and each backend is swept over index parameters (M,
+ef_construction) and query-time ef. For every combination the report shows
+recall@k, p50/p99 query latency, throughput, build time and memory.
+
+Backends:
+    exact    In-process exact index (InMemoryVectorIndex), the recall baseline
+    hnswlib  Local HNSW stand-in (requires ``pip install hnswlib``)
+    seekdb   The configured SeekDB server, through SeekDBClient
+
+Usage:
+    python -m scripts.benchmark_vector_index --sizes 10000,100000
+    python -m scripts.benchmark_vector_index --backend hnswlib --m 8,16,32 --ef 16,64,256
+    python -m scripts.benchmark_vector_index --backend seekdb --sizes 100000 --output bench.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skillpilot.core.config import settings
+from skillpilot.core.services.vector_index import InMemoryVectorIndex
+from skillpilot.db.seekdb import seekdb_client
+
+BENCH_TABLE = "bench_vectors"
+
+
+def parse_ints(value: str) -> list[int]:
+    """Parse a comma-separated list of integers"""
+    return [int(x) for x in value.split(",") if x.strip()]
+
+
+def rss_bytes() -> int:
+    """Current resident set size of this process"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Peak RSS, in KB on Linux: only grows, but better than nothing
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def generate_vectors(
+    count: int, dimension: int, centers: np.ndarray, spread: float, rng: np.random.Generator
+) -> np.ndarray:
+    """Draw L2-normalized vectors from a Gaussian mixture around the centers"""
+    vectors = np.empty((count, dimension), dtype=np.float32)
+    chunk = 65536
+    for start in range(0, count, chunk):
+        end = min(start + chunk, count)
+        assigned = rng.integers(0, len(centers), size=end - start)
+        noise = rng.normal(scale=spread, size=(end - start, dimension)).astype(np.float32)
+        block = centers[assigned] + noise
+        vectors[start:end] = block / np.linalg.norm(block, axis=1, keepdims=True)
+    return vectors
+
+
+def exact_top_k(
+    catalog: np.ndarray, queries: np.ndarray, k: int, memory_bytes: int
+) -> np.ndarray:
+    """Exact top-k catalog rows per query, with query blocks sized to the memory budget"""
+    block = max(1, min(len(queries), memory_bytes // max(len(catalog) * 4, 1)))
+    truth = np.empty((len(queries), k), dtype=np.int64)
+    for start in range(0, len(queries), block):
+        scores = queries[start : start + block] @ catalog.T
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+        truth[start : start + block] = np.take_along_axis(top, order, axis=1)
+    return truth
+
+
+def recall_at_k(predicted: list[list[int]], truth: np.ndarray) -> float:
+    """Mean fraction of each query's true top-k that was returned"""
+    k = truth.shape[1]
+    hits = sum(
+        len(set(found[:k]) & set(expected))
+        for found, expected in zip(predicted, truth.tolist(), strict=True)
+    )
+    return hits / (len(truth) * k)
+
+
+def latency_report(latencies: list[float]) -> dict:
+    """p50/p99 latency in milliseconds and single-client throughput"""
+    array = np.asarray(latencies) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(array, 50)), 3),
+        "p99_ms": round(float(np.percentile(array, 99)), 3),
+        "qps": round(len(array) / max(float(array.sum()) / 1000, 1e-9), 1),
+    }
+
+
+def bench_exact(
+    catalog: np.ndarray, queries: np.ndarray, truth: np.ndarray, k: int, **_
+) -> list[dict]:
+    """Benchmark the in-process exact index"""
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+    index = InMemoryVectorIndex(dimension=catalog.shape[1], initial_capacity=len(catalog))
+    for row, vector in enumerate(catalog):
+        index.upsert(str(row), vector)
+    build_seconds = time.perf_counter() - start
+    # RSS can miss memory the allocator reuses; the matrix size is a floor
+    memory = max(rss_bytes() - rss_before, index.stats()["memory_bytes"])
+
+    latencies, predicted = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results = index.search(query, k)
+        latencies.append(time.perf_counter() - start)
+        predicted.append([int(result["skill_id"]) for result in results])
+
+    return [
+        {
+            "params": {},
+            "recall": round(recall_at_k(predicted, truth), 4),
+            **latency_report(latencies),
+            "build_seconds": round(build_seconds, 2),
+            "memory_mb": round(memory / 1024 / 1024, 1),
+        }
+    ]
+
+
+def bench_hnswlib(
+    catalog: np.ndarray,
+    queries: np.ndarray,
+    truth: np.ndarray,
+    k: int,
+    m_values: list[int],
+    ef_construction_values: list[int],
+    ef_values: list[int],
+    threads: int,
+    **_,
+) -> list[dict]:
+    """Benchmark a local HNSW index over the parameter grid"""
+    try:
+        import hnswlib
+    except ImportError:
+        print("  hnswlib is not installed (pip install hnswlib); skipping")
+        return []
+
+    rows = []
+    for m in m_values:
+        for ef_construction in ef_construction_values:
+            rss_before = rss_bytes()
+            start = time.perf_counter()
+            index = hnswlib.Index(space="ip", dim=catalog.shape[1])
+            index.init_index(max_elements=len(catalog), M=m, ef_construction=ef_construction)
+            index.set_num_threads(threads)
+            index.add_items(catalog, np.arange(len(catalog)))
+            build_seconds = time.perf_counter() - start
+            memory = rss_bytes() - rss_before
+
+            # Queries are timed one at a time, like the serving path
+            index.set_num_threads(1)
+            for ef in ef_values:
+                index.set_ef(max(ef, k))
+                latencies, predicted = [], []
+                for query in queries:
+                    start = time.perf_counter()
+                    labels, _ = index.knn_query(query, k=k)
+                    latencies.append(time.perf_counter() - start)
+                    predicted.append(labels[0].tolist())
+                rows.append(
+                    {
+                        "params": {"m": m, "ef_construction": ef_construction, "ef": ef},
+                        "recall": round(recall_at_k(predicted, truth), 4),
+                        **latency_report(latencies),
+                        "build_seconds": round(build_seconds, 2),
+                        "memory_mb": round(memory / 1024 / 1024, 1),
+                    }
+                )
+                print_row(rows[-1])
+            del index
+    return rows
+
+
+async def bench_seekdb(
+    catalog: np.ndarray,
+    queries: np.ndarray,
+    truth: np.ndarray,
+    k: int,
+    m_values: list[int],
+    ef_construction_values: list[int],
+    insert_batch_size: int | None,
+    **_,
+) -> list[dict]:
+    """
+    Benchmark the SeekDB server over M and ef_construction.
+
+    SeekDBClient doesn't expose query-time ef, so each build is queried with
+    the server default. Memory is the server's, so it isn't measured here.
+    """
+    await seekdb_client.connect()
+    rows = []
+
+    for m in m_values:
+        for ef_construction in ef_construction_values:
+            start = time.perf_counter()
+            async with seekdb_client.connection() as client:
+                if hasattr(client, "drop_table"):
+                    try:
+                        await client.drop_table(BENCH_TABLE)
+                    except Exception:
+                        pass  # Table didn't exist yet
+                await client.create_table(
+                    BENCH_TABLE,
+                    {"item_id": "string", "item_vector": "vector"},
+                    primary_key="item_id",
+                )
+                await client.create_vector_index(
+                    BENCH_TABLE,
+                    "idx_bench_vector",
+                    index_type=settings.seekdb_index_type,
+                    m=m,
+                    ef_construction=ef_construction,
+                )
+            for chunk in range(0, len(catalog), 10000):
+                result = await seekdb_client.insert_many(
+                    BENCH_TABLE,
+                    [
+                        {"item_id": str(row), "item_vector": catalog[row].tolist()}
+                        for row in range(chunk, min(chunk + 10000, len(catalog)))
+                    ],
+                    batch_size=insert_batch_size,
+                    key_column="item_id",
+                )
+                if result.failed:
+                    print(f"  {len(result.failed)} rows failed to load")
+            build_seconds = time.perf_counter() - start
+
+            latencies, predicted = [], []
+            for query in queries:
+                start = time.perf_counter()
+                results = await seekdb_client.vector_search(
+                    BENCH_TABLE, "item_vector", query.tolist(), top_k=k
+                )
+                latencies.append(time.perf_counter() - start)
+                predicted.append([int(result["item_id"]) for result in results])
+
+            rows.append(
+                {
+                    "params": {"m": m, "ef_construction": ef_construction, "ef": "default"},
+                    "recall": round(recall_at_k(predicted, truth), 4),
+                    **latency_report(latencies),
+                    "build_seconds": round(build_seconds, 2),
+                    "memory_mb": None,
+                }
+            )
+            print_row(rows[-1])
+
+    async with seekdb_client.connection() as client:
+        if hasattr(client, "drop_table"):
+            await client.drop_table(BENCH_TABLE)
+    return rows
+
+
+def print_row(row: dict) -> None:
+    """Print one result line"""
+    params = " ".join(f"{name}={value}" for name, value in row["params"].items()) or "-"
+    memory = "n/a" if row["memory_mb"] is None else f"{row['memory_mb']:.1f}MB"
+    print(
+        f"  {params:<36} recall@k {row['recall']:.4f}"
+        f"  p50 {row['p50_ms']:.3f}ms  p99 {row['p99_ms']:.3f}ms  {row['qps']:.0f} qps"
+        f"  build {row['build_seconds']:.1f}s  mem {memory}"
+    )
+
+
+async def run_benchmark(
+    sizes: list[int],
+    dimension: int,
+    backends: list[str],
+    query_count: int,
+    k: int,
+    clusters: int,
+    spread: float,
+    seed: int,
+    memory_mb: int,
+    output: str | None,
+    **params,
+):
+    """Run the benchmark for every catalog size and backend"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dimension)).astype(np.float32)
+    centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+
+    async with AsyncExitStack() as stack:
+        output_file = stack.enter_context(open(output, "w", encoding="utf-8")) if output else None
+        if "seekdb" in backends:
+            stack.push_async_callback(seekdb_client.close)
+        for size in sizes:
+            print(f"\n=== {size} vectors, dim {dimension}, {query_count} queries, k={k} ===\n")
+
+            start = time.perf_counter()
+            catalog = generate_vectors(size, dimension, centers, spread, rng)
+            queries = generate_vectors(query_count, dimension, centers, spread, rng)
+            print(f"Generated catalog in {time.perf_counter() - start:.1f}s")
+
+            start = time.perf_counter()
+            truth = exact_top_k(catalog, queries, k, memory_mb * 1024 * 1024)
+            print(f"Computed exact ground truth in {time.perf_counter() - start:.1f}s")
+
+            for backend in backends:
+                print(f"\n[{backend}]")
+                if backend == "exact":
+                    rows = bench_exact(catalog, queries, truth, k)
+                    for row in rows:
+                        print_row(row)
+                elif backend == "hnswlib":
+                    rows = bench_hnswlib(catalog, queries, truth, k, **params)
+                else:
+                    rows = await bench_seekdb(catalog, queries, truth, k, **params)
+
+                if output_file:
+                    for row in rows:
+                        record = {
+                            "size": size,
+                            "dimension": dimension,
+                            "k": k,
+                            "backend": backend,
+                            **row,
+                        }
+                        output_file.write(json.dumps(record) + "\n")
+
+            del catalog, queries, truth
+    if output:
+        print(f"\nResults written to {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark vector index recall, latency, build time and memory",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Exact baseline and local HNSW sweep on 10k and 100k vectors
+  %(prog)s --sizes 10000,100000 --backend exact --backend hnswlib
+
+  # Sweep query-time ef for the configured build parameters
+  %(prog)s --backend hnswlib --ef 10,20,40,80,160,320
+
+  # Compare M values on the real server
+  %(prog)s --backend seekdb --sizes 100000 --m 8,16,32 --output seekdb.jsonl
+        """,
+    )
+
+    parser.add_argument(
+        "--sizes",
+        type=parse_ints,
+        default=[10000, 100000, 1000000],
+        help="Comma-separated catalog sizes",
+    )
+
+    parser.add_argument(
+        "--dimension",
+        type=int,
+        default=settings.seekdb_vector_dimension,
+        help="Vector dimension",
+    )
+
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=["exact", "hnswlib", "seekdb"],
+        help="Backend to benchmark (repeatable; default: exact and hnswlib)",
+    )
+
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=1000,
+        help="Number of queries per catalog",
+    )
+
+    parser.add_argument(
+        "--k",
+        type=int,
+        default=10,
+        help="Neighbors per query (recall@k)",
+    )
+
+    parser.add_argument(
+        "--m",
+        type=parse_ints,
+        default=[settings.seekdb_hnsw_m],
+        help="Comma-separated HNSW M values",
+    )
+
+    parser.add_argument(
+        "--ef-construction",
+        type=parse_ints,
+        default=[settings.seekdb_hnsw_ef_construction],
+        help="Comma-separated HNSW ef_construction values",
+    )
+
+    parser.add_argument(
+        "--ef",
+        type=parse_ints,
+        default=[16, 32, 64, 128, 256],
+        help="Comma-separated query-time ef values (hnswlib only)",
+    )
+
+    parser.add_argument(
+        "--clusters",
+        type=int,
+        default=100,
+        help="Gaussian mixture components of the synthetic catalog",
+    )
+
+    parser.add_argument(
+        "--spread",
+        type=float,
+        default=0.05,
+        help="Per-dimension noise around cluster centers",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed",
+    )
+
+    parser.add_argument(
+        "--memory-mb",
+        type=int,
+        default=1024,
+        help="Memory budget for exact ground truth blocks, in MB",
+    )
+
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Threads for HNSW index builds",
+    )
+
+    parser.add_argument(
+        "--insert-batch-size",
+        type=int,
+        default=None,
+        help="Rows per bulk insert when loading SeekDB (default from settings)",
+    )
+
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        help="Write results to this JSON Lines file",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_benchmark(
+            sizes=args.sizes,
+            dimension=args.dimension,
+            backends=args.backend or ["exact", "hnswlib"],
+            query_count=args.queries,
+            k=args.k,
+            clusters=args.clusters,
+            spread=args.spread,
+            seed=args.seed,
+            memory_mb=args.memory_mb,
+            output=args.output,
+            m_values=args.m,
+            ef_construction_values=args.ef_construction,
+            ef_values=args.ef,
+            threads=args.threads,
+            insert_batch_size=args.insert_batch_size,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Similar Skills Batch Job
+
+Compute every skill's top-K most similar skills offline and write them to the
+skill_neighbors table in bulk.
+
+Vectors are streamed from skill_vectors into a memory-mapped file, then all
+pairs are scored with blocked matrix multiplies whose block size is chosen to
+keep peak memory within --memory-mb.
+
+Usage:
+    python -m scripts.compute_similarity
+    python -m scripts.compute_similarity --k 20 --memory-mb 2048
+    python -m scripts.compute_similarity --dry-run --output neighbors.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from contextlib import ExitStack, aclosing
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skillpilot.core.config import settings
+from skillpilot.core.services.pairwise import PairwiseProgress, blocked_top_k, plan_blocks
+from skillpilot.core.services.similarity_graph import similarity_graph_service
+from skillpilot.db.seekdb import seekdb_client
+
+
+async def stream_vectors(path: Path, batch_size: int) -> tuple[list[str], int]:
+    """Stream normalized vectors from skill_vectors into a raw float32 file"""
+    skill_ids: list[str] = []
+    dimension = 0
+    start = time.perf_counter()
+
+    scan = seekdb_client.scan(
+        "skill_vectors", chunk_size=batch_size, columns=("skill_id", "skill_vector")
+    )
+    with path.open("wb") as f:
+        async with aclosing(scan) as chunks:
+            async for fetched in chunks:
+                rows = [row for row in fetched if row.get("skill_vector")]
+                if rows:
+                    matrix = np.asarray([row["skill_vector"] for row in rows], dtype=np.float32)
+                    if not dimension:
+                        dimension = matrix.shape[1]
+                    elif matrix.shape[1] != dimension:
+                        raise ValueError(
+                            f"Vector dimension changed from {dimension} to {matrix.shape[1]}"
+                        )
+                    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                    norms[norms == 0] = 1.0
+                    f.write((matrix / norms).tobytes())
+                    skill_ids.extend(row["skill_id"] for row in rows)
+
+                elapsed = time.perf_counter() - start
+                print(
+                    f"\r  Loaded {len(skill_ids)} vectors ({len(skill_ids) / max(elapsed, 1e-9):.0f}/s)",
+                    end="",
+                    flush=True,
+                )
+    print()
+
+    return skill_ids, dimension
+
+
+def print_progress(progress: PairwiseProgress) -> None:
+    """Print a one-line progress report"""
+    percent = progress.block_pairs_done / progress.block_pairs_total * 100
+    print(
+        f"\r  Blocks {progress.block_pairs_done}/{progress.block_pairs_total} ({percent:.1f}%)"
+        f"  {progress.pairs_per_second / 1e6:.1f}M pairs/s"
+        f"  ETA {progress.eta_seconds:.0f}s",
+        end="",
+        flush=True,
+    )
+
+
+def iter_neighbor_lists(
+    skill_ids: list[str],
+    indices: np.ndarray,
+    scores: np.ndarray,
+    min_similarity: float,
+    chunk_size: int,
+):
+    """Map top-K index rows back to skill IDs, one chunk of skills at a time"""
+    for start in range(0, len(skill_ids), chunk_size):
+        lists = {}
+        for row in range(start, min(start + chunk_size, len(skill_ids))):
+            lists[skill_ids[row]] = [
+                (skill_ids[j], round(float(s), 6))
+                for j, s in zip(indices[row], scores[row], strict=True)
+                if j >= 0 and s >= min_similarity
+            ]
+        yield lists
+
+
+async def compute_similarity(
+    k: int,
+    memory_mb: int,
+    batch_size: int,
+    min_similarity: float,
+    workdir: str | None,
+    output: str | None,
+    dry_run: bool,
+):
+    """Run the batch job"""
+    print("\n=== Computing Similar Skills ===\n")
+
+    print("Connecting to database...")
+    await seekdb_client.connect()
+
+    try:
+        with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+            path = Path(tmp) / "vectors.f32"
+
+            print("Streaming vectors...")
+            skill_ids, dimension = await stream_vectors(path, batch_size)
+            if len(skill_ids) < 2:
+                print("Not enough vectors to compare")
+                return
+
+            memory_bytes = memory_mb * 1024 * 1024
+            plan = plan_blocks(len(skill_ids), dimension, k, memory_bytes)
+            print(
+                f"Scoring {len(skill_ids)} x {len(skill_ids)} pairs (dim {dimension}, k {k}):"
+                f" block {plan.block_size}, peak ~{plan.peak_bytes / 1024 / 1024:.0f} MB"
+            )
+
+            vectors = np.memmap(path, dtype=np.float32, mode="r", shape=(len(skill_ids), dimension))
+            start = time.perf_counter()
+            indices, scores = blocked_top_k(vectors, k, memory_bytes, progress=print_progress)
+            seconds = time.perf_counter() - start
+            print(f"\n  Done in {seconds:.1f}s ({len(skill_ids) / seconds:.0f} skills/s)")
+            del vectors
+
+        similarity_graph_service.k = k
+        written = 0
+        failed = 0
+        start = time.perf_counter()
+
+        print("Dry run: skill_neighbors not updated" if dry_run else "Writing neighbor lists...")
+        with ExitStack() as stack:
+            output_file = (
+                stack.enter_context(open(output, "w", encoding="utf-8")) if output else None
+            )
+            for lists in iter_neighbor_lists(
+                skill_ids, indices, scores, min_similarity, chunk_size=batch_size
+            ):
+                if output_file:
+                    for skill_id, neighbors in lists.items():
+                        record = {
+                            "skill_id": skill_id,
+                            "neighbors": [{"skill_id": n, "similarity": s} for n, s in neighbors],
+                        }
+                        output_file.write(json.dumps(record) + "\n")
+                if not dry_run:
+                    stored = await similarity_graph_service.store_many(lists)
+                    written += stored
+                    failed += len(lists) - stored
+                    elapsed = time.perf_counter() - start
+                    print(
+                        f"\r  Written {written}/{len(skill_ids)}"
+                        f" ({written / max(elapsed, 1e-9):.0f} lists/s)",
+                        end="",
+                        flush=True,
+                    )
+        if output:
+            print(f"\nWrote {len(skill_ids)} neighbor lists to {output}")
+
+        if dry_run:
+            return
+
+        seconds = time.perf_counter() - start
+        print("\n\n=== Summary ===")
+        print(f"  Skills: {len(skill_ids)}")
+        print(f"  Written: {written}")
+        print(f"  Failed: {failed}")
+        print(f"  Write time: {seconds:.1f}s")
+
+    except Exception as e:
+        print(f"Error computing similar skills: {e}")
+    finally:
+        await seekdb_client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute similar skills offline and store them in skill_neighbors",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Recompute all neighbor lists with default settings
+  %(prog)s
+
+  # 500k skills on a box with 4 GB to spare
+  %(prog)s --memory-mb 4096 --workdir /data/tmp
+
+  # Inspect results without touching the database
+  %(prog)s --dry-run --output neighbors.jsonl
+        """,
+    )
+
+    parser.add_argument(
+        "--k",
+        type=int,
+        default=settings.similarity_graph_k,
+        help="Neighbors per skill",
+    )
+
+    parser.add_argument(
+        "--memory-mb",
+        type=int,
+        default=1024,
+        help="Peak memory budget for scoring, in MB (vectors are memory-mapped)",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.vector_local_index_load_batch,
+        help="Vectors fetched per database query",
+    )
+
+    parser.add_argument(
+        "--min-similarity",
+        type=float,
+        default=-1.0,
+        help="Drop neighbors below this similarity",
+    )
+
+    parser.add_argument(
+        "--workdir",
+        type=str,
+        help="Directory for the memory-mapped vector file (default: system temp)",
+    )
+
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        help="Also write neighbor lists to this JSON Lines file",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Compute neighbors without writing to the database",
+    )
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        compute_similarity(
+            k=args.k,
+            memory_mb=args.memory_mb,
+            batch_size=args.batch_size,
+            min_similarity=args.min_similarity,
+            workdir=args.workdir,
+            output=args.output,
+            dry_run=args.dry_run,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
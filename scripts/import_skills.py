@@ -64,7 +64,7 @@ async def run_import(
 
     # Connect to database
     print("Connecting to database...")
-    seekdb_client.connect()
+    await seekdb_client.connect()
 
     try:
         # Run import
@@ -92,7 +92,7 @@ async def run_import(
     except Exception as e:
         print(f"Error during import: {e}")
     finally:
-        seekdb_client.close()
+        await seekdb_client.close()
 
 
 async def import_all_platforms(limit: int = 50, config_overrides: dict = None):
@@ -103,7 +103,7 @@ async def import_all_platforms(limit: int = 50, config_overrides: dict = None):
 
     # Connect to database
     print("Connecting to database...")
-    seekdb_client.connect()
+    await seekdb_client.connect()
 
     try:
         for importer in get_importer():
@@ -126,7 +126,7 @@ async def import_all_platforms(limit: int = 50, config_overrides: dict = None):
     except Exception as e:
         print(f"Error: {e}")
     finally:
-        seekdb_client.close()
+        await seekdb_client.close()
 
 
 def main():
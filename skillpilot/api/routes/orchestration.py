@@ -29,16 +29,21 @@ async def analyze_task(
 async def recommend_skills(
     task_description: str = Query(..., description="Task description"),
     limit: int = Query(10, ge=1, le=50, description="Max skills to recommend"),
+    mmr_lambda: float | None = Query(
+        None, ge=0.0, le=1.0, description="Diversify with MMR (1.0 = relevance only)"
+    ),
     current_user: User = Depends(get_current_user),
 ):
     """
     Recommend skills for a given task using semantic matching.
 
-    Returns ranked list of skill recommendations.
+    Returns ranked list of skill recommendations. With ``mmr_lambda`` set,
+    near-duplicate skills are demoted in favor of different ones.
     """
     skills = await recommendation_service.recommend_skills(
         task_description=task_description,
         limit=limit,
+        mmr_lambda=mmr_lambda,
     )
     return {"skills": skills, "count": len(skills)}
 
@@ -84,12 +89,16 @@ async def save_recommendation(
 async def list_plans(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="pagination.next_cursor of the previous page"),
     current_user: User = Depends(get_current_user),
 ):
     """List saved recommendation plans for the current user"""
-    plans, pagination = await recommendation_service.list_plans(
-        user_id=current_user.user_id, page=page, limit=limit
-    )
+    try:
+        plans, pagination = await recommendation_service.list_plans(
+            user_id=current_user.user_id, page=page, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     return ListResponse(data=plans, pagination=pagination)
 
 
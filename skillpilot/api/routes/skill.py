@@ -1,6 +1,6 @@
 """Skill Routes"""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from skillpilot.api.routes.auth import get_current_user
 from skillpilot.core.models.common import ListResponse, PlatformType
@@ -21,27 +21,54 @@ async def list_skills(
     platform: PlatformType | None = Query(None, description="Filter by platform"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="pagination.next_cursor of the previous page"),
     current_user: User = Depends(get_current_user),
 ):
-    """List skills"""
-    skills, pagination = await skill_service.list_skills(platform=platform, page=page, limit=limit)
+    """
+    List skills.
+
+    Follow pagination.next_cursor for deep pages; it seeks directly to the
+    next page instead of skipping rows.
+    """
+    try:
+        skills, pagination = await skill_service.list_skills(
+            platform=platform, page=page, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
     return ListResponse(data=[s.model_dump() for s in skills], pagination=pagination)
 
 
 @router.get("/search", response_model=list[SkillSearchResult])
 async def search_skills(
+    response: Response,
     q: str = Query(..., description="Search query"),
     platforms: list[PlatformType] | None = Query(None, description="Filter by platforms"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="Cursor from a previous page's X-Next-Cursor"),
+    mode: str = Query(
+        "semantic", pattern="^(semantic|hybrid)$", description="semantic or hybrid retrieval"
+    ),
     current_user: User = Depends(get_current_user),
 ):
-    """Search skills"""
-    results = await skill_service.search_skills(
-        query=q, platforms=platforms, page=page, limit=limit
-    )
-
+    """
+    Search skills.
+
+    The cursor for the next page is returned in the X-Next-Cursor header;
+    following it serves the page from the cached ranking of the first request.
+    Hybrid mode fuses semantic and BM25 keyword rankings.
+    """
+    try:
+        results, next_cursor = await skill_service.search_skills(
+            query=q, platforms=platforms, page=page, limit=limit, cursor=cursor, mode=mode
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return results
 
 
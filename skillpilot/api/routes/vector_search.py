@@ -3,7 +3,10 @@
 from fastapi import APIRouter, HTTPException, Query
 
 from skillpilot.core.models.common import PlatformType
-from skillpilot.core.models.skill import SkillSearchResult
+from skillpilot.core.models.skill import BatchSearchRequest, BatchSearchResult, SkillSearchResult
+from skillpilot.core.services.embedding import embedding_service
+from skillpilot.core.services.rate_limiter import rate_limiter_stats
+from skillpilot.core.services.similarity_graph import similarity_graph_service
 from skillpilot.core.services.vector_search import vector_search_service
 
 router = APIRouter(prefix="/vector", tags=["Vector Search"])
@@ -15,25 +18,98 @@ async def search_skills_semantic(
     platforms: list[PlatformType] | None = Query(None, description="Filter by platforms"),
     top_k: int = Query(10, ge=1, le=100, description="Number of results"),
     threshold: float = Query(0.5, ge=0.0, le=1.0, description="Similarity threshold"),
+    pricing_types: list[str] | None = Query(None, description="Filter by pricing types"),
+    min_rating: float | None = Query(None, ge=0.0, description="Minimum rating"),
+    tags: list[str] | None = Query(None, description="Filter by tags (any match)"),
+    mode: str = Query(
+        "semantic", pattern="^(semantic|hybrid)$", description="semantic or hybrid retrieval"
+    ),
+    fusion: str | None = Query(
+        None, pattern="^(rrf|weighted)$", description="Hybrid fusion method (default from settings)"
+    ),
+    mmr_lambda: float | None = Query(
+        None,
+        ge=0.0,
+        le=1.0,
+        description="Diversify semantic results with MMR (1.0 = relevance only); semantic mode only",
+    ),
+    ranking: str | None = Query(
+        None,
+        pattern="^(similarity|blended)$",
+        description=(
+            "Semantic ranking: similarity, or blended with usage/rating/recency; "
+            "semantic mode only"
+        ),
+    ),
 ):
     """
     Search skills using semantic similarity.
     
     Uses vector embeddings to find skills semantically similar to the query,
-    not just keyword matches.
+    not just keyword matches. Filters are applied inside the vector index.
+    Hybrid mode also runs a BM25 keyword query and fuses both rankings.
+    In semantic mode, ``mmr_lambda`` re-ranks a wider candidate set with
+    maximal marginal relevance so near-duplicates don't fill the top-k.
+    Blended ranking mixes similarity with usage, rating and recency and
+    returns each result's score breakdown. Both re-rankers work on cosine
+    similarities, not on fused hybrid scores, so combining ``mmr_lambda`` or
+    ``ranking`` with hybrid mode is rejected with 400.
+    Per-stage latencies are reported in the Server-Timing header.
     """
+    if mode == "hybrid" and (mmr_lambda is not None or ranking is not None):
+        raise HTTPException(
+            status_code=400, detail="mmr_lambda and ranking are only supported in semantic mode"
+        )
+
     try:
+        if mode == "hybrid":
+            return await vector_search_service.search_skills_hybrid(
+                query=query,
+                platforms=platforms,
+                top_k=top_k,
+                threshold=threshold,
+                pricing_types=pricing_types,
+                min_rating=min_rating,
+                tags=tags,
+                fusion=fusion,
+            )
         results = await vector_search_service.search_skills_semantic(
             query=query,
             platforms=platforms,
             top_k=top_k,
             threshold=threshold,
+            pricing_types=pricing_types,
+            min_rating=min_rating,
+            tags=tags,
+            mmr_lambda=mmr_lambda,
+            ranking=ranking,
         )
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+@router.post("/search/batch", response_model=list[BatchSearchResult])
+async def search_skills_batch(request: BatchSearchRequest):
+    """
+    Run several semantic searches in one request.
+
+    All queries are embedded together and searched concurrently, and their
+    hits are hydrated with a single fetch. Each query may set ``ranking`` and
+    ``mmr_lambda`` as on the single search. Results are returned in request
+    order.
+    """
+    try:
+        results = await vector_search_service.search_skills_batch(request.queries)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Batch search failed: {str(e)}") from e
+
+    return [
+        BatchSearchResult(query=query.query, results=query_results)
+        for query, query_results in zip(request.queries, results, strict=True)
+    ]
+
+
 @router.get("/similar/{skill_id}", response_model=list[SkillSearchResult])
 async def find_similar_skills(
     skill_id: str,
@@ -92,3 +168,39 @@ async def reindex_all_skills():
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Reindexing failed: {str(e)}")
+
+
+@router.post("/similar/rebuild")
+async def rebuild_similarity_graph():
+    """
+    Recompute the materialized similar-skills lists of all skills.
+
+    This is a heavy operation; it also runs periodically in the background.
+    """
+    try:
+        count = await similarity_graph_service.rebuild_all()
+        return {
+            "status": "success",
+            "message": f"Rebuilt neighbors of {count} skills",
+            "rebuilt_count": count,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Rebuild failed: {str(e)}") from e
+
+
+@router.get("/metrics")
+async def get_search_metrics():
+    """
+    Get vector search runtime metrics.
+
+    Includes embedding cache hit rates, request coalescing counters,
+    provider rate limiter counters, learned search overfetch factors and
+    similarity graph counters.
+    """
+    return {
+        "search": vector_search_service.search_metrics(),
+        "similarity_graph": similarity_graph_service.stats(),
+        "embedding_cache": embedding_service.cache_stats(),
+        "embedding_batcher": embedding_service.batcher_stats(),
+        "rate_limiters": rate_limiter_stats(),
+    }
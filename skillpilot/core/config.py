@@ -21,6 +21,30 @@ class Settings(BaseSettings):
     seekdb_index_type: str = Field(default="hnsw", description="Vector index type")
     seekdb_hnsw_m: int = Field(default=16, description="HNSW M parameter")
     seekdb_hnsw_ef_construction: int = Field(default=200, description="HNSW ef_construction")
+    seekdb_get_many_chunk_size: int = Field(
+        default=500, description="Max primary keys per multi-get query"
+    )
+    seekdb_bulk_batch_size: int = Field(
+        default=500, description="Rows per round-trip in bulk writes"
+    )
+    seekdb_scan_chunk_size: int = Field(
+        default=1000, description="Rows per query when streaming a whole table"
+    )
+    seekdb_count_cache_ttl_seconds: float = Field(
+        default=5.0, description="How long cached row counts are reused"
+    )
+    seekdb_count_cache_size: int = Field(default=1024, description="Max cached row counts")
+    seekdb_pool_min_size: int = Field(default=1, description="Connections opened at startup")
+    seekdb_pool_max_size: int = Field(default=10, description="Max open connections")
+    seekdb_pool_acquire_timeout_seconds: float = Field(
+        default=10.0, description="Max wait for a free connection"
+    )
+    seekdb_pool_idle_timeout_seconds: float = Field(
+        default=300.0, description="Close surplus connections idle this long"
+    )
+    seekdb_pool_health_check_interval_seconds: float = Field(
+        default=30.0, description="Check connections idle this long before reuse"
+    )
 
     # JWT
     jwt_secret_key: str = Field(
@@ -46,6 +70,151 @@ class Settings(BaseSettings):
     embedding_provider: str = Field(default="mock", description="Embedding provider (openai, local, mock)")
     llm_provider: str = Field(default="mock", description="LLM provider (openai, anthropic, mock)")
 
+    # Provider Rate Limits (0 disables the limit)
+    openai_requests_per_minute: int = Field(default=3000, description="OpenAI requests per minute")
+    openai_tokens_per_minute: int = Field(default=1000000, description="OpenAI tokens per minute")
+    anthropic_requests_per_minute: int = Field(
+        default=50, description="Anthropic requests per minute"
+    )
+    anthropic_tokens_per_minute: int = Field(
+        default=50000, description="Anthropic tokens per minute"
+    )
+
+    # Local Embedding Executor
+    local_embedding_workers: int = Field(default=1, description="Local embedding worker count")
+    local_embedding_use_processes: bool = Field(
+        default=False, description="Run local embeddings in a process pool instead of threads"
+    )
+    local_embedding_queue_size: int = Field(
+        default=256, description="Max pending local embedding requests"
+    )
+    local_embedding_max_batch: int = Field(
+        default=64, description="Max texts merged into one local encode call"
+    )
+
+    # Embedding Request Coalescing
+    embedding_coalesce_enabled: bool = Field(
+        default=True, description="Merge concurrent single-text embedding requests"
+    )
+    embedding_coalesce_window_ms: float = Field(
+        default=5.0, description="Max time to collect requests before dispatching a batch"
+    )
+    embedding_coalesce_max_batch: int = Field(
+        default=64, description="Max distinct texts per coalesced batch"
+    )
+
+    # Embedding Batching
+    embedding_batch_concurrency: int = Field(
+        default=4, description="Max concurrent provider requests per embedding batch"
+    )
+
+    # Embedding Cache
+    embedding_cache_enabled: bool = Field(default=True, description="Cache generated embeddings")
+    embedding_cache_memory_size: int = Field(
+        default=10000, description="Max embeddings kept in the in-memory LRU"
+    )
+    embedding_cache_path: str | None = Field(
+        default=None, description="SQLite file for the on-disk embedding cache (disabled if unset)"
+    )
+    embedding_cache_max_disk_entries: int = Field(
+        default=500000, description="Max embeddings kept in the on-disk cache"
+    )
+
+    # Vector search backend
+    vector_backend: str = Field(
+        default="seekdb", description="Primary vector search backend: seekdb, local"
+    )
+    vector_local_index_enabled: bool = Field(
+        default=True, description="Keep an in-process vector index as SeekDB fallback"
+    )
+    vector_local_index_load_batch: int = Field(
+        default=1000, description="Rows fetched per query when loading the local index"
+    )
+
+    # Materialized similar-skills graph
+    similarity_graph_enabled: bool = Field(
+        default=True, description="Serve similar skills from the skill_neighbors table"
+    )
+    similarity_graph_k: int = Field(default=20, description="Neighbors stored per skill")
+    similarity_graph_rebuild_interval_seconds: int = Field(
+        default=86400, description="Seconds between full graph rebuilds (0 disables)"
+    )
+    similarity_graph_rebuild_concurrency: int = Field(
+        default=8, description="Concurrent neighbor queries during a full rebuild"
+    )
+
+    # Semantic search candidate fetching
+    search_overfetch_default: float = Field(
+        default=2.0, description="Initial candidates fetched per requested result"
+    )
+    search_overfetch_max_window: int = Field(
+        default=1000, description="Max candidates fetched by one semantic search"
+    )
+    search_overfetch_smoothing: float = Field(
+        default=0.2, description="EMA weight of the latest query when learning overfetch"
+    )
+    search_hybrid_fusion: str = Field(
+        default="rrf", description="Hybrid search fusion: rrf (reciprocal rank) or weighted"
+    )
+    search_hybrid_rrf_k: int = Field(default=60, description="Rank smoothing constant for RRF")
+    search_hybrid_semantic_weight: float = Field(
+        default=1.0, description="Weight of the semantic ranking in hybrid fusion"
+    )
+    search_hybrid_keyword_weight: float = Field(
+        default=1.0, description="Weight of the keyword ranking in hybrid fusion"
+    )
+    search_hybrid_candidate_factor: int = Field(
+        default=3, description="Candidates fetched from each side per hybrid result"
+    )
+    search_mmr_candidate_factor: int = Field(
+        default=4, description="Candidates fetched per result when MMR re-ranking is requested"
+    )
+    search_ranking: str = Field(
+        default="similarity",
+        description="Default semantic ranking: similarity or blended (similarity + quality)",
+    )
+    search_ranking_candidate_factor: int = Field(
+        default=3, description="Candidates fetched per result for blended ranking"
+    )
+    search_ranking_similarity_weight: float = Field(
+        default=1.0, description="Weight of cosine similarity in blended ranking"
+    )
+    search_ranking_popularity_weight: float = Field(
+        default=0.1, description="Weight of log-scaled usage count in blended ranking"
+    )
+    search_ranking_rating_weight: float = Field(
+        default=0.1, description="Weight of rating in blended ranking"
+    )
+    search_ranking_recency_weight: float = Field(
+        default=0.05, description="Weight of recency (updated_at) in blended ranking"
+    )
+    search_ranking_usage_saturation: int = Field(
+        default=10000, description="Usage count at which the popularity signal maxes out"
+    )
+    search_ranking_recency_half_life_days: float = Field(
+        default=90.0, description="Age in days at which the recency signal halves"
+    )
+    search_result_cache_enabled: bool = Field(
+        default=True, description="Cache search results until the catalog changes"
+    )
+    search_result_cache_size: int = Field(default=5000, description="Max cached searches")
+    search_result_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Max age of a cached search (bounds staleness from other processes)",
+    )
+    search_batch_concurrency: int = Field(
+        default=8, description="Concurrent vector queries per batch search request"
+    )
+    search_cursor_max_candidates: int = Field(
+        default=200, description="Ranked candidates cached for a paginated search"
+    )
+    search_cursor_ttl_seconds: int = Field(
+        default=600, description="Seconds a search cursor stays valid"
+    )
+    search_cursor_max_sessions: int = Field(
+        default=1000, description="Max paginated searches cached at once"
+    )
+
     # Platform APIs
     coze_api_base: str = Field(default="https://api.coze.com", description="Coze API Base URL")
     dify_api_key: str | None = Field(default=None, description="Dify API Key")
@@ -163,23 +163,21 @@ class BaseImporter(ABC):
             summary.total = len(raw_skills)
             logger.info(f"Fetched {summary.total} skills from {self.display_name}")
 
-            # Import each skill
+            # Normalize skill data
+            to_create: list[tuple[dict, SkillCreate]] = []
             for raw_data in raw_skills:
                 try:
-                    # Normalize skill data
-                    skill_create = self.normalize_skill(raw_data)
-
-                    # Create skill using SkillService
-                    skill = await skill_service.create_skill(skill_create, developer_id)
-
-                    summary.success += 1
-                    logger.debug(f"Imported skill: {skill.skill_name}", skill_id=skill.skill_id)
-
+                    to_create.append((raw_data, self.normalize_skill(raw_data)))
                 except Exception as e:
-                    summary.failed += 1
-                    error_msg = f"Failed to import {raw_data.get('name', 'unknown')}: {str(e)}"
-                    summary.errors.append(error_msg)
-                    logger.error(error_msg)
+                    self._record_failure(summary, raw_data, e)
+
+            # Create skills in bulk using SkillService
+            created, failed = await skill_service.create_skills(
+                [skill_create for _, skill_create in to_create], developer_id
+            )
+            summary.success += len(created)
+            for position, error in failed.items():
+                self._record_failure(summary, to_create[position][0], error)
 
             self._status = ImporterStatus.COMPLETED
             logger.info(
@@ -197,6 +195,15 @@ class BaseImporter(ABC):
 
         return summary
 
+    def _record_failure(
+        self, summary: ImportSummary, raw_data: dict, error: Exception | str
+    ) -> None:
+        """Count a skill that failed to import"""
+        summary.failed += 1
+        error_msg = f"Failed to import {raw_data.get('name', 'unknown')}: {str(error)}"
+        summary.errors.append(error_msg)
+        logger.error(error_msg)
+
     def __repr__(self) -> str:
         return f"{self.display_name}Importer(status={self.status.value})"
 
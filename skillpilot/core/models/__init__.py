@@ -31,9 +31,13 @@ from .orchestration import (
     SkillChainStep,
 )
 from .skill import (
+    BatchSearchRequest,
+    BatchSearchResult,
+    ScoreBreakdown,
     Skill,
     SkillBase,
     SkillCreate,
+    SkillSearchQuery,
     SkillSearchResult,
     SkillUpdate,
 )
@@ -67,6 +71,10 @@ __all__ = [
     "SkillUpdate",
     "Skill",
     "SkillSearchResult",
+    "ScoreBreakdown",
+    "SkillSearchQuery",
+    "BatchSearchRequest",
+    "BatchSearchResult",
     # Orchestration models
     "SkillChainStep",
     "OrchestrationCreate",
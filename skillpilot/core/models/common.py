@@ -60,6 +60,8 @@ class Pagination(BaseModel):
     limit: int = 20
     total: int = 0
     total_pages: int = 0
+    # Opaque cursor for the next page (None on the last page)
+    next_cursor: str | None = None
 
 
 class ErrorDetail(BaseModel):
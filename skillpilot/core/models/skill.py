@@ -47,7 +47,46 @@ class Skill(SkillBase):
     model_config = {"from_attributes": True}
 
 
+class ScoreBreakdown(BaseModel):
+    """Signals behind a blended search score, each scaled to [0, 1]"""
+
+    similarity: float
+    popularity: float
+    rating: float
+    recency: float
+    score: float
+
+
 class SkillSearchResult(Skill):
     """Skill search result"""
 
     similarity: float | None = None
+    score: float | None = None
+    score_breakdown: ScoreBreakdown | None = None
+
+
+class SkillSearchQuery(BaseModel):
+    """One query of a batch search"""
+
+    query: str = Field(..., min_length=1)
+    platforms: list[PlatformType] | None = None
+    top_k: int = Field(default=10, ge=1, le=100)
+    threshold: float = Field(default=0.5, ge=0.0, le=1.0)
+    pricing_types: list[str] | None = None
+    min_rating: float | None = Field(default=None, ge=0.0)
+    tags: list[str] | None = None
+    mmr_lambda: float | None = Field(default=None, ge=0.0, le=1.0)
+    ranking: str | None = Field(default=None, pattern="^(similarity|blended)$")
+
+
+class BatchSearchRequest(BaseModel):
+    """Batch semantic search request"""
+
+    queries: list[SkillSearchQuery] = Field(..., min_length=1, max_length=100)
+
+
+class BatchSearchResult(BaseModel):
+    """Results of one query in a batch search"""
+
+    query: str
+    results: list[SkillSearchResult] = []
@@ -6,6 +6,8 @@ from typing import Any
 from skillpilot.core.config import settings
 from skillpilot.core.models.common import PlatformType
 from skillpilot.core.models.orchestration import SkillChainStep
+from skillpilot.core.services.embedding_planner import estimate_tokens
+from skillpilot.core.services.rate_limiter import call_with_rate_limit, get_rate_limiter
 from skillpilot.core.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -41,7 +43,8 @@ class AIService:
                     if not settings.openai_api_key:
                         raise ValueError("OPENAI_API_KEY not configured")
 
-                    self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+                    # Retries are handled by call_with_rate_limit
+                    self._client = AsyncOpenAI(api_key=settings.openai_api_key, max_retries=0)
                     logger.info("OpenAI LLM client initialized")
                 except ImportError:
                     logger.error("OpenAI SDK not installed. Run: pip install openai")
@@ -57,7 +60,7 @@ class AIService:
                     if not settings.anthropic_api_key:
                         raise ValueError("ANTHROPIC_API_KEY not configured")
 
-                    self._client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+                    self._client = AsyncAnthropic(api_key=settings.anthropic_api_key, max_retries=0)
                     logger.info("Anthropic LLM client initialized")
                 except ImportError:
                     logger.error("Anthropic SDK not installed. Run: pip install anthropic")
@@ -190,7 +193,8 @@ class AIService:
 
     async def _analyze_with_openai(self, client, task_description: str) -> dict[str, Any]:
         """Analyze task using OpenAI"""
-        response = await client.chat.completions.create(
+        response = await self._create_chat_completion(
+            client,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -218,7 +222,8 @@ class AIService:
 
     async def _analyze_with_anthropic(self, client, task_description: str) -> dict[str, Any]:
         """Analyze task using Anthropic"""
-        response = await client.messages.create(
+        response = await self._create_message(
+            client,
             model="claude-3-haiku-20240307",
             max_tokens=1024,
             messages=[
@@ -247,7 +252,8 @@ class AIService:
             ]
         )
 
-        response = await client.chat.completions.create(
+        response = await self._create_chat_completion(
+            client,
             model="gpt-4o-mini",
             messages=[
                 {
@@ -288,7 +294,8 @@ class AIService:
             ]
         )
 
-        response = await client.messages.create(
+        response = await self._create_message(
+            client,
             model="claude-3-haiku-20240307",
             max_tokens=2048,
             messages=[
@@ -308,6 +315,35 @@ class AIService:
         steps = result if isinstance(result, list) else result.get("steps", [])
         return self._parse_skill_chain(steps)
 
+    async def _create_chat_completion(self, client, **kwargs):
+        """Create an OpenAI chat completion through the shared rate limiter"""
+
+        async def request():
+            raw_response = await client.chat.completions.with_raw_response.create(**kwargs)
+            get_rate_limiter("openai").update_from_headers(raw_response.headers)
+            return raw_response.parse()
+
+        return await call_with_rate_limit(
+            "openai", request, tokens=self._estimate_request_tokens(kwargs)
+        )
+
+    async def _create_message(self, client, **kwargs):
+        """Create an Anthropic message through the shared rate limiter"""
+
+        async def request():
+            raw_response = await client.messages.with_raw_response.create(**kwargs)
+            get_rate_limiter("anthropic").update_from_headers(raw_response.headers)
+            return raw_response.parse()
+
+        return await call_with_rate_limit(
+            "anthropic", request, tokens=self._estimate_request_tokens(kwargs)
+        )
+
+    def _estimate_request_tokens(self, request: dict) -> int:
+        """Estimate prompt plus completion tokens counted against the provider's TPM"""
+        prompt = " ".join(str(m.get("content", "")) for m in request.get("messages", []))
+        return estimate_tokens(prompt) + request.get("max_tokens", 0)
+
     def _parse_skill_chain(self, steps_data: list) -> list[SkillChainStep]:
         """Parse raw step data into SkillChainStep objects"""
         chain = []
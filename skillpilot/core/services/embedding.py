@@ -1,14 +1,35 @@
 """Embedding Service for generating vector embeddings"""
 
+import asyncio
+import hashlib
+from dataclasses import replace
 from typing import Any
 
-import httpx
+import numpy as np
 
 from skillpilot.core.config import settings
+from skillpilot.core.services.embedding_batcher import EmbeddingBatcher
+from skillpilot.core.services.embedding_cache import EmbeddingCache
+from skillpilot.core.services.embedding_planner import (
+    PROVIDER_LIMITS,
+    BatchLimits,
+    EmbeddingBatch,
+    estimate_tokens,
+    plan_embedding_batches,
+)
+from skillpilot.core.services.local_embedding import LocalEmbeddingExecutor
+from skillpilot.core.services.rate_limiter import call_with_rate_limit, get_rate_limiter
 from skillpilot.core.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Model used by each provider (part of the embedding cache key)
+PROVIDER_MODELS = {
+    "openai": "text-embedding-3-small",
+    "local": "all-MiniLM-L6-v2",
+    "mock": "mock-sha256",
+}
+
 
 class EmbeddingService:
     """
@@ -25,6 +46,19 @@ class EmbeddingService:
         self.dimension = settings.seekdb_vector_dimension
         self._client = None
         self._http_client = None
+        self.cache: EmbeddingCache | None = None
+        if settings.embedding_cache_enabled:
+            self.cache = EmbeddingCache(
+                memory_size=settings.embedding_cache_memory_size,
+                disk_path=settings.embedding_cache_path,
+                disk_max_entries=settings.embedding_cache_max_disk_entries,
+            )
+        self._batcher: EmbeddingBatcher | None = None
+
+    @property
+    def model(self) -> str:
+        """Model name used by the current provider"""
+        return PROVIDER_MODELS[self.provider]
 
     def _get_client(self) -> Any:
         """Get or create embedding client based on provider"""
@@ -36,7 +70,8 @@ class EmbeddingService:
                     if not settings.openai_api_key:
                         raise ValueError("OPENAI_API_KEY not configured")
 
-                    self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+                    # Retries are handled by call_with_rate_limit
+                    self._client = AsyncOpenAI(api_key=settings.openai_api_key, max_retries=0)
                     logger.info("OpenAI embedding client initialized")
                 except ImportError:
                     logger.error("OpenAI SDK not installed. Run: pip install openai")
@@ -46,17 +81,15 @@ class EmbeddingService:
                     raise
 
             elif self.provider == "local":
-                try:
-                    from sentence_transformers import SentenceTransformer
-
-                    self._client = SentenceTransformer("all-MiniLM-L6-v2")
-                    logger.info("Local embedding model loaded")
-                except ImportError:
-                    logger.error("sentence-transformers not installed. Run: pip install sentence-transformers")
-                    raise
-                except Exception as e:
-                    logger.error("Failed to load local embedding model", error=str(e))
-                    raise
+                # Model is loaded lazily by the executor, off the event loop
+                self._client = LocalEmbeddingExecutor(
+                    PROVIDER_MODELS["local"],
+                    workers=settings.local_embedding_workers,
+                    use_processes=settings.local_embedding_use_processes,
+                    queue_size=settings.local_embedding_queue_size,
+                    max_batch_size=settings.local_embedding_max_batch,
+                )
+                logger.info("Local embedding executor initialized")
 
             # Mock provider doesn't need a client - generates dummy embeddings
             elif self.provider == "mock":
@@ -68,6 +101,9 @@ class EmbeddingService:
         """
         Generate embedding vector for text.
 
+        Concurrent calls are coalesced into batch requests (see EmbeddingBatcher)
+        unless the provider is mock or coalescing is disabled.
+
         Args:
             text: Input text to embed
             max_retries: Maximum retry attempts for API failures
@@ -78,113 +114,137 @@ class EmbeddingService:
         Raises:
             ValueError: If embedding fails after all retries
         """
-        client = self._get_client()
+        if self.cache is not None:
+            key = self._cache_key(text)
+            cached = (await self.cache.aget_many([key])).get(key)
+            if cached is not None:
+                return cached
 
-        # Mock provider - return deterministic dummy embedding
-        if self.provider == "mock":
-            import hashlib
-            # Use hash for deterministic "embeddings" based on input text
-            hash_bytes = hashlib.sha256(text.encode()).digest()
-            # Expand to desired dimension
-            import random
-            random.seed(int.from_bytes(hash_bytes[:4], 'big'))
-            embedding = [random.uniform(-1, 1) for _ in range(self.dimension)]
-            logger.debug("Mock embedding generated", dimension=len(embedding))
-            return embedding
-
-        for attempt in range(max_retries):
-            try:
-                if self.provider == "openai":
-                    response = await client.embeddings.create(
-                        model="text-embedding-3-small",
-                        input=text,
-                        dimensions=self.dimension,
-                    )
-                    embedding = response.data[0].embedding
-                    logger.debug("OpenAI embedding generated", dimension=len(embedding))
-                    return embedding
-
-                elif self.provider == "local":
-                    # sentence-transformers is synchronous
-                    embedding = client.encode(text, normalize_embeddings=True).tolist()
-                    logger.debug("Local embedding generated", dimension=len(embedding))
-                    return embedding
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 429 and attempt < max_retries - 1:
-                    # Rate limit - wait and retry
-                    import asyncio
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.warning("Rate limited, retrying in", seconds=wait_time)
-                    await asyncio.sleep(wait_time)
-                    continue
-                logger.error("Embedding API HTTP error", status=e.response.status_code, error=str(e))
-                raise
-            except Exception as e:
-                logger.error("Embedding generation failed", provider=self.provider, attempt=attempt + 1, error=str(e))
-                if attempt == max_retries - 1:
-                    raise
-                import asyncio
-                await asyncio.sleep(2 ** attempt)
+        if self._should_coalesce():
+            return await self._get_batcher().submit(text, max_retries=max_retries)
 
-        raise ValueError("Embedding generation failed after all retries")
+        embeddings = await self._embed_and_cache([text], max_retries=max_retries)
+        return embeddings[0]
 
     async def generate_embeddings_batch(
-        self, texts: list[str], batch_size: int = 32
+        self, texts: list[str], batch_size: int | None = None
     ) -> list[list[float]]:
         """
         Generate embeddings for multiple texts in batches.
 
+        Texts are packed into provider requests by estimated token count and
+        the requests run concurrently (see ``embedding_batch_concurrency``).
+
         Args:
             texts: List of texts to embed
-            batch_size: Batch size for processing
+            batch_size: Optional cap on texts per request (defaults to the provider limit)
 
         Returns:
-            List of embedding vectors
+            List of embedding vectors, in input order
         """
-        embeddings = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            batch_embeddings = await self._embed_batch(batch)
-            embeddings.extend(batch_embeddings)
-            logger.debug("Embedding batch processed", batch=i // batch_size + 1)
+        embeddings = await self._embed_batch(texts, max_items=batch_size)
+        logger.debug("Embedding batch processed", count=len(texts))
+        return embeddings
 
+    async def _embed_batch(
+        self, texts: list[str], max_items: int | None = None
+    ) -> list[list[float]]:
+        """Embed a batch of texts, calling the provider only for cache misses"""
+        if self.cache is None:
+            return await self._embed_and_cache(texts, max_items=max_items)
+
+        keys = [self._cache_key(text) for text in texts]
+        found = await self.cache.aget_many(keys)
+
+        # Deduplicate misses so repeated texts are embedded once
+        missing = {key: text for key, text in zip(keys, texts, strict=True) if key not in found}
+        if missing:
+            embeddings = await self._embed_and_cache(list(missing.values()), max_items=max_items)
+            found.update(zip(missing, embeddings, strict=True))
+
+        return [found[key] for key in keys]
+
+    async def _embed_and_cache(
+        self, texts: list[str], max_retries: int = 3, max_items: int | None = None
+    ) -> list[list[float]]:
+        """Embed texts known to be cache misses and store the results"""
+        batches = plan_embedding_batches(texts, self._batch_limits(max_items))
+        embeddings: list[list[float] | None] = [None] * len(texts)
+        semaphore = asyncio.Semaphore(settings.embedding_batch_concurrency)
+
+        async def run(batch: EmbeddingBatch) -> None:
+            async with semaphore:
+                results = await self._embed_batch_uncached(batch.texts, max_retries=max_retries)
+            for index, embedding in zip(batch.indices, results, strict=True):
+                embeddings[index] = embedding
+
+        await asyncio.gather(*(run(batch) for batch in batches))
+        if len(batches) > 1:
+            logger.debug("Embedding requests dispatched", texts=len(texts), requests=len(batches))
+
+        if self.cache is not None:
+            await self.cache.aput_many(
+                {self._cache_key(text): emb for text, emb in zip(texts, embeddings, strict=True)}
+            )
         return embeddings
 
-    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Embed a batch of texts"""
+    async def _embed_batch_uncached(
+        self, texts: list[str], max_retries: int = 3
+    ) -> list[list[float]]:
+        """Embed a batch of texts by calling the provider through its rate limiter"""
+        tokens = sum(estimate_tokens(text) for text in texts)
+        return await call_with_rate_limit(
+            self.provider,
+            lambda: self._request_embeddings(texts),
+            tokens=tokens,
+            max_retries=max_retries,
+        )
+
+    async def _request_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Issue a single provider request for a batch of texts"""
         client = self._get_client()
 
-        try:
-            if self.provider == "mock":
-                # Generate mock embeddings for batch
-                import hashlib
-                import random
-                embeddings = []
-                for text in texts:
-                    hash_bytes = hashlib.sha256(text.encode()).digest()
-                    random.seed(int.from_bytes(hash_bytes[:4], 'big'))
-                    embedding = [random.uniform(-1, 1) for _ in range(self.dimension)]
-                    embeddings.append(embedding)
-                return embeddings
-
-            elif self.provider == "openai":
-                response = await client.embeddings.create(
-                    model="text-embedding-3-small",
-                    input=texts,
-                    dimensions=self.dimension,
-                )
-                # Sort by index to maintain order
-                sorted_data = sorted(response.data, key=lambda x: x.index)
-                return [item.embedding for item in sorted_data]
-
-            elif self.provider == "local":
-                embeddings = client.encode(texts, normalize_embeddings=True, batch_size=len(texts))
-                return embeddings.tolist()
+        if self.provider == "mock":
+            embeddings = self._mock_embeddings(texts)
+            logger.debug("Mock embeddings generated", count=len(texts))
+            return embeddings.tolist()
+
+        elif self.provider == "openai":
+            raw_response = await client.embeddings.with_raw_response.create(
+                model=self.model,
+                input=texts,
+                dimensions=self.dimension,
+            )
+            get_rate_limiter("openai").update_from_headers(raw_response.headers)
+            response = raw_response.parse()
+            # Sort by index to maintain order
+            sorted_data = sorted(response.data, key=lambda x: x.index)
+            logger.debug("OpenAI embeddings generated", count=len(sorted_data))
+            return [item.embedding for item in sorted_data]
+
+        elif self.provider == "local":
+            embeddings = await client.encode(texts)
+            logger.debug("Local embeddings generated", count=len(texts))
+            return embeddings
+
+        raise ValueError(f"Unknown provider: {self.provider}")
+
+    def _mock_embeddings(self, texts: list[str]) -> np.ndarray:
+        """
+        Generate deterministic dummy embeddings as one float32 matrix.
 
-        except Exception as e:
-            logger.error("Batch embedding failed", error=str(e))
-            raise
+        Each row comes from its own PCG64 generator seeded by the text's SHA-256,
+        so results depend only on the text and no global RNG state is touched.
+        """
+        matrix = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+            rng = np.random.Generator(np.random.PCG64(seed))
+            rng.random(dtype=np.float32, out=matrix[row])
+        # Scale [0, 1) to [-1, 1)
+        matrix *= 2.0
+        matrix -= 1.0
+        return matrix
 
     def set_provider(self, provider: str) -> None:
         """
@@ -196,15 +256,61 @@ class EmbeddingService:
         if provider not in ["openai", "local", "mock"]:
             raise ValueError(f"Unknown provider: {provider}")
 
+        self._shutdown_local_executor()
         self.provider = provider
         self._client = None  # Reset client to reinitialize with new provider
+        self._batcher = None
         logger.info("Embedding provider set", provider=provider)
 
+    def cache_stats(self) -> dict:
+        """Get embedding cache statistics (empty if caching is disabled)"""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def batcher_stats(self) -> dict:
+        """Get request coalescing statistics (empty if no batch was coalesced yet)"""
+        return self._batcher.stats() if self._batcher is not None else {}
+
+    def _should_coalesce(self) -> bool:
+        """Whether single-text requests go through the micro-batcher"""
+        # Mock embeddings are computed in-process, so there is no round-trip to save
+        return settings.embedding_coalesce_enabled and self.provider != "mock"
+
+    def _get_batcher(self) -> EmbeddingBatcher:
+        """Get or create the micro-batcher for the current provider"""
+        if self._batcher is None:
+            self._batcher = EmbeddingBatcher(
+                self._embed_and_cache,
+                max_wait_ms=settings.embedding_coalesce_window_ms,
+                max_batch_size=settings.embedding_coalesce_max_batch,
+            )
+        return self._batcher
+
+    def _batch_limits(self, max_items: int | None = None) -> BatchLimits:
+        """Per-request limits for the current provider"""
+        limits = PROVIDER_LIMITS[self.provider]
+        if self.provider == "local":
+            limits = replace(limits, max_items=settings.local_embedding_max_batch)
+        if max_items:
+            limits = replace(limits, max_items=min(max_items, limits.max_items))
+        return limits
+
+    def _shutdown_local_executor(self) -> None:
+        """Stop the local model executor if one is running"""
+        if isinstance(self._client, LocalEmbeddingExecutor):
+            self._client.shutdown()
+
+    def _cache_key(self, text: str) -> str:
+        """Build the cache key for a text under the current provider settings"""
+        return EmbeddingCache.make_key(self.provider, self.model, self.dimension, text)
+
     async def close(self) -> None:
         """Close HTTP client connections"""
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
+        self._shutdown_local_executor()
+        if self.cache is not None:
+            self.cache.close()
 
 
 embedding_service = EmbeddingService()
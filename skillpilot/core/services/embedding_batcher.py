@@ -0,0 +1,146 @@
+"""Micro-batcher for coalescing concurrent single-text embedding requests"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from skillpilot.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent embedding requests into batch calls.
+
+    Requests are collected for up to ``max_wait_ms`` or until ``max_batch_size``
+    distinct texts are pending, then embedded with a single batch call whose
+    results are fanned back to every waiter. Identical texts in flight share
+    one slot in the batch.
+
+    ``embed_batch`` is called as ``embed_batch(texts, max_retries=n)`` and is
+    expected to retry failed requests up to ``n`` attempts; a batch is sent
+    with the highest ``max_retries`` any of its waiters asked for.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[..., Awaitable[list[list[float]]]],
+        max_wait_ms: float = 5.0,
+        max_batch_size: int = 64,
+    ):
+        self._embed_batch = embed_batch
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
+
+        self._pending: dict[str, asyncio.Future] = {}
+        self._pending_retries = 1
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self._requests = 0
+        self._deduplicated = 0
+        self._batches = 0
+
+    async def submit(self, text: str, max_retries: int = 3) -> list[float]:
+        """
+        Queue a text for embedding and wait for its vector.
+
+        Args:
+            text: Input text to embed
+            max_retries: Maximum attempts for the batch request carrying the text
+
+        Returns:
+            Embedding vector for the text
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pending state from another event loop can never complete here
+            self._reset(loop)
+
+        self._requests += 1
+        self._pending_retries = max(self._pending_retries, max_retries)
+        future = self._pending.get(text)
+        if future is None:
+            future = loop.create_future()
+            # Waiters await a shield, so a failure nobody is left to see
+            # would otherwise be logged as never retrieved
+            future.add_done_callback(_consume_exception)
+            self._pending[text] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        else:
+            self._deduplicated += 1
+
+        # Shield so one cancelled waiter doesn't cancel the shared result
+        embedding = await asyncio.shield(future)
+        return list(embedding)
+
+    def stats(self) -> dict:
+        """
+        Get batching statistics.
+
+        Returns:
+            Request, deduplication and batch counters
+        """
+        return {
+            "requests": self._requests,
+            "deduplicated": self._deduplicated,
+            "batches": self._batches,
+            "avg_batch_size": (
+                (self._requests - self._deduplicated) / self._batches if self._batches else 0.0
+            ),
+        }
+
+    def _flush(self) -> None:
+        """Dispatch all pending texts as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        max_retries, self._pending_retries = self._pending_retries, 1
+        if not batch:
+            return
+
+        self._batches += 1
+        task = self._loop.create_task(self._run(batch, max_retries))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future], max_retries: int) -> None:
+        """Embed a batch and resolve its waiters"""
+        error: Exception | None = None
+        try:
+            embeddings = await self._embed_batch(list(batch), max_retries=max_retries)
+            for future, embedding in zip(batch.values(), embeddings, strict=True):
+                if not future.done():
+                    future.set_result(embedding)
+            logger.debug("Coalesced embedding batch processed", size=len(batch))
+        except Exception as e:
+            error = e
+            logger.error("Coalesced embedding batch failed", size=len(batch), error=str(e))
+        finally:
+            # Never leave a waiter hanging: failed, short or cancelled batches
+            # fail every future that didn't get a result
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error or RuntimeError("Embedding batch was cancelled"))
+
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind to a new event loop, dropping state from the previous one"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = None
+        self._pending = {}
+        self._pending_retries = 1
+        self._tasks = set()
+        self._loop = loop
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    """Mark a shared future's exception as retrieved"""
+    if not future.cancelled():
+        future.exception()
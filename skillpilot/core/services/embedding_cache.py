@@ -0,0 +1,303 @@
+"""Embedding Cache for reusing previously generated vectors"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from skillpilot.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Two-tier, content-addressed cache for embedding vectors.
+
+    Tiers:
+    - Memory: LRU bounded by entry count
+    - Disk: SQLite file bounded by entry count, evicting least recently used rows
+
+    Keys combine provider, model, dimension and a SHA-256 of the text, so changing
+    any of them never serves a vector produced under different settings.
+
+    The disk row count is kept in memory, and rows are evicted in batches once
+    it crosses the bound. Async callers should use ``aget_many``/``aput_many``,
+    which run SQLite work on a dedicated thread instead of the event loop.
+    """
+
+    def __init__(
+        self,
+        memory_size: int = 10000,
+        disk_path: str | None = None,
+        disk_max_entries: int = 500000,
+    ):
+        self.memory_size = memory_size
+        self.disk_path = disk_path
+        self.disk_max_entries = disk_max_entries
+
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes access to the SQLite connection
+        self._disk_lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._disk_entries = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        if disk_path:
+            self._open_disk(disk_path)
+
+    @staticmethod
+    def make_key(provider: str, model: str, dimension: int, text: str) -> str:
+        """
+        Build the cache key for a text.
+
+        Args:
+            provider: Embedding provider name
+            model: Embedding model name
+            dimension: Vector dimension
+            text: Input text
+
+        Returns:
+            Content-addressed cache key
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{provider}:{model}:{dimension}:{digest}"
+
+    def get(self, key: str) -> list[float] | None:
+        """Get a cached embedding, or None on miss"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """
+        Look up several keys at once.
+
+        Disk hits are promoted to the memory tier.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Mapping of found keys to embeddings (misses are omitted)
+        """
+        found, disk_lookup = self._get_memory(keys)
+        if disk_lookup:
+            found.update(self._get_disk(disk_lookup))
+        return found
+
+    async def aget_many(self, keys: list[str]) -> dict[str, list[float]]:
+        """Like ``get_many``, reading the disk tier off the event loop"""
+        found, disk_lookup = self._get_memory(keys)
+        if disk_lookup:
+            found.update(await self._run_disk(self._get_disk, disk_lookup))
+        return found
+
+    def put(self, key: str, embedding: list[float]) -> None:
+        """Store an embedding in both tiers"""
+        self.put_many({key: embedding})
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        """
+        Store several embeddings in both tiers.
+
+        Args:
+            items: Mapping of cache keys to embeddings
+        """
+        if not items:
+            return
+        self._put_memory(items)
+        if self._db is not None:
+            self._write_disk(items)
+
+    async def aput_many(self, items: dict[str, list[float]]) -> None:
+        """Like ``put_many``, writing the disk tier off the event loop"""
+        if not items:
+            return
+        self._put_memory(items)
+        if self._db is not None:
+            await self._run_disk(self._write_disk, items)
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset statistics"""
+        with self._disk_lock, self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM embeddings")
+                self._db.commit()
+                self._disk_entries = 0
+            self._memory_hits = self._disk_hits = self._misses = self._evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Hit/miss counters, hit rate and tier sizes
+        """
+        with self._lock:
+            lookups = self._memory_hits + self._disk_hits + self._misses
+            hits = self._memory_hits + self._disk_hits
+            return {
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_entries": self._disk_entries if self._db is not None else 0,
+                "evictions": self._evictions,
+            }
+
+    def close(self) -> None:
+        """Close the disk store"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._disk_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _get_memory(self, keys: list[str]) -> tuple[dict[str, list[float]], list[str]]:
+        """Look keys up in the memory tier, returning hits and the keys to try on disk"""
+        found: dict[str, list[float]] = {}
+        disk_lookup = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                embedding = self._memory.get(key)
+                if embedding is not None:
+                    self._memory.move_to_end(key)
+                    self._memory_hits += 1
+                    found[key] = list(embedding)
+                else:
+                    disk_lookup.append(key)
+            if self._db is None:
+                self._misses += len(disk_lookup)
+                disk_lookup = []
+        return found, disk_lookup
+
+    def _get_disk(self, keys: list[str]) -> dict[str, list[float]]:
+        """Look keys up in the disk tier, promoting hits to memory"""
+        with self._disk_lock:
+            disk_found = self._read_disk(keys) if self._db is not None else {}
+        with self._lock:
+            for key, embedding in disk_found.items():
+                self._remember(key, embedding)
+            self._disk_hits += len(disk_found)
+            self._misses += len(keys) - len(disk_found)
+        return {key: list(embedding) for key, embedding in disk_found.items()}
+
+    def _put_memory(self, items: dict[str, list[float]]) -> None:
+        with self._lock:
+            for key, embedding in items.items():
+                self._remember(key, list(embedding))
+
+    async def _run_disk(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a disk-tier operation on the cache's dedicated thread"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="embedding-cache"
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _remember(self, key: str, embedding: list[float]) -> None:
+        """Insert into the memory tier, evicting the least recently used entries"""
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+            self._evictions += 1
+
+    def _open_disk(self, disk_path: str) -> None:
+        """Open (or create) the SQLite disk store"""
+        try:
+            Path(disk_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, vector BLOB NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_accessed ON embeddings(accessed_at)"
+            )
+            self._db.commit()
+            # Counted once; kept up to date by writes and evictions
+            self._disk_entries = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            logger.info("Embedding disk cache opened", path=disk_path, entries=self._disk_entries)
+        except sqlite3.Error as e:
+            logger.warning("Embedding disk cache unavailable", path=disk_path, error=str(e))
+            self._db = None
+
+    def _read_disk(self, keys: list[str]) -> dict[str, list[float]]:
+        """Read keys from the disk tier and refresh their access time"""
+        found = {}
+        try:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("d", blob).tolist()
+
+            if found:
+                now = time.time()
+                self._db.executemany(
+                    "UPDATE embeddings SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning("Embedding disk cache read failed", error=str(e))
+        return found
+
+    def _write_disk(self, items: dict[str, list[float]]) -> None:
+        """Write entries to the disk tier and enforce its size bound"""
+        now = time.time()
+        with self._disk_lock:
+            if self._db is None:
+                return
+            try:
+                keys = list(items)
+                existing = 0
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start : start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    existing += self._db.execute(
+                        f"SELECT COUNT(*) FROM embeddings WHERE key IN ({placeholders})", chunk
+                    ).fetchone()[0]
+
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, accessed_at) VALUES (?, ?, ?)",
+                    [(key, array("d", embedding).tobytes(), now) for key, embedding in items.items()],
+                )
+                self._disk_entries += len(keys) - existing
+
+                overflow = self._disk_entries - self.disk_max_entries
+                if overflow > 0:
+                    # Evict a little extra so the next writes don't each evict
+                    evict = max(overflow, self.disk_max_entries // 100)
+                    deleted = self._db.execute(
+                        "DELETE FROM embeddings WHERE key IN "
+                        "(SELECT key FROM embeddings ORDER BY accessed_at LIMIT ?)",
+                        (evict,),
+                    ).rowcount
+                    self._disk_entries -= deleted
+                    with self._lock:
+                        self._evictions += deleted
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("Embedding disk cache write failed", error=str(e))
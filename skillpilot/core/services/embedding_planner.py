@@ -0,0 +1,143 @@
+"""Token-aware batch planning for embedding requests"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from skillpilot.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Tokenizer of OpenAI's embedding models, used for counting when tiktoken is installed
+TIKTOKEN_ENCODING = "cl100k_base"
+
+
+@dataclass(frozen=True)
+class BatchLimits:
+    """Per-request limits of an embedding provider"""
+
+    max_items: int
+    max_tokens: int | None = None
+    max_input_tokens: int | None = None
+
+
+@dataclass
+class EmbeddingBatch:
+    """A planned provider request"""
+
+    indices: list[int] = field(default_factory=list)
+    texts: list[str] = field(default_factory=list)
+    tokens: int = 0
+
+
+# Limits published by each provider (local models truncate at their max sequence length)
+PROVIDER_LIMITS = {
+    "openai": BatchLimits(max_items=2048, max_tokens=300000, max_input_tokens=8191),
+    "local": BatchLimits(max_items=64, max_input_tokens=256),
+    "mock": BatchLimits(max_items=1024),
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a text.
+
+    Counts exactly with tiktoken's ``cl100k_base`` encoding when tiktoken is
+    installed. Otherwise ASCII text is taken to average about four characters
+    per token, and every other character (CJK in particular) is counted as at
+    least one token, so non-English text is never underestimated by the
+    four-character rule.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Estimated token count (at least 1)
+    """
+    tokenizer = _tokenizer()
+    if tokenizer is not None:
+        return max(1, len(tokenizer.encode(text, disallowed_special=())))
+
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    other_chars = len(text) - ascii_chars
+    return max(1, (ascii_chars + 3) // 4 + other_chars)
+
+
+@lru_cache(maxsize=1)
+def _tokenizer():
+    """Load the tiktoken encoding once (None if tiktoken is unavailable)"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.get_encoding(TIKTOKEN_ENCODING)
+    except Exception as e:
+        # The encoding is downloaded on first use; fall back when offline
+        logger.warning("tiktoken encoding unavailable, estimating tokens", error=str(e))
+        return None
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate a text so its estimated token count fits a limit.
+
+    Truncation is deterministic: the same text and limit always yield the
+    same prefix.
+
+    Args:
+        text: Input text
+        max_tokens: Maximum estimated tokens
+
+    Returns:
+        The text, or its longest fitting prefix
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # Binary search for the longest prefix that fits
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+def plan_embedding_batches(texts: list[str], limits: BatchLimits) -> list[EmbeddingBatch]:
+    """
+    Pack texts into provider requests by estimated token count.
+
+    Texts keep their original order; oversized texts are truncated to the
+    per-input limit so a single long text never fails a whole batch.
+
+    Args:
+        texts: Texts to embed
+        limits: Provider request limits
+
+    Returns:
+        Planned batches, each carrying the original indices of its texts
+    """
+    batches: list[EmbeddingBatch] = []
+    current = EmbeddingBatch()
+
+    for index, text in enumerate(texts):
+        if limits.max_input_tokens is not None:
+            text = truncate_to_tokens(text, limits.max_input_tokens)
+        tokens = estimate_tokens(text)
+
+        if current.texts and (
+            len(current.texts) >= limits.max_items
+            or (limits.max_tokens is not None and current.tokens + tokens > limits.max_tokens)
+        ):
+            batches.append(current)
+            current = EmbeddingBatch()
+
+        current.indices.append(index)
+        current.texts.append(text)
+        current.tokens += tokens
+
+    if current.texts:
+        batches.append(current)
+    return batches
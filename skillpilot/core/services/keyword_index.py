@@ -0,0 +1,206 @@
+"""Inverted keyword index with BM25 ranking"""
+
+import heapq
+import math
+import re
+import time
+from collections import Counter
+from typing import Any
+
+from skillpilot.core.services.search_filters import matches_filters
+
+# Hiragana/Katakana, CJK ideographs and Hangul: written without word separators
+_CJK_RANGES = r"\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+# A run of CJK characters, or a run of other letters/digits
+_TOKEN = re.compile(rf"[{_CJK_RANGES}]+|[^\W_{_CJK_RANGES}]+")
+_CJK = re.compile(rf"[{_CJK_RANGES}]")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase index terms.
+
+    Latin words are kept whole; runs of CJK characters, which have no word
+    separators, are indexed as overlapping character bigrams.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Terms in order of appearance
+    """
+    terms = []
+    for token in _TOKEN.findall(text.lower()):
+        if len(token) > 1 and _CJK.match(token):
+            terms.extend(token[i : i + 2] for i in range(len(token) - 1))
+        else:
+            terms.append(token)
+    return terms
+
+
+class KeywordIndex:
+    """
+    Tokenized inverted index over skill text fields, ranked with BM25.
+
+    Term frequencies are weighted per field (a match in the skill name counts
+    more than one in the description). A query only touches the posting lists
+    of its own terms, so cost scales with posting-list sizes rather than the
+    catalog size.
+    """
+
+    FIELD_WEIGHTS = {
+        "skill_name": 3.0,
+        "tags": 2.0,
+        "capabilities": 2.0,
+        "description": 1.0,
+    }
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.loaded = False
+
+        self._postings: dict[str, dict[str, float]] = {}
+        self._doc_terms: dict[str, dict[str, float]] = {}
+        self._doc_lengths: dict[str, float] = {}
+        self._attributes: dict[str, dict[str, Any]] = {}
+        self._total_length = 0.0
+
+        self._searches = 0
+        self._search_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, skill_id: str) -> bool:
+        return skill_id in self._doc_terms
+
+    def add(
+        self,
+        skill_id: str,
+        fields: dict[str, str | list[str] | None],
+        attributes: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Index a skill, replacing any previous entry.
+
+        Args:
+            skill_id: Skill ID
+            fields: Text fields (skill_name, description, capabilities, tags)
+            attributes: Filterable attributes, in the skill_vectors columns
+        """
+        self.remove(skill_id)
+
+        terms: Counter[str] = Counter()
+        for field, weight in self.FIELD_WEIGHTS.items():
+            value = fields.get(field)
+            if not value:
+                continue
+            text = " ".join(value) if isinstance(value, list) else value
+            for term in tokenize(text):
+                terms[term] += weight
+
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[skill_id] = frequency
+
+        length = sum(terms.values())
+        self._doc_terms[skill_id] = dict(terms)
+        self._doc_lengths[skill_id] = length
+        self._attributes[skill_id] = attributes or {}
+        self._total_length += length
+
+    def remove(self, skill_id: str) -> bool:
+        """
+        Remove a skill from the index.
+
+        Args:
+            skill_id: Skill ID
+
+        Returns:
+            True if the skill was indexed
+        """
+        terms = self._doc_terms.pop(skill_id, None)
+        if terms is None:
+            return False
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(skill_id, None)
+                if not postings:
+                    del self._postings[term]
+
+        self._total_length -= self._doc_lengths.pop(skill_id, 0.0)
+        self._attributes.pop(skill_id, None)
+        return True
+
+    def search(
+        self, query: str, top_k: int, filter_conditions: dict | None = None
+    ) -> list[tuple[str, float]]:
+        """
+        Rank skills against a keyword query.
+
+        Args:
+            query: Query text
+            top_k: Number of results
+            filter_conditions: Optional filters in the skill_vectors dialect
+
+        Returns:
+            (skill_id, BM25 score) pairs, best first
+        """
+        doc_count = len(self._doc_terms)
+        if doc_count == 0 or top_k <= 0:
+            return []
+
+        start = time.perf_counter()
+        average_length = self._total_length / doc_count or 1.0
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for skill_id, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[skill_id] / average_length)
+                scores[skill_id] = scores.get(skill_id, 0.0) + idf * frequency * (self.k1 + 1) / (
+                    frequency + norm
+                )
+
+        if filter_conditions:
+            scores = {
+                skill_id: score
+                for skill_id, score in scores.items()
+                if matches_filters(self._attributes[skill_id], filter_conditions)
+            }
+
+        hits = heapq.nlargest(top_k, scores.items(), key=lambda hit: hit[1])
+
+        self._searches += 1
+        self._search_seconds += time.perf_counter() - start
+        return hits
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._postings = {}
+        self._doc_terms = {}
+        self._doc_lengths = {}
+        self._attributes = {}
+        self._total_length = 0.0
+        self.loaded = False
+
+    def stats(self) -> dict:
+        """
+        Get index statistics.
+
+        Returns:
+            Document and term counts and search latency counters
+        """
+        return {
+            "loaded": self.loaded,
+            "documents": len(self._doc_terms),
+            "terms": len(self._postings),
+            "searches": self._searches,
+            "avg_search_ms": (
+                self._search_seconds / self._searches * 1000 if self._searches else 0.0
+            ),
+        }
@@ -0,0 +1,218 @@
+"""Off-loop executor for local sentence-transformers embeddings"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from skillpilot.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Model loaded once per worker process (process pool mode only)
+_worker_model = None
+
+
+def _load_sentence_transformer(model_name: str):
+    """Load a sentence-transformers model"""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.error("sentence-transformers not installed. Run: pip install sentence-transformers")
+        raise
+    return SentenceTransformer(model_name)
+
+
+def _init_worker(model_name: str) -> None:
+    """Process pool initializer: load the model into the worker"""
+    global _worker_model
+    _worker_model = _load_sentence_transformer(model_name)
+
+
+def _encode_in_worker(texts: list[str]) -> list[list[float]]:
+    """Encode texts with the worker's model (process pool mode only)"""
+    return _worker_model.encode(texts, normalize_embeddings=True, batch_size=len(texts)).tolist()
+
+
+def _fail_requests(requests: list[tuple[list[str], asyncio.Future]], error: Exception) -> None:
+    """Fail the futures of queued requests that have no result yet"""
+    for _, future in requests:
+        if not future.done():
+            future.set_exception(error)
+
+
+class LocalEmbeddingExecutor:
+    """
+    Runs local embedding model inference off the event loop.
+
+    Requests wait in a bounded queue; each worker drains whatever is pending
+    (up to ``max_batch_size`` texts) into a single ``encode`` call on a thread
+    pool, or on a process pool with the model loaded once per worker.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        workers: int = 1,
+        use_processes: bool = False,
+        queue_size: int = 256,
+        max_batch_size: int = 64,
+        encoder: Callable[[list[str]], list[list[float]]] | None = None,
+    ):
+        self.model_name = model_name
+        self.workers = max(1, workers)
+        self.use_processes = use_processes
+        self.queue_size = queue_size
+        self.max_batch_size = max_batch_size
+
+        self._encoder = encoder
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._pool: Executor | None = None
+
+        self._queue: asyncio.Queue | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self._requests = 0
+        self._batches = 0
+
+    async def encode(self, texts: list[str]) -> list[list[float]]:
+        """
+        Encode texts without blocking the event loop.
+
+        Waits for queue space when the queue is full.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            Normalized embedding vectors in input order
+
+        Raises:
+            RuntimeError: If the executor is shut down before the texts are encoded
+        """
+        if not texts:
+            return []
+
+        self._ensure_started()
+        queue = self._queue
+        future = self._loop.create_future()
+        self._requests += 1
+        await queue.put((texts, future))
+        if queue is not self._queue:
+            # Shut down while waiting for queue space; no worker reads that queue
+            raise RuntimeError("Local embedding executor was shut down")
+        return await future
+
+    def stats(self) -> dict:
+        """
+        Get executor statistics.
+
+        Returns:
+            Queue depth, request and batch counters
+        """
+        return {
+            "mode": "process" if self.use_processes else "thread",
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "requests": self._requests,
+            "batches": self._batches,
+        }
+
+    def shutdown(self) -> None:
+        """
+        Stop workers and release the pool.
+
+        Queued requests are failed with RuntimeError before the workers are
+        cancelled; workers fail the batch they were encoding as they stop.
+        """
+        if self._queue is not None and not self._loop.is_closed():
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            _fail_requests(pending, RuntimeError("Local embedding executor was shut down"))
+        for task in self._worker_tasks:
+            task.cancel()
+        self._worker_tasks = []
+        self._queue = None
+        self._loop = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _ensure_started(self) -> None:
+        """Start the pool and worker tasks on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        # Workers from a previous event loop can't serve this one
+        for task in self._worker_tasks:
+            task.cancel()
+
+        if self._pool is None:
+            if self.use_processes and self._encoder is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(self.model_name,),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="local-embedding"
+                )
+            logger.info(
+                "Local embedding executor started",
+                mode="process" if self.use_processes else "thread",
+                workers=self.workers,
+            )
+
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._worker_tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def _worker(self) -> None:
+        """Drain pending requests into batched encode calls"""
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0][0])
+            while size < self.max_batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                batch.append(item)
+                size += len(item[0])
+
+            texts = [text for request_texts, _ in batch for text in request_texts]
+            try:
+                embeddings = await self._loop.run_in_executor(self._pool, self._encode_fn(), texts)
+            except asyncio.CancelledError:
+                _fail_requests(batch, RuntimeError("Local embedding executor was shut down"))
+                raise
+            except Exception as e:
+                logger.error("Local embedding batch failed", size=len(texts), error=str(e))
+                _fail_requests(batch, e)
+                continue
+
+            self._batches += 1
+            offset = 0
+            for request_texts, future in batch:
+                if not future.done():
+                    future.set_result(embeddings[offset : offset + len(request_texts)])
+                offset += len(request_texts)
+
+    def _encode_fn(self) -> Callable[[list[str]], list[list[float]]]:
+        """Function executed on the pool"""
+        if self._encoder is not None:
+            return self._encoder
+        if self.use_processes:
+            return _encode_in_worker
+        return self._encode_in_thread
+
+    def _encode_in_thread(self, texts: list[str]) -> list[list[float]]:
+        """Encode with the shared model (thread pool mode)"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = _load_sentence_transformer(self.model_name)
+                    logger.info("Local embedding model loaded", model=self.model_name)
+        return self._model.encode(texts, normalize_embeddings=True, batch_size=len(texts)).tolist()
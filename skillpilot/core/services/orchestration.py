@@ -17,6 +17,34 @@ from skillpilot.db.seekdb import seekdb_client
 
 logger = get_logger(__name__)
 
+# skills columns sent to the LLM as catalog context for chain generation
+CATALOG_CONTEXT_COLUMNS = ("skill_id", "skill_name", "platform", "description", "capabilities")
+
+
+async def _list_plans(
+    user_id: str, page: int, limit: int, cursor: str | None
+) -> tuple[list[dict], dict]:
+    """Fetch a page of a user's plans and its pagination info"""
+    filters = {"user_id": user_id}
+    (plans_data, next_cursor), total = await asyncio.gather(
+        seekdb_client.query_page(
+            "orchestration_plans",
+            order_by=("created_at", "plan_id"),
+            filters=filters,
+            limit=limit,
+            offset=(page - 1) * limit,
+            cursor=cursor,
+        ),
+        seekdb_client.count("orchestration_plans", filters=filters, cached=True),
+    )
+    return plans_data, {
+        "page": page,
+        "limit": limit,
+        "total": total,
+        "total_pages": (total + limit - 1) // limit if limit > 0 else 0,
+        "next_cursor": next_cursor,
+    }
+
 
 class OrchestrationService:
     """
@@ -62,18 +90,17 @@ class OrchestrationService:
         return self._parse_plan(plan_data)
 
     async def list_plans(
-        self, user_id: str, page: int = 1, limit: int = 20
+        self, user_id: str, page: int = 1, limit: int = 20, cursor: str | None = None
     ) -> tuple[list, dict]:
-        """List orchestration plans for a user"""
-        offset = (page - 1) * limit
-        plans_data = await seekdb_client.query(
-            "orchestration_plans",
-            filters={"user_id": user_id},
-            limit=limit,
-            offset=offset,
-        )
+        """
+        List orchestration plans for a user, oldest first.
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        plans_data, pagination = await _list_plans(user_id, page, limit, cursor)
         plans = [self._parse_plan(p) for p in plans_data]
-        return plans, {"page": page, "limit": limit}
+        return plans, pagination
 
     async def execute_plan(self, plan_id: str) -> Orchestration:
         """Execute an orchestration plan"""
@@ -206,10 +233,12 @@ class RecommendationService:
             logger.error("Task analysis failed", error=str(e))
             return self._rule_based_analysis(task_description)
 
-    async def recommend_skills(self, task_description: str, limit: int = 10) -> list:
-        """Recommend skills for a given task."""
+    async def recommend_skills(
+        self, task_description: str, limit: int = 10, mmr_lambda: float | None = None
+    ) -> list:
+        """Recommend skills for a given task, optionally diversified with MMR."""
         results = await vector_search_service.match_skills_to_task(
-            task_description, top_k=limit
+            task_description, top_k=limit, mmr_lambda=mmr_lambda
         )
         logger.info("Skills recommended for task", task=task_description[:50], count=len(results))
         return results
@@ -217,7 +246,9 @@ class RecommendationService:
     async def generate_skill_chain(self, task_description: str) -> list[SkillChainStep]:
         """Generate a recommended skill chain for completing a task."""
         try:
-            all_skills_data = await seekdb_client.query("skills", filters={}, limit=100)
+            all_skills_data = await seekdb_client.query(
+                "skills", filters={}, limit=100, columns=CATALOG_CONTEXT_COLUMNS
+            )
             available_skills = []
             for skill_data in all_skills_data:
                 from skillpilot.core.services.skill import skill_service
@@ -264,14 +295,18 @@ class RecommendationService:
             return None
         return self._parse_plan(plan_data)
 
-    async def list_plans(self, user_id: str, page: int = 1, limit: int = 20) -> tuple[list, dict]:
-        """List saved recommendation plans for a user"""
-        offset = (page - 1) * limit
-        plans_data = await seekdb_client.query(
-            "orchestration_plans", filters={"user_id": user_id}, limit=limit, offset=offset
-        )
+    async def list_plans(
+        self, user_id: str, page: int = 1, limit: int = 20, cursor: str | None = None
+    ) -> tuple[list, dict]:
+        """
+        List saved recommendation plans for a user, oldest first.
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        plans_data, pagination = await _list_plans(user_id, page, limit, cursor)
         plans = [self._parse_plan(p) for p in plans_data]
-        return plans, {"page": page, "limit": limit}
+        return plans, pagination
 
     def _rule_based_analysis(self, task_description: str) -> dict:
         """Fallback rule-based task analysis"""
@@ -0,0 +1,173 @@
+"""Blocked, memory-bounded all-pairs top-K similarity"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class BlockPlan:
+    """Block size chosen for a memory budget"""
+
+    block_size: int
+    blocks: int
+    peak_bytes: int
+
+
+@dataclass
+class PairwiseProgress:
+    """Progress of an all-pairs run, reported after each block pair"""
+
+    block_pairs_done: int
+    block_pairs_total: int
+    pairs_done: int
+    elapsed_seconds: float
+
+    @property
+    def pairs_per_second(self) -> float:
+        return self.pairs_done / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def eta_seconds(self) -> float:
+        if not self.block_pairs_done:
+            return 0.0
+        remaining = self.block_pairs_total - self.block_pairs_done
+        return self.elapsed_seconds / self.block_pairs_done * remaining
+
+
+def plan_blocks(count: int, dimension: int, k: int, memory_bytes: int) -> BlockPlan:
+    """
+    Pick the largest square block that keeps peak memory within budget.
+
+    Peak memory is the running top-K of every row (float32 scores plus int64
+    indices), two blocks of vectors, the block similarity matrix and the
+    candidate buffers used to merge it into the top-K. The vectors themselves
+    are expected to be memory-mapped and are not counted.
+
+    Args:
+        count: Number of vectors
+        dimension: Vector dimension
+        k: Neighbors per vector
+        memory_bytes: Peak memory budget
+
+    Returns:
+        Block plan
+
+    Raises:
+        ValueError: If even a minimal block doesn't fit the budget
+    """
+    top_k_bytes = count * k * (4 + 8)
+
+    def peak(block: int) -> int:
+        vectors = 2 * block * dimension * 4
+        similarities = block * block * 4
+        # Per-row partition indices of the block, then 2K merge candidates
+        merge = block * block * 8 + 2 * block * 2 * k * (4 + 8)
+        return top_k_bytes + vectors + similarities + merge
+
+    block = max(1, min(count, 8192))
+    while block > 1 and peak(block) > memory_bytes:
+        block //= 2
+    if peak(block) > memory_bytes:
+        raise ValueError(
+            f"Memory budget of {memory_bytes} bytes is too small for {count} vectors at k={k}"
+        )
+
+    return BlockPlan(block_size=block, blocks=-(-count // block), peak_bytes=peak(block))
+
+
+def blocked_top_k(
+    vectors: np.ndarray,
+    k: int,
+    memory_bytes: int,
+    progress: Callable[[PairwiseProgress], None] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute each vector's top-K most similar other vectors.
+
+    Vectors must be L2-normalized so the dot product is cosine similarity.
+    Only block pairs on or above the diagonal are multiplied; each product
+    updates the top-K of both blocks' rows, halving the work.
+
+    Args:
+        vectors: (n, d) float32 matrix, typically a read-only memmap
+        k: Neighbors per vector
+        memory_bytes: Peak memory budget for the computation
+        progress: Optional callback invoked after each block pair
+
+    Returns:
+        (n, k) neighbor indices and similarities, best first; rows with
+        fewer than k other vectors are padded with -1 / -inf
+    """
+    count, dimension = vectors.shape
+    plan = plan_blocks(count, dimension, k, memory_bytes)
+    block = plan.block_size
+
+    top_scores = np.full((count, k), -np.inf, dtype=np.float32)
+    top_indices = np.full((count, k), -1, dtype=np.int64)
+
+    total = plan.blocks * (plan.blocks + 1) // 2
+    done = 0
+    pairs = 0
+    start = time.perf_counter()
+
+    for row_start in range(0, count, block):
+        row_end = min(row_start + block, count)
+        rows = np.ascontiguousarray(vectors[row_start:row_end], dtype=np.float32)
+
+        for col_start in range(row_start, count, block):
+            col_end = min(col_start + block, count)
+            cols = (
+                rows
+                if col_start == row_start
+                else np.ascontiguousarray(vectors[col_start:col_end], dtype=np.float32)
+            )
+
+            similarities = rows @ cols.T
+            if col_start == row_start:
+                np.fill_diagonal(similarities, -np.inf)
+
+            _merge(top_scores, top_indices, row_start, row_end, similarities, col_start)
+            if col_start != row_start:
+                _merge(top_scores, top_indices, col_start, col_end, similarities.T, row_start)
+
+            done += 1
+            pairs += similarities.size
+            if progress is not None:
+                progress(PairwiseProgress(done, total, pairs, time.perf_counter() - start))
+
+    return top_indices, top_scores
+
+
+def _merge(
+    top_scores: np.ndarray,
+    top_indices: np.ndarray,
+    start: int,
+    end: int,
+    similarities: np.ndarray,
+    offset: int,
+) -> None:
+    """Merge a block of similarities into the running top-K of rows start..end"""
+    k = top_scores.shape[1]
+
+    # Reduce the block to its own top-K per row before merging with the running top-K
+    if similarities.shape[1] > k:
+        block_best = np.argpartition(similarities, -k, axis=1)[:, -k:]
+        block_scores = np.take_along_axis(similarities, block_best, axis=1)
+    else:
+        block_best = np.broadcast_to(np.arange(similarities.shape[1]), similarities.shape)
+        block_scores = similarities
+
+    candidate_scores = np.concatenate([top_scores[start:end], block_scores], axis=1)
+    candidate_indices = np.concatenate([top_indices[start:end], block_best + offset], axis=1)
+
+    best = np.argpartition(-candidate_scores, k - 1, axis=1)[:, :k]
+    scores = np.take_along_axis(candidate_scores, best, axis=1)
+    order = np.argsort(-scores, axis=1, kind="stable")
+
+    top_scores[start:end] = np.take_along_axis(scores, order, axis=1)
+    top_indices[start:end] = np.take_along_axis(
+        np.take_along_axis(candidate_indices, best, axis=1), order, axis=1
+    )
@@ -0,0 +1,174 @@
+"""Result fusion and re-ranking for skill search"""
+
+import numpy as np
+
+
+def reciprocal_rank_fusion(
+    rankings: list[list[tuple[str, float]]],
+    weights: list[float] | None = None,
+    k: int = 60,
+) -> list[tuple[str, float]]:
+    """
+    Fuse ranked lists with weighted reciprocal rank fusion.
+
+    Each list contributes ``weight / (k + rank)`` for every item it ranks, so
+    only positions matter and the lists' score scales don't need to agree.
+
+    Args:
+        rankings: Ranked (id, score) lists, best first
+        weights: Per-list weights (default 1.0 each)
+        k: Rank smoothing constant
+
+    Returns:
+        (id, fused score) pairs, best first; scores are scaled so an item
+        ranked first in every list scores 1.0
+    """
+    weights = weights or [1.0] * len(rankings)
+    best_possible = sum(weight / (k + 1) for weight in weights) or 1.0
+
+    fused: dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights, strict=True):
+        for rank, (item_id, _) in enumerate(ranking, start=1):
+            fused[item_id] = fused.get(item_id, 0.0) + weight / (k + rank)
+
+    return sorted(
+        ((item_id, score / best_possible) for item_id, score in fused.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+
+
+def weighted_score_fusion(
+    rankings: list[list[tuple[str, float]]],
+    weights: list[float] | None = None,
+) -> list[tuple[str, float]]:
+    """
+    Fuse ranked lists by blending their scores.
+
+    Scores are normalized by each list's best score before blending, so a
+    list with larger raw scores (e.g. BM25) doesn't dominate.
+
+    Args:
+        rankings: Ranked (id, score) lists, best first
+        weights: Per-list weights (default 1.0 each)
+
+    Returns:
+        (id, blended score) pairs, best first, with scores in [0, 1]
+    """
+    weights = weights or [1.0] * len(rankings)
+    total_weight = sum(weights) or 1.0
+
+    fused: dict[str, float] = {}
+    for ranking, weight in zip(rankings, weights, strict=True):
+        best = max((score for _, score in ranking), default=0.0)
+        if best <= 0:
+            continue
+        for item_id, score in ranking:
+            fused[item_id] = fused.get(item_id, 0.0) + weight * max(score, 0.0) / best
+
+    return sorted(
+        ((item_id, score / total_weight) for item_id, score in fused.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+
+
+def maximal_marginal_relevance(
+    candidates: list[tuple[str, float]],
+    vectors: np.ndarray,
+    top_k: int,
+    lambda_: float = 0.5,
+) -> list[tuple[str, float]]:
+    """
+    Re-rank candidates with maximal marginal relevance (MMR).
+
+    Each pick maximizes ``lambda * relevance - (1 - lambda) * redundancy``,
+    where redundancy is the highest cosine similarity to an already picked
+    candidate, so near-duplicates give way to different skills.
+
+    Args:
+        candidates: Ranked (id, relevance) pairs, best first
+        vectors: (n, d) candidate vectors, in candidate order; zero rows
+            are treated as redundant with nothing
+        top_k: Number of items to pick
+        lambda_: 1.0 ranks by relevance only, 0.0 by diversity only
+
+    Returns:
+        Up to top_k (id, relevance) pairs in MMR order
+    """
+    if not candidates or top_k <= 0:
+        return []
+
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors = vectors / norms
+    similarities = vectors @ vectors.T
+
+    relevance = np.array([score for _, score in candidates], dtype=np.float32)
+    redundancy = np.full(len(candidates), -np.inf, dtype=np.float32)
+    available = np.ones(len(candidates), dtype=bool)
+    picked: list[int] = []
+
+    for _ in range(min(top_k, len(candidates))):
+        # Nothing is redundant before the first pick
+        penalty = np.where(np.isneginf(redundancy), 0.0, redundancy)
+        scores = lambda_ * relevance - (1 - lambda_) * penalty
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        picked.append(best)
+        available[best] = False
+        redundancy = np.maximum(redundancy, similarities[best])
+
+    return [candidates[i] for i in picked]
+
+
+def blend_quality_scores(
+    similarity: np.ndarray,
+    usage_count: np.ndarray,
+    rating: np.ndarray,
+    age_days: np.ndarray,
+    weights: dict[str, float],
+    usage_saturation: float = 10000.0,
+    recency_half_life_days: float = 90.0,
+) -> dict[str, np.ndarray]:
+    """
+    Blend similarity with popularity, rating and recency signals.
+
+    Each signal is scaled to [0, 1]: popularity is ``log1p(usage)`` relative
+    to ``log1p(usage_saturation)``, rating is out of 5 and recency decays by
+    half every ``recency_half_life_days``. The blended score is the weighted
+    mean of the signals, so it stays on the similarity scale.
+
+    Args:
+        similarity: Cosine similarity per candidate
+        usage_count: Usage count per candidate (NaN if unknown)
+        rating: Rating (0-5) per candidate (NaN if unknown)
+        age_days: Days since last update per candidate (NaN if unknown)
+        weights: Weight per signal: similarity, popularity, rating, recency
+        usage_saturation: Usage count at which popularity reaches 1.0
+        recency_half_life_days: Age at which recency drops to 0.5
+
+    Returns:
+        Arrays for each signal plus ``score``, the blended score; unknown
+        signals contribute 0
+    """
+    signals = {
+        "similarity": np.asarray(similarity, dtype=np.float64),
+        "popularity": np.clip(
+            np.log1p(np.maximum(np.asarray(usage_count, dtype=np.float64), 0.0))
+            / np.log1p(max(usage_saturation, 1.0)),
+            0.0,
+            1.0,
+        ),
+        "rating": np.clip(np.asarray(rating, dtype=np.float64) / 5.0, 0.0, 1.0),
+        "recency": np.exp2(
+            -np.maximum(np.asarray(age_days, dtype=np.float64), 0.0)
+            / max(recency_half_life_days, 1e-9)
+        ),
+    }
+    signals = {name: np.nan_to_num(values, nan=0.0) for name, values in signals.items()}
+
+    total_weight = sum(weights.get(name, 0.0) for name in signals) or 1.0
+    score = sum(weights.get(name, 0.0) * values for name, values in signals.items())
+    return {**signals, "score": score / total_weight}
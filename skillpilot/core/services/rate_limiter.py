@@ -0,0 +1,336 @@
+"""Provider rate limiting for embedding and LLM API calls"""
+
+import asyncio
+import re
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+from skillpilot.core.config import settings
+from skillpilot.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Status codes worth retrying besides rate limits
+_RETRYABLE_STATUS = {408, 409, 500, 502, 503, 504}
+
+# Durations like "1s", "6m0s", "20ms", "1h2m3.5s" used by x-ratelimit-reset-* headers
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate"""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._level = capacity
+        self._updated = time.monotonic()
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until ``amount`` can be consumed (0 if available now)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self._level >= amount:
+            return 0.0
+        return (amount - self._level) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Take ``amount`` from the bucket"""
+        self._refill()
+        self._level -= min(amount, self.capacity)
+
+    def clamp(self, remaining: float) -> None:
+        """Lower the level to what the provider reports as remaining"""
+        self._refill()
+        self._level = min(self._level, remaining)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(
+            self.capacity, self._level + (now - self._updated) * self.refill_per_second
+        )
+        self._updated = now
+
+
+class ProviderRateLimiter:
+    """
+    Request and token rate limiter for one provider.
+
+    Tracks requests per minute and tokens per minute with token buckets, and
+    pauses all callers when the provider asks for it via ``Retry-After`` or
+    ``x-ratelimit-*`` / ``anthropic-ratelimit-*`` headers. A limit of 0 disables
+    that bucket.
+    """
+
+    def __init__(self, provider: str, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self.provider = provider
+        self._requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60)
+            if requests_per_minute > 0
+            else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60) if tokens_per_minute > 0 else None
+        )
+        self._blocked_until = 0.0
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        self._acquired = 0
+        self._waited_seconds = 0.0
+        self._rate_limited = 0
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Wait until a request of ``tokens`` estimated tokens may be sent.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        # Serialize waiters so requests are admitted in arrival order
+        async with self._lock:
+            while True:
+                wait = max(
+                    self._blocked_until - time.monotonic(),
+                    self._requests.time_until(1) if self._requests else 0.0,
+                    self._tokens.time_until(tokens) if self._tokens else 0.0,
+                )
+                if wait <= 0:
+                    break
+                self._waited_seconds += wait
+                await asyncio.sleep(wait)
+
+            if self._requests:
+                self._requests.consume(1)
+            if self._tokens:
+                self._tokens.consume(tokens)
+            self._acquired += 1
+
+    def pause(self, seconds: float) -> None:
+        """Block all callers for ``seconds``"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def record_rate_limited(self, retry_after: float) -> None:
+        """Register a rate-limited response and pause callers for ``retry_after``"""
+        self._rate_limited += 1
+        self.pause(retry_after)
+
+    def update_from_headers(self, headers: Mapping[str, str] | None) -> None:
+        """
+        Sync the buckets with rate limit headers returned by the provider.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        if not headers:
+            return
+        headers = {k.lower(): v for k, v in headers.items()}
+
+        for name in ("x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining"):
+            remaining = _parse_float(headers.get(name))
+            if remaining is not None and self._requests:
+                self._requests.clamp(remaining)
+
+        for name in ("x-ratelimit-remaining-tokens", "anthropic-ratelimit-tokens-remaining"):
+            remaining = _parse_float(headers.get(name))
+            if remaining is not None and self._tokens:
+                self._tokens.clamp(remaining)
+
+        # Nothing left in a window: wait for the provider's reset
+        for remaining_name, reset_name in (
+            ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+            ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens"),
+        ):
+            if _parse_float(headers.get(remaining_name)) == 0:
+                reset = _parse_duration(headers.get(reset_name))
+                if reset:
+                    self.pause(reset)
+
+    def stats(self) -> dict:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Admission, wait and rate-limit counters
+        """
+        return {
+            "acquired": self._acquired,
+            "waited_seconds": round(self._waited_seconds, 3),
+            "rate_limited": self._rate_limited,
+        }
+
+
+_limiters: dict[str, ProviderRateLimiter] = {}
+
+
+def get_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """
+    Get the shared rate limiter for a provider.
+
+    Limits come from settings; providers without configured limits (local,
+    mock) get an unlimited limiter.
+    """
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        limits = {
+            "openai": (settings.openai_requests_per_minute, settings.openai_tokens_per_minute),
+            "anthropic": (
+                settings.anthropic_requests_per_minute,
+                settings.anthropic_tokens_per_minute,
+            ),
+        }
+        rpm, tpm = limits.get(provider, (0, 0))
+        limiter = ProviderRateLimiter(provider, requests_per_minute=rpm, tokens_per_minute=tpm)
+        _limiters[provider] = limiter
+    return limiter
+
+
+def rate_limiter_stats() -> dict:
+    """Get statistics for every limiter created so far"""
+    return {provider: limiter.stats() for provider, limiter in _limiters.items()}
+
+
+async def call_with_rate_limit(
+    provider: str,
+    request: Callable[[], Awaitable[T]],
+    tokens: int = 1,
+    max_retries: int = 3,
+) -> T:
+    """
+    Send a provider request through its rate limiter, retrying failures.
+
+    Rate-limited responses pause the shared limiter for the provider's
+    ``Retry-After`` (or the reset time from ``x-ratelimit-*`` headers), falling
+    back to exponential backoff when no hint is given.
+
+    Args:
+        provider: Provider name
+        request: Coroutine factory issuing the request
+        tokens: Estimated tokens the request will consume
+        max_retries: Maximum attempts
+
+    Returns:
+        The request's result
+
+    Raises:
+        Exception: The last error once retries are exhausted or the error isn't retryable
+    """
+    limiter = get_rate_limiter(provider)
+
+    for attempt in range(max_retries):
+        await limiter.acquire(tokens)
+        try:
+            return await request()
+        except Exception as e:
+            status = _status_code(e)
+            headers = _response_headers(e)
+            limiter.update_from_headers(headers)
+
+            if status is not None and status != 429 and status not in _RETRYABLE_STATUS:
+                logger.error("Provider request failed", provider=provider, status=status, error=str(e))
+                raise
+            if attempt == max_retries - 1:
+                logger.error(
+                    "Provider request failed after retries",
+                    provider=provider,
+                    attempts=max_retries,
+                    error=str(e),
+                )
+                raise
+
+            delay = retry_after_seconds(headers) or 2**attempt
+            if status == 429:
+                limiter.record_rate_limited(delay)
+                logger.warning("Rate limited, retrying in", provider=provider, seconds=delay)
+            else:
+                logger.warning(
+                    "Provider request failed, retrying in",
+                    provider=provider,
+                    attempt=attempt + 1,
+                    seconds=delay,
+                    error=str(e),
+                )
+                await asyncio.sleep(delay)
+
+    raise ValueError(f"{provider} request failed after all retries")
+
+
+def retry_after_seconds(headers: Mapping[str, str] | None) -> float | None:
+    """
+    Extract the wait time a provider asked for.
+
+    Checks ``retry-after-ms``, ``retry-after`` (seconds or HTTP date) and the
+    ``x-ratelimit-reset-*`` durations.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds to wait, or None if the headers carry no hint
+    """
+    if not headers:
+        return None
+    headers = {k.lower(): v for k, v in headers.items()}
+
+    retry_ms = _parse_float(headers.get("retry-after-ms"))
+    if retry_ms is not None:
+        return retry_ms / 1000
+
+    retry_after = headers.get("retry-after")
+    if retry_after:
+        seconds = _parse_float(retry_after)
+        if seconds is not None:
+            return seconds
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+
+    resets = [
+        _parse_duration(headers.get(name))
+        for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+    ]
+    resets = [r for r in resets if r]
+    return max(resets) if resets else None
+
+
+def _status_code(error: Exception) -> int | None:
+    """HTTP status of an SDK or httpx error, if any"""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _response_headers(error: Exception) -> Mapping[str, str] | None:
+    """Response headers attached to an SDK or httpx error, if any"""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    return headers if isinstance(headers, Mapping) else None
+
+
+def _parse_float(value: str | None) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_duration(value: str | None) -> float | None:
+    """Parse durations like "6m0s" or "20ms" into seconds"""
+    if not value:
+        return None
+    seconds = _parse_float(value)
+    if seconds is not None:
+        return seconds
+    units = {"h": 3600, "m": 60, "s": 1, "ms": 0.001}
+    parts = _DURATION_PART.findall(value)
+    return sum(float(amount) * units[unit] for amount, unit in parts) if parts else None
@@ -0,0 +1,260 @@
+"""Evaluation of skill_vectors filter conditions outside the database"""
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+# Range operators supported in filter conditions
+_RANGE_OPS = {
+    "gte": np.greater_equal,
+    "gt": np.greater,
+    "lte": np.less_equal,
+    "lt": np.less,
+}
+
+
+def matches_filters(row: Mapping[str, Any], conditions: Mapping[str, Any] | None) -> bool:
+    """
+    Check one row against filter conditions.
+
+    Uses the same dialect as ``SeekDBClient.vector_search``: a scalar means
+    equality, a list means IN, ``{"gte"/"gt"/"lte"/"lt": x}`` is a range and
+    ``{"contains_any": [...]}`` matches list columns sharing any value.
+
+    Args:
+        row: Row attributes
+        conditions: Filter conditions (None matches everything)
+
+    Returns:
+        True if the row satisfies every condition
+    """
+    if not conditions:
+        return True
+    return all(_matches(row.get(column), condition) for column, condition in conditions.items())
+
+
+class ColumnarFilters:
+    """
+    Filterable attributes of a dense row set, stored for vectorized masks.
+
+    Category columns are kept as integer codes, numeric columns as float64
+    (datetimes as POSIX timestamps, missing values as NaN) and set columns
+    such as tags as an inverted index of value -> row numbers. All are
+    updated in place, so building a mask is NumPy comparisons plus work
+    proportional to the matching rows, not a Python pass over every row.
+    Original values are kept so attributes can be read back. Rows are
+    removed by moving the last row into the hole, like the vector matrix.
+    """
+
+    def __init__(
+        self,
+        category_columns: Sequence[str] = (),
+        numeric_columns: Sequence[str] = (),
+        set_columns: Sequence[str] = (),
+        initial_capacity: int = 1024,
+    ):
+        self.category_columns = tuple(category_columns)
+        self.numeric_columns = tuple(numeric_columns)
+        self.set_columns = tuple(set_columns)
+        self.columns = (*self.category_columns, *self.numeric_columns, *self.set_columns)
+
+        self._size = 0
+        self._values: dict[str, list[Any]] = {column: [] for column in self.columns}
+        self._code_of: dict[str, dict[Any, int]] = {c: {} for c in self.category_columns}
+        self._codes = {
+            c: np.full(initial_capacity, -1, dtype=np.int32) for c in self.category_columns
+        }
+        self._numbers = {
+            c: np.full(initial_capacity, np.nan, dtype=np.float64) for c in self.numeric_columns
+        }
+        self._postings: dict[str, dict[Any, set[int]]] = {c: {} for c in self.set_columns}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, attributes: Mapping[str, Any]) -> None:
+        """Add a row with the given attribute values (missing columns are None)"""
+        row = self._size
+        self._ensure_capacity(row + 1)
+        self._size += 1
+        for column in self.columns:
+            self._values[column].append(None)
+            self._store(row, column, attributes.get(column))
+
+    def update(self, row: int, attributes: Mapping[str, Any]) -> None:
+        """Replace a row's values for the columns present in ``attributes``"""
+        for column in self.columns:
+            if column in attributes:
+                self._unpost(row, column)
+                self._store(row, column, attributes[column])
+
+    def delete(self, row: int) -> None:
+        """Remove a row, moving the last row into its place"""
+        last = self._size - 1
+        for column in self.set_columns:
+            self._unpost(row, column)
+        if row != last:
+            for column in self.set_columns:
+                self._unpost(last, column)
+            for column in self.columns:
+                self._values[column][row] = self._values[column][last]
+            for codes in self._codes.values():
+                codes[row] = codes[last]
+            for numbers in self._numbers.values():
+                numbers[row] = numbers[last]
+            for column in self.set_columns:
+                self._post(row, column)
+
+        for values in self._values.values():
+            values.pop()
+        for codes in self._codes.values():
+            codes[last] = -1
+        for numbers in self._numbers.values():
+            numbers[last] = np.nan
+        self._size -= 1
+
+    def get(self, row: int, column: str) -> Any:
+        """Get a row's original value for a column"""
+        return self._values[column][row]
+
+    def mask(self, conditions: Mapping[str, Any] | None) -> np.ndarray | None:
+        """
+        Evaluate filter conditions over all rows.
+
+        Args:
+            conditions: Filter conditions in the ``matches_filters`` dialect
+
+        Returns:
+            Boolean mask of matching rows, or None when unfiltered
+        """
+        if not conditions:
+            return None
+
+        mask = np.ones(self._size, dtype=bool)
+        for column, condition in conditions.items():
+            if column not in self._values:
+                return np.zeros(self._size, dtype=bool)
+            mask &= self._column_mask(column, condition)
+        return mask
+
+    def _column_mask(self, column: str, condition: Any) -> np.ndarray:
+        size = self._size
+        is_range = isinstance(condition, Mapping) and any(op in condition for op in _RANGE_OPS)
+        is_list = isinstance(condition, list | tuple | set)
+
+        if column in self._codes and not isinstance(condition, Mapping):
+            codes = self._codes[column][:size]
+            code_of = self._code_of[column]
+            if is_list:
+                wanted = [code_of[value] for value in condition if value in code_of]
+                return np.isin(codes, wanted)
+            code = code_of.get(condition)
+            return codes == code if code is not None else np.zeros(size, dtype=bool)
+
+        if column in self._numbers and (is_range or not isinstance(condition, Mapping)):
+            numbers = self._numbers[column][:size]
+            if is_range:
+                mask = np.ones(size, dtype=bool)
+                for op, compare in _RANGE_OPS.items():
+                    if op in condition:
+                        mask &= compare(numbers, _to_number(condition[op]))
+                return mask
+            if is_list and None not in condition:
+                return np.isin(numbers, [_to_number(value) for value in condition])
+            if not is_list and condition is not None:
+                return numbers == _to_number(condition)
+
+        if column in self._postings and isinstance(condition, Mapping) and (
+            "contains_any" in condition
+        ):
+            postings = self._postings[column]
+            rows: set[int] = set()
+            for value in condition["contains_any"]:
+                rows |= postings.get(value, set())
+            mask = np.zeros(size, dtype=bool)
+            if rows:
+                mask[np.fromiter(rows, dtype=np.intp, count=len(rows))] = True
+            return mask
+
+        # Uncommon condition/column combinations: evaluate value by value
+        return np.fromiter(
+            (_matches(value, condition) for value in self._values[column]),
+            dtype=bool,
+            count=size,
+        )
+
+    def _store(self, row: int, column: str, value: Any) -> None:
+        self._values[column][row] = value
+        if column in self._codes:
+            if value is None:
+                self._codes[column][row] = -1
+            else:
+                code_of = self._code_of[column]
+                self._codes[column][row] = code_of.setdefault(value, len(code_of))
+        elif column in self._numbers:
+            self._numbers[column][row] = _to_number(value)
+        elif column in self._postings:
+            self._post(row, column)
+
+    def _post(self, row: int, column: str) -> None:
+        postings = self._postings[column]
+        for value in self._values[column][row] or ():
+            postings.setdefault(value, set()).add(row)
+
+    def _unpost(self, row: int, column: str) -> None:
+        if column not in self._postings:
+            return
+        postings = self._postings[column]
+        for value in self._values[column][row] or ():
+            rows = postings.get(value)
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del postings[value]
+
+    def _ensure_capacity(self, size: int) -> None:
+        """Grow the typed arrays geometrically to hold ``size`` rows"""
+        arrays = [*self._codes.values(), *self._numbers.values()]
+        capacity = arrays[0].shape[0] if arrays else size
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        for column, codes in self._codes.items():
+            grown = np.full(capacity, -1, dtype=np.int32)
+            grown[: codes.shape[0]] = codes
+            self._codes[column] = grown
+        for column, numbers in self._numbers.items():
+            grown = np.full(capacity, np.nan, dtype=np.float64)
+            grown[: numbers.shape[0]] = numbers
+            self._numbers[column] = grown
+
+
+def _to_number(value: Any) -> float:
+    """Convert a numeric or datetime attribute to float64, NaN if not numeric"""
+    if value is None:
+        return np.nan
+    if isinstance(value, datetime):
+        return value.timestamp()
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _matches(value: Any, condition: Any) -> bool:
+    """Check a single column value against its condition"""
+    if isinstance(condition, Mapping):
+        if "contains_any" in condition:
+            return bool(value) and not set(condition["contains_any"]).isdisjoint(value)
+        if value is None:
+            return False
+        return all(
+            bool(compare(value, condition[op]))
+            for op, compare in _RANGE_OPS.items()
+            if op in condition
+        )
+    if isinstance(condition, list | tuple | set):
+        return value in condition
+    return value == condition
@@ -0,0 +1,255 @@
+"""Materialized nearest-neighbor graph of skills"""
+
+import asyncio
+import time
+from contextlib import aclosing
+from datetime import UTC, datetime
+
+from skillpilot.core.config import settings
+from skillpilot.core.utils.logger import get_logger
+from skillpilot.db.seekdb import seekdb_client
+
+logger = get_logger(__name__)
+
+
+class SimilarityGraphService:
+    """
+    Keeps each skill's top-K most similar skills in the skill_neighbors table.
+
+    "Similar skills" lookups become a primary-key read. Lists are refreshed
+    incrementally: an indexed skill gets a fresh list and is offered to its
+    neighbors' lists (similarity is symmetric); a deleted skill's neighbors
+    are recomputed. A periodic full rebuild repairs lists that still point at
+    deleted skills, which readers skip in the meantime.
+    """
+
+    def __init__(self):
+        self.k = settings.similarity_graph_k
+        self._rebuild_task: asyncio.Task | None = None
+        self._rebuilding = False
+
+        self._lookups = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._last_rebuild: dict | None = None
+
+    async def get_neighbors(self, skill_id: str) -> list[tuple[str, float]] | None:
+        """
+        Read a skill's materialized neighbors.
+
+        Args:
+            skill_id: Skill ID
+
+        Returns:
+            (skill_id, similarity) pairs, best first, or None if not materialized
+        """
+        self._lookups += 1
+        row = await seekdb_client.get("skill_neighbors", skill_id)
+        if not row or row.get("neighbors") is None:
+            self._misses += 1
+            return None
+        return [(n["skill_id"], n["similarity"]) for n in row["neighbors"]]
+
+    async def store_many(
+        self, lists: dict[str, list[tuple[str, float]]], chunk_size: int | None = None
+    ) -> int:
+        """
+        Write many neighbor lists with bulk upserts.
+
+        Args:
+            lists: Skill ID -> (skill_id, similarity) pairs, best first
+            chunk_size: Rows per bulk write (default: settings.seekdb_bulk_batch_size)
+
+        Returns:
+            Number of lists written
+        """
+        now = datetime.now(UTC)
+        rows = [
+            {
+                "skill_id": skill_id,
+                "neighbors": [
+                    {"skill_id": neighbor_id, "similarity": similarity}
+                    for neighbor_id, similarity in neighbors[: self.k]
+                ],
+                "updated_at": now,
+            }
+            for skill_id, neighbors in lists.items()
+        ]
+        result = await seekdb_client.upsert_many("skill_neighbors", rows, chunk_size)
+        for skill_id, error in result.failed.items():
+            logger.error("Failed to store skill neighbors", skill_id=skill_id, error=error)
+        return result.succeeded
+
+    async def refresh_skill(self, skill_id: str, vector: list[float]) -> list[tuple[str, float]]:
+        """
+        Recompute a skill's neighbors and offer it to its neighbors' lists.
+
+        Args:
+            skill_id: Skill ID
+            vector: The skill's embedding
+
+        Returns:
+            The skill's new neighbor list
+        """
+        neighbors = await self._compute_neighbors(skill_id, vector)
+        lists = {skill_id: neighbors}
+
+        # The new skill may now rank among its neighbors' nearest skills
+        rows = await seekdb_client.get_many(
+            "skill_neighbors", [neighbor_id for neighbor_id, _ in neighbors]
+        )
+        for neighbor_id, similarity in neighbors:
+            row = rows.get(neighbor_id)
+            if not row or row.get("neighbors") is None:
+                continue
+            current = [
+                (n["skill_id"], n["similarity"]) for n in row["neighbors"] if n["skill_id"] != skill_id
+            ]
+            if len(current) >= self.k and similarity <= current[-1][1]:
+                continue
+            current.append((skill_id, similarity))
+            current.sort(key=lambda n: n[1], reverse=True)
+            lists[neighbor_id] = current
+
+        await self.store_many(lists)
+        self._refreshes += 1
+        return neighbors
+
+    async def remove_skill(self, skill_id: str) -> None:
+        """
+        Drop a deleted skill's list and recompute the lists of its neighbors.
+
+        Args:
+            skill_id: Skill ID
+        """
+        row = await seekdb_client.get("skill_neighbors", skill_id)
+        if row is None:
+            return
+        await seekdb_client.delete("skill_neighbors", skill_id)
+
+        neighbor_ids = [n["skill_id"] for n in row.get("neighbors") or []]
+        vectors = await seekdb_client.get_many("skill_vectors", neighbor_ids)
+        lists = {}
+        for neighbor_id in neighbor_ids:
+            vector_row = vectors.get(neighbor_id)
+            if vector_row and vector_row.get("skill_vector"):
+                lists[neighbor_id] = await self._compute_neighbors(
+                    neighbor_id, vector_row["skill_vector"]
+                )
+        if lists:
+            await self.store_many(lists)
+
+    async def rebuild_all(self) -> int:
+        """
+        Recompute every skill's neighbor list.
+
+        Lists are computed concurrently a chunk of skills at a time and each
+        chunk is written with bulk upserts.
+
+        Returns:
+            Number of skills whose lists were written
+        """
+        if self._rebuilding:
+            logger.warning("Similarity graph rebuild already running")
+            return 0
+
+        from skillpilot.core.services.vector_search import vector_search_service
+
+        self._rebuilding = True
+        start = time.perf_counter()
+        rebuilt = 0
+        semaphore = asyncio.Semaphore(settings.similarity_graph_rebuild_concurrency)
+
+        async def compute_one(row: dict) -> list[tuple[str, float]] | None:
+            async with semaphore:
+                try:
+                    return await self._compute_neighbors(row["skill_id"], row["skill_vector"])
+                except Exception as e:
+                    logger.error(
+                        "Failed to rebuild skill neighbors", skill_id=row["skill_id"], error=str(e)
+                    )
+                    return None
+
+        try:
+            async with aclosing(vector_search_service.iter_table("skill_vectors")) as chunks:
+                async for rows in chunks:
+                    rows = [row for row in rows if row.get("skill_vector")]
+                    computed = await asyncio.gather(*(compute_one(row) for row in rows))
+                    lists = {
+                        row["skill_id"]: neighbors
+                        for row, neighbors in zip(rows, computed, strict=True)
+                        if neighbors is not None
+                    }
+                    if lists:
+                        rebuilt += await self.store_many(lists)
+        finally:
+            self._rebuilding = False
+
+        seconds = round(time.perf_counter() - start, 2)
+        self._last_rebuild = {
+            "finished_at": datetime.now(UTC).isoformat(),
+            "skills": rebuilt,
+            "seconds": seconds,
+        }
+        logger.info("Similarity graph rebuilt", skills=rebuilt, seconds=seconds)
+        return rebuilt
+
+    def start_periodic_rebuild(self, interval_seconds: float) -> None:
+        """Rebuild the graph every ``interval_seconds`` in the background"""
+        if self._rebuild_task is not None or interval_seconds <= 0:
+            return
+
+        async def loop() -> None:
+            while True:
+                await asyncio.sleep(interval_seconds)
+                try:
+                    await self.rebuild_all()
+                except Exception as e:
+                    logger.error("Periodic similarity graph rebuild failed", error=str(e))
+
+        self._rebuild_task = asyncio.get_running_loop().create_task(loop())
+
+    async def stop(self) -> None:
+        """Stop the periodic rebuild"""
+        if self._rebuild_task is None:
+            return
+        self._rebuild_task.cancel()
+        try:
+            await self._rebuild_task
+        except asyncio.CancelledError:
+            pass
+        self._rebuild_task = None
+
+    def stats(self) -> dict:
+        """
+        Get graph statistics.
+
+        Returns:
+            Lookup/miss/refresh counters and the last full rebuild
+        """
+        return {
+            "k": self.k,
+            "lookups": self._lookups,
+            "misses": self._misses,
+            "refreshes": self._refreshes,
+            "rebuilding": self._rebuilding,
+            "last_rebuild": self._last_rebuild,
+        }
+
+    async def _compute_neighbors(
+        self, skill_id: str, vector: list[float]
+    ) -> list[tuple[str, float]]:
+        """Query the top-K skills most similar to a vector, excluding the skill itself"""
+        from skillpilot.core.services.vector_search import vector_search_service
+
+        results = await vector_search_service.vector_query(vector, self.k + 1)
+        neighbors = [
+            (result["skill_id"], result.get("similarity", 0.0))
+            for result in results
+            if result.get("skill_id") and result["skill_id"] != skill_id
+        ]
+        neighbors.sort(key=lambda n: n[1], reverse=True)
+        return neighbors[: self.k]
+
+
+similarity_graph_service = SimilarityGraphService()
@@ -1,8 +1,11 @@
 """Skill Service"""
 
+import asyncio
+from contextlib import aclosing
 from datetime import UTC, datetime
 from uuid import uuid4
 
+from skillpilot.core.config import settings
 from skillpilot.core.models.common import Pagination, PlatformType
 from skillpilot.core.models.skill import (
     Skill,
@@ -16,29 +19,20 @@ from skillpilot.db.seekdb import seekdb_client
 
 logger = get_logger(__name__)
 
+# Stable listing order; skill_id breaks created_at ties
+SKILL_LISTING_ORDER = ("created_at", "skill_id")
+
+# SkillUpdate fields that feed the skill's search text (and so its embedding)
+SEARCH_TEXT_FIELDS = {"skill_name", "description", "capabilities", "tags"}
+
 
 class SkillService:
     """Skill service for managing AI skills"""
 
     async def create_skill(self, skill_data: SkillCreate, developer_id: str) -> Skill:
         """Create a new skill"""
-        skill_id = f"sk_{uuid4().hex[:12]}"
-        now = datetime.now(UTC)
-
-        skill_dict = {
-            "skill_id": skill_id,
-            "skill_name": skill_data.skill_name,
-            "platform": skill_data.platform.value,
-            "developer": developer_id,
-            "description": skill_data.description,
-            "capabilities": skill_data.capabilities,
-            "tags": skill_data.tags,
-            "pricing": skill_data.pricing.model_dump(),
-            "rating": 0.0,
-            "usage_count": 0,
-            "created_at": now,
-            "updated_at": now,
-        }
+        skill_dict = self._build_skill_row(skill_data, developer_id)
+        skill_id = skill_dict["skill_id"]
 
         await seekdb_client.insert("skills", skill_dict)
         logger.info("Skill created", skill_id=skill_id, developer=developer_id)
@@ -53,10 +47,13 @@ class SkillService:
             capabilities=skill_data.capabilities,
             tags=skill_data.tags,
             pricing=skill_data.pricing,
-            created_at=now,
-            updated_at=now,
+            created_at=skill_dict["created_at"],
+            updated_at=skill_dict["updated_at"],
         )
 
+        vector_search_service.index_skill_keywords(skill)
+        vector_search_service.bump_catalog_generation()
+
         # Index skill for vector search (async, non-blocking)
         try:
             await vector_search_service.index_skill(skill)
@@ -65,6 +62,53 @@ class SkillService:
 
         return skill
 
+    async def create_skills(
+        self, skills_data: list[SkillCreate], developer_id: str
+    ) -> tuple[list[Skill], dict[int, str]]:
+        """
+        Create many skills with bulk writes.
+
+        Skills and their vectors are written a chunk at a time instead of a
+        row at a time; similarity graph lists for the new skills are filled
+        on first lookup.
+
+        Args:
+            skills_data: Skills to create
+            developer_id: Developer to assign them to
+
+        Returns:
+            Created skills, and input position -> error for skills that failed
+        """
+        rows = [self._build_skill_row(skill_data, developer_id) for skill_data in skills_data]
+        result = await seekdb_client.insert_many("skills", rows)
+
+        created: list[Skill] = []
+        failed: dict[int, str] = {}
+        for position, row in enumerate(rows):
+            error = result.failed.get(row["skill_id"])
+            if error is not None:
+                failed[position] = error
+                continue
+            skill = self._parse_skill(row)
+            vector_search_service.index_skill_keywords(skill)
+            created.append(skill)
+
+        if created:
+            vector_search_service.bump_catalog_generation()
+            try:
+                await vector_search_service.index_skills_batch(created, refresh_neighbors=False)
+            except Exception as e:
+                logger.warning("Failed to index skills for vector search", error=str(e))
+
+        logger.info(
+            "Skills created",
+            created=len(created),
+            failed=len(failed),
+            developer=developer_id,
+            round_trips=result.round_trips,
+        )
+        return created, failed
+
     async def get_skill(self, skill_id: str) -> Skill | None:
         """Get skill details by ID"""
         skill_data = await seekdb_client.get("skills", skill_id)
@@ -86,26 +130,26 @@ class SkillService:
 
         if "platform" in update_dict and update_dict["platform"]:
             update_dict["platform"] = update_dict["platform"].value
-        if "pricing" in update_dict and update_dict["pricing"]:
-            update_dict["pricing"] = update_dict["pricing"].model_dump()
 
         await seekdb_client.update("skills", skill_id, update_dict)
+        vector_search_service.bump_catalog_generation()
         logger.info("Skill updated", skill_id=skill_id)
 
         # Get updated skill
         updated_skill = await self.get_skill(skill_id)
+        if updated_skill:
+            vector_search_service.index_skill_keywords(updated_skill)
         
-        # Re-index skill for vector search if content changed
-        if updated_skill and (
-            skill_data.skill_name
-            or skill_data.description
-            or skill_data.capabilities
-            or skill_data.tags
-        ):
+        # Re-index skill for vector search if its searchable text changed
+        # (including fields cleared to empty), otherwise just keep the filter
+        # attributes stored with its vector in sync (updated_at always changes)
+        if updated_skill and skill_data.model_fields_set & SEARCH_TEXT_FIELDS:
             try:
                 await vector_search_service.update_skill_embedding(updated_skill)
             except Exception as e:
                 logger.warning("Failed to update skill vector", skill_id=skill_id, error=str(e))
+        elif updated_skill:
+            await vector_search_service.sync_skill_attributes(updated_skill)
 
         return updated_skill
 
@@ -118,32 +162,47 @@ class SkillService:
 
         await seekdb_client.delete("skills", skill_id)
         
-        # Also delete skill vector
-        try:
-            await seekdb_client.delete("skill_vectors", skill_id)
-        except Exception:
-            pass  # Ignore if vector doesn't exist
+        # Also delete skill vector and keyword entries
+        await vector_search_service.remove_skill_vector(skill_id)
+        vector_search_service.remove_skill_keywords(skill_id)
+        vector_search_service.bump_catalog_generation()
         
         logger.info("Skill deleted", skill_id=skill_id)
         return True
 
     async def list_skills(
-        self, platform: PlatformType | None = None, page: int = 1, limit: int = 20
+        self,
+        platform: PlatformType | None = None,
+        page: int = 1,
+        limit: int = 20,
+        cursor: str | None = None,
     ) -> tuple[list[Skill], Pagination]:
-        """List skills with pagination"""
+        """
+        List skills with pagination, oldest first.
+
+        Following ``pagination.next_cursor`` seeks straight to the next page,
+        so deep pages are as fast as the first; ``page`` is an offset.
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
         filters = {}
         if platform:
             filters["platform"] = platform.value
 
         offset = (page - 1) * limit
-        skills_data = await seekdb_client.query(
-            "skills", filters=filters, limit=limit, offset=offset
+        (skills_data, next_cursor), total = await asyncio.gather(
+            seekdb_client.query_page(
+                "skills",
+                order_by=SKILL_LISTING_ORDER,
+                filters=filters,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+            ),
+            seekdb_client.count("skills", filters=filters, cached=True),
         )
 
-        # Get total count
-        all_skills = await seekdb_client.query("skills", filters=filters, limit=10000)
-        total = len(all_skills)
-
         skills = [self._parse_skill(s) for s in skills_data]
         logger.debug("Listed skills", count=len(skills), total=total, page=page)
 
@@ -152,6 +211,7 @@ class SkillService:
             limit=limit,
             total=total,
             total_pages=(total + limit - 1) // limit if limit > 0 else 0,
+            next_cursor=next_cursor,
         )
 
         return skills, pagination
@@ -162,32 +222,45 @@ class SkillService:
         platforms: list[PlatformType] | None = None,
         page: int = 1,
         limit: int = 20,
-    ) -> list[SkillSearchResult]:
+        cursor: str | None = None,
+        mode: str = "semantic",
+    ) -> tuple[list[SkillSearchResult], str | None]:
         """
         Search skills using semantic vector search.
         
         Falls back to keyword matching if vector search is unavailable.
+
+        Args:
+            query: Search query text
+            platforms: Optional platform filters
+            page: Page number, used when no cursor is given
+            limit: Page size
+            cursor: Cursor returned with the previous page
+            mode: "semantic" or "hybrid" (semantic + keyword fusion)
+
+        Returns:
+            Page of results and the cursor for the next page (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid or has expired
         """
-        # Use vector search service for semantic search
-        results = await vector_search_service.search_skills_semantic(
+        results, next_cursor = await vector_search_service.search_skills_page(
             query=query,
             platforms=platforms,
-            top_k=limit,
+            limit=limit,
+            page=page,
+            cursor=cursor,
+            mode=mode,
         )
         
-        # Apply pagination
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_results = results[start_idx:end_idx]
-        
         logger.info(
             "Skills searched",
             query=query[:50],
-            total_results=len(results),
-            returned=len(paginated_results),
+            returned=len(results),
+            has_more=next_cursor is not None,
         )
         
-        return paginated_results
+        return results, next_cursor
 
     async def get_similar_skills(self, skill_id: str, limit: int = 5) -> list[SkillSearchResult]:
         """
@@ -203,32 +276,62 @@ class SkillService:
         return await vector_search_service.find_similar_skills(skill_id, top_k=limit)
 
     async def increment_usage(self, skill_id: str) -> None:
-        """Increment skill usage count"""
+        """
+        Increment skill usage count.
+
+        The count is mirrored into skill_vectors for popularity ranking. The
+        catalog generation is left alone, so cached searches pick up the new
+        count when they expire.
+        """
         skill_data = await seekdb_client.get("skills", skill_id)
         if skill_data:
             new_count = skill_data.get("usage_count", 0) + 1
             await seekdb_client.update("skills", skill_id, {"usage_count": new_count})
+            await vector_search_service.sync_usage_count(skill_id, new_count)
 
     async def reindex_all_skills(self) -> int:
         """
         Reindex all skills for vector search.
         
-        Useful for migrating existing skills or rebuilding indexes.
+        Useful for migrating existing skills or rebuilding indexes. Skills are
+        streamed a chunk at a time, so memory stays flat for any catalog size.
         
         Returns:
             Number of successfully indexed skills
         """
-        all_skills_data = await seekdb_client.query("skills", filters={}, limit=10000)
-        
+        total = 0
         success_count = 0
-        for skill_data in all_skills_data:
-            skill = self._parse_skill(skill_data)
-            if await vector_search_service.index_skill(skill):
-                success_count += 1
+        scan = seekdb_client.scan("skills", chunk_size=settings.seekdb_bulk_batch_size)
+        async with aclosing(scan) as chunks:
+            async for rows in chunks:
+                total += len(rows)
+                skills = [self._parse_skill(s) for s in rows]
+                success_count += await vector_search_service.index_skills_batch(
+                    skills, refresh_neighbors=False
+                )
         
-        logger.info("All skills reindexed", total=len(all_skills_data), success=success_count)
+        vector_search_service.bump_catalog_generation()
+        logger.info("All skills reindexed", total=total, success=success_count)
         return success_count
 
+    def _build_skill_row(self, skill_data: SkillCreate, developer_id: str) -> dict:
+        """Build the skills row for a new skill"""
+        now = datetime.now(UTC)
+        return {
+            "skill_id": f"sk_{uuid4().hex[:12]}",
+            "skill_name": skill_data.skill_name,
+            "platform": skill_data.platform.value,
+            "developer": developer_id,
+            "description": skill_data.description,
+            "capabilities": skill_data.capabilities,
+            "tags": skill_data.tags,
+            "pricing": skill_data.pricing.model_dump(),
+            "rating": 0.0,
+            "usage_count": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     def _parse_skill(self, data: dict) -> Skill:
         """Parse skill data from database format to model"""
         return Skill(
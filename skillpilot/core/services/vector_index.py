@@ -0,0 +1,274 @@
+"""In-process exact vector index over skill embeddings"""
+
+import time
+from typing import Any
+
+import numpy as np
+
+from skillpilot.core.services.search_filters import ColumnarFilters
+from skillpilot.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class InMemoryVectorIndex:
+    """
+    Exact cosine-similarity index kept in process memory.
+
+    Vectors are L2-normalized into one contiguous float32 matrix, so a search
+    is a single matrix-vector product followed by ``argpartition`` for the
+    top-k. Filterable skill attributes are kept column-wise next to the rows
+    as typed arrays (see ``ColumnarFilters``), so filter conditions in the
+    ``skill_vectors`` dialect are evaluated with vectorized comparisons.
+    Deletes move the last row into the freed slot to keep the matrix dense.
+    """
+
+    CATEGORY_COLUMNS = ("platform", "pricing_type")
+    NUMERIC_COLUMNS = ("rating", "usage_count", "updated_at")
+    SET_COLUMNS = ("tags", "capabilities")
+    FILTER_COLUMNS = (*CATEGORY_COLUMNS, *NUMERIC_COLUMNS, *SET_COLUMNS)
+    # Attributes returned with each hit for ranking
+    RESULT_COLUMNS = ("rating", "usage_count", "updated_at")
+
+    def __init__(self, dimension: int | None = None, initial_capacity: int = 1024):
+        self.dimension = dimension
+        self.initial_capacity = initial_capacity
+        self.loaded = False
+
+        self._matrix: np.ndarray | None = None
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._filters = self._new_filters()
+
+        self._searches = 0
+        self._search_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, skill_id: str) -> bool:
+        return skill_id in self._rows
+
+    def upsert(
+        self, skill_id: str, vector: list[float], attributes: dict[str, Any] | None = None
+    ) -> None:
+        """
+        Insert or replace a skill vector.
+
+        Args:
+            skill_id: Skill ID
+            vector: Embedding vector
+            attributes: Attributes (FILTER_COLUMNS) to keep next to the vector
+
+        Raises:
+            ValueError: If the vector dimension doesn't match the index
+        """
+        normalized = self._normalize(vector)
+        attributes = attributes or {}
+
+        row = self._rows.get(skill_id)
+        if row is None:
+            row = len(self._ids)
+            self._ensure_capacity(row + 1)
+            self._ids.append(skill_id)
+            self._rows[skill_id] = row
+            self._filters.append(attributes)
+        else:
+            self.update_attributes(skill_id, attributes)
+        self._matrix[row] = normalized
+
+    def upsert_many(self, rows: list[dict[str, Any]]) -> int:
+        """
+        Insert or replace skill_vectors rows.
+
+        Args:
+            rows: Rows with ``skill_id``, ``skill_vector`` and attribute columns
+
+        Returns:
+            Number of rows indexed (rows without a usable vector are skipped)
+        """
+        indexed = 0
+        for row in rows:
+            vector = row.get("skill_vector")
+            if not row.get("skill_id") or not vector:
+                continue
+            try:
+                self.upsert(row["skill_id"], vector, row)
+                indexed += 1
+            except ValueError as e:
+                logger.warning("Skipping vector", skill_id=row["skill_id"], error=str(e))
+        return indexed
+
+    def update_attributes(self, skill_id: str, attributes: dict[str, Any]) -> bool:
+        """
+        Replace the filterable attributes of an indexed skill.
+
+        Args:
+            skill_id: Skill ID
+            attributes: Attribute values to set (missing columns are left as is)
+
+        Returns:
+            True if the skill is indexed
+        """
+        row = self._rows.get(skill_id)
+        if row is None:
+            return False
+        self._filters.update(row, attributes)
+        return True
+
+    def delete(self, skill_id: str) -> bool:
+        """
+        Remove a skill vector.
+
+        Args:
+            skill_id: Skill ID
+
+        Returns:
+            True if the skill was indexed
+        """
+        row = self._rows.pop(skill_id, None)
+        if row is None:
+            return False
+
+        last = len(self._ids) - 1
+        if row != last:
+            # Move the last row into the hole to keep rows contiguous
+            moved_id = self._ids[last]
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+
+        self._ids.pop()
+        self._filters.delete(row)
+        return True
+
+    def get_vector(self, skill_id: str) -> np.ndarray | None:
+        """Get the normalized vector of an indexed skill"""
+        row = self._rows.get(skill_id)
+        return None if row is None else self._matrix[row].copy()
+
+    def get_attributes(self, skill_id: str) -> dict[str, Any] | None:
+        """Get the stored attributes of an indexed skill"""
+        row = self._rows.get(skill_id)
+        if row is None:
+            return None
+        return {column: self._filters.get(row, column) for column in self.FILTER_COLUMNS}
+
+    def search(
+        self,
+        query_vector: list[float] | np.ndarray,
+        top_k: int,
+        filter_conditions: dict | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Find the most similar skills.
+
+        Args:
+            query_vector: Query embedding
+            top_k: Number of results
+            filter_conditions: Optional filters in the skill_vectors dialect
+
+        Returns:
+            Results shaped like ``SeekDBClient.vector_search`` rows
+            (``skill_id``, ``similarity`` and RESULT_COLUMNS), most similar first
+        """
+        size = len(self._ids)
+        if size == 0 or top_k <= 0:
+            return []
+
+        start = time.perf_counter()
+        query = np.asarray(query_vector, dtype=np.float32)
+        if query.shape != (self.dimension,):
+            raise ValueError(
+                f"Query dimension {query.shape[-1]} does not match index dimension {self.dimension}"
+            )
+        norm = float(np.linalg.norm(query))
+        if norm == 0:
+            return []
+
+        scores = self._matrix[:size] @ (query / norm)
+
+        candidates = size
+        mask = self._filters.mask(filter_conditions)
+        if mask is not None:
+            candidates = int(mask.sum())
+            if candidates == 0:
+                return []
+            scores = np.where(mask, scores, -np.inf)
+
+        k = min(top_k, candidates)
+        if k < size:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(size)
+        top = top[np.argsort(-scores[top], kind="stable")][:k]
+
+        self._searches += 1
+        self._search_seconds += time.perf_counter() - start
+        return [
+            {
+                "skill_id": self._ids[i],
+                "similarity": float(scores[i]),
+                **{column: self._filters.get(i, column) for column in self.RESULT_COLUMNS},
+            }
+            for i in top
+        ]
+
+    def clear(self) -> None:
+        """Drop all vectors"""
+        self._matrix = None
+        self._ids = []
+        self._rows = {}
+        self._filters = self._new_filters()
+        self.loaded = False
+
+    def stats(self) -> dict:
+        """
+        Get index statistics.
+
+        Returns:
+            Size, dimension, memory use and search latency counters
+        """
+        return {
+            "loaded": self.loaded,
+            "size": len(self._ids),
+            "dimension": self.dimension,
+            "memory_bytes": int(self._matrix.nbytes) if self._matrix is not None else 0,
+            "searches": self._searches,
+            "avg_search_ms": (
+                self._search_seconds / self._searches * 1000 if self._searches else 0.0
+            ),
+        }
+
+    def _new_filters(self) -> ColumnarFilters:
+        return ColumnarFilters(
+            category_columns=self.CATEGORY_COLUMNS,
+            numeric_columns=self.NUMERIC_COLUMNS,
+            set_columns=self.SET_COLUMNS,
+            initial_capacity=self.initial_capacity,
+        )
+
+    def _normalize(self, vector: list[float]) -> np.ndarray:
+        """Validate and L2-normalize a vector"""
+        array = np.asarray(vector, dtype=np.float32)
+        if array.ndim != 1:
+            raise ValueError("Vector must be one-dimensional")
+        if self.dimension is None:
+            self.dimension = array.shape[0]
+        elif array.shape[0] != self.dimension:
+            raise ValueError(
+                f"Vector dimension {array.shape[0]} does not match index dimension {self.dimension}"
+            )
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm > 0 else array
+
+    def _ensure_capacity(self, size: int) -> None:
+        """Grow the matrix geometrically to hold ``size`` rows"""
+        if self._matrix is None:
+            capacity = max(self.initial_capacity, size)
+            self._matrix = np.zeros((capacity, self.dimension), dtype=np.float32)
+        elif size > self._matrix.shape[0]:
+            capacity = max(size, self._matrix.shape[0] * 2)
+            grown = np.zeros((capacity, self.dimension), dtype=np.float32)
+            grown[: len(self._ids)] = self._matrix[: len(self._ids)]
+            self._matrix = grown
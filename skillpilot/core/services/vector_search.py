@@ -1,16 +1,80 @@
 """Vector Search Service for semantic skill matching"""
 
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict
+from contextlib import aclosing
 from datetime import UTC, datetime
 from uuid import uuid4
 
+import numpy as np
+
+from skillpilot.core.config import settings
 from skillpilot.core.models.common import PlatformType
-from skillpilot.core.models.skill import Skill, SkillSearchResult
+from skillpilot.core.models.skill import (
+    ScoreBreakdown,
+    Skill,
+    SkillSearchQuery,
+    SkillSearchResult,
+)
 from skillpilot.core.services.embedding import embedding_service
+from skillpilot.core.services.keyword_index import KeywordIndex
+from skillpilot.core.services.ranking import (
+    blend_quality_scores,
+    maximal_marginal_relevance,
+    reciprocal_rank_fusion,
+    weighted_score_fusion,
+)
+from skillpilot.core.services.similarity_graph import similarity_graph_service
+from skillpilot.core.services.vector_index import InMemoryVectorIndex
+from skillpilot.core.utils.helpers import decode_cursor, encode_cursor, generate_id
 from skillpilot.core.utils.logger import get_logger
+from skillpilot.core.utils.timing import stage_timer
+from skillpilot.core.utils.ttl_cache import TTLCache
 from skillpilot.db.seekdb import seekdb_client
 
 logger = get_logger(__name__)
 
+# skills columns the keyword index needs: indexed text and filter attributes
+KEYWORD_INDEX_COLUMNS = (
+    "skill_id",
+    "skill_name",
+    "description",
+    "capabilities",
+    "tags",
+    "platform",
+    "pricing",
+    "rating",
+    "usage_count",
+    "updated_at",
+)
+
+
+def _as_float(value) -> float:
+    """Convert a stored numeric attribute, NaN if missing"""
+    try:
+        return float(value) if value is not None else float("nan")
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _as_datetime(value) -> datetime | None:
+    """Convert a stored timestamp (datetime, ISO string or epoch seconds) to aware UTC"""
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    elif isinstance(value, int | float):
+        return datetime.fromtimestamp(value, UTC)
+    else:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
 
 class VectorSearchService:
     """
@@ -22,9 +86,40 @@ class VectorSearchService:
     - Task-to-skill matching for orchestration
     """
 
+    # Max distinct filter combinations whose overfetch factor is remembered
+    MAX_OVERFETCH_KEYS = 256
+
     def __init__(self):
         self.top_k_default = 10
         self.similarity_threshold = 0.5
+        self.overfetch_default = settings.search_overfetch_default
+        self.overfetch_max_window = settings.search_overfetch_max_window
+        self.overfetch_smoothing = settings.search_overfetch_smoothing
+        # filter key -> {"factor", "queries", "expansions"}
+        self._overfetch: OrderedDict[str, dict] = OrderedDict()
+        self._candidates_fetched = 0
+        self._hydrated = 0
+        # In-process exact index: primary backend or fallback during SeekDB outages
+        self.backend = settings.vector_backend
+        self.local_index = (
+            InMemoryVectorIndex()
+            if settings.vector_local_index_enabled or self.backend == "local"
+            else None
+        )
+        self._local_fallbacks = 0
+        # BM25 keyword index over skill text, used when vector search is unavailable
+        self.keyword_index = KeywordIndex()
+        # Normalized search request -> (catalog generation, results)
+        self._catalog_generation = 0
+        self._result_cache = TTLCache(
+            max_entries=settings.search_result_cache_size,
+            ttl_seconds=settings.search_result_cache_ttl_seconds,
+        )
+        # search_id -> ranked candidates of a paginated search
+        self._search_sessions = TTLCache(
+            max_entries=settings.search_cursor_max_sessions,
+            ttl_seconds=settings.search_cursor_ttl_seconds,
+        )
 
     async def index_skill(self, skill: Skill) -> bool:
         """
@@ -44,13 +139,11 @@ class VectorSearchService:
             embedding = await embedding_service.generate_embedding(searchable_text)
             
             # Store skill vector
-            vector_data = {
-                "skill_id": skill.skill_id,
-                "skill_vector": embedding,
-                "capability_vectors": {},  # Can store per-capability vectors
-            }
+            vector_data = self._build_vector_row(skill, embedding)
             
             await seekdb_client.insert("skill_vectors", vector_data)
+            self._index_locally(vector_data)
+            await self._refresh_neighbors(skill.skill_id, embedding)
             logger.info("Skill indexed for vector search", skill_id=skill.skill_id)
             return True
             
@@ -58,23 +151,57 @@ class VectorSearchService:
             logger.error("Failed to index skill", skill_id=skill.skill_id, error=str(e))
             return False
 
-    async def index_skills_batch(self, skills: list[Skill]) -> int:
+    async def index_skills_batch(
+        self, skills: list[Skill], refresh_neighbors: bool = True
+    ) -> int:
         """
         Index multiple skills in batch.
         
+        Vectors are written with bulk upserts, so re-indexing a skill
+        replaces its vector.
+
         Args:
             skills: List of skills to index
+            refresh_neighbors: Update the similarity graph for each skill;
+                bulk loads skip this and let lists fill on first lookup
+                (or run scripts/compute_similarity.py)
             
         Returns:
             Number of successfully indexed skills
         """
-        success_count = 0
-        for skill in skills:
-            if await self.index_skill(skill):
-                success_count += 1
-        
-        logger.info("Batch skill indexing completed", indexed=success_count, total=len(skills))
-        return success_count
+        if not skills:
+            return 0
+
+        # Embed all skills together so the provider sees a few large requests
+        texts = [self._create_skill_search_text(skill) for skill in skills]
+        try:
+            embeddings = await embedding_service.generate_embeddings_batch(texts)
+        except Exception as e:
+            logger.error("Batch embedding failed", total=len(skills), error=str(e))
+            return 0
+
+        rows = [
+            self._build_vector_row(skill, embedding)
+            for skill, embedding in zip(skills, embeddings, strict=True)
+        ]
+        result = await seekdb_client.upsert_many("skill_vectors", rows)
+        for skill_id, error in result.failed.items():
+            logger.error("Failed to index skill", skill_id=skill_id, error=error)
+
+        indexed = [row for row in rows if row["skill_id"] not in result.failed]
+        if self.local_index is not None:
+            self.local_index.upsert_many(indexed)
+        if refresh_neighbors:
+            for row in indexed:
+                await self._refresh_neighbors(row["skill_id"], row["skill_vector"])
+
+        logger.info(
+            "Batch skill indexing completed",
+            indexed=len(indexed),
+            total=len(skills),
+            round_trips=result.round_trips,
+        )
+        return len(indexed)
 
     async def search_skills_semantic(
         self,
@@ -82,63 +209,85 @@ class VectorSearchService:
         platforms: list[PlatformType] | None = None,
         top_k: int | None = None,
         threshold: float | None = None,
+        pricing_types: list[str] | None = None,
+        min_rating: float | None = None,
+        tags: list[str] | None = None,
+        mmr_lambda: float | None = None,
+        ranking: str | None = None,
     ) -> list[SkillSearchResult]:
         """
         Search skills using semantic similarity.
         
+        Filters are pushed down into the vector query via the attributes
+        denormalized into skill_vectors.
+
         Args:
             query: Search query text
             platforms: Optional platform filters
             top_k: Number of results to return
             threshold: Minimum similarity threshold
+            pricing_types: Optional pricing type filters (free, subscription, per_use)
+            min_rating: Optional minimum rating
+            tags: Optional tags (matches skills having any of them)
+            mmr_lambda: Diversify results with MMR (1.0 = relevance only,
+                0.0 = diversity only); None disables re-ranking
+            ranking: "similarity" or "blended" (similarity plus popularity,
+                rating and recency, with a score breakdown per result);
+                defaults to settings
             
         Returns:
             List of skill search results with similarity scores
         """
         top_k = top_k or self.top_k_default
         threshold = threshold or self.similarity_threshold
+
+        ranking = ranking or settings.search_ranking
+        cache_key = self._result_cache_key(
+            self._semantic_mode(ranking, mmr_lambda),
+            query,
+            platforms,
+            top_k,
+            threshold,
+            pricing_types,
+            min_rating,
+            tags,
+        )
+        cached = self._get_cached_results(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             # Generate query embedding
-            query_embedding = await embedding_service.generate_embedding(query)
+            with stage_timer("embed"):
+                query_embedding = await embedding_service.generate_embedding(query)
             
             # Build filter conditions
-            filter_conditions = None
-            if platforms:
-                platform_values = [p.value for p in platforms]
-                filter_conditions = {"platform": platform_values}
-            
-            # Perform vector search
-            results = await seekdb_client.vector_search(
-                table="skill_vectors",
-                vector_column="skill_vector",
-                query_vector=query_embedding,
-                top_k=top_k * 2,  # Get more results to filter by threshold
-                filter_conditions=filter_conditions,
+            filter_conditions = self._build_filter_conditions(
+                platforms, pricing_types, min_rating, tags
             )
             
-            # Parse results and apply threshold
-            skill_results = []
-            for result in results:
-                similarity = result.get("similarity", 0.0)
-                if similarity >= threshold:
-                    skill_id = result.get("skill_id")
-                    if skill_id:
-                        skill = await self._get_skill_by_id(skill_id)
-                        if skill:
-                            skill_results.append(
-                                SkillSearchResult(**skill.model_dump(), similarity=similarity)
-                            )
-            
-            # Sort by similarity and limit
-            skill_results.sort(key=lambda x: x.similarity, reverse=True)
-            skill_results = skill_results[:top_k]
+            # Fetch candidates passing the threshold with an adaptive window
+            rows: dict[str, dict] = {}
+            with stage_timer("ann"):
+                hits = await self._fetch_candidates(
+                    query_embedding,
+                    self._semantic_candidates(top_k, ranking, mmr_lambda),
+                    threshold,
+                    filter_conditions,
+                    rows=rows,
+                )
+            hits, breakdowns = await self._rerank(hits, rows, top_k, ranking, mmr_lambda)
+
+            # Hydrate the surviving hits in one multi-get
+            with stage_timer("hydrate"):
+                skill_results = await self._hydrate_results(hits, breakdowns)
             
             logger.info(
                 "Semantic skill search completed",
                 query=query[:50],
                 results_count=len(skill_results),
             )
+            self._cache_results(cache_key, skill_results)
             return skill_results
             
         except Exception as e:
@@ -146,12 +295,542 @@ class VectorSearchService:
             # Fallback to keyword search
             return await self._fallback_keyword_search(query, platforms, top_k)
 
+    async def search_skills_hybrid(
+        self,
+        query: str,
+        platforms: list[PlatformType] | None = None,
+        top_k: int | None = None,
+        threshold: float | None = None,
+        pricing_types: list[str] | None = None,
+        min_rating: float | None = None,
+        tags: list[str] | None = None,
+        fusion: str | None = None,
+    ) -> list[SkillSearchResult]:
+        """
+        Search skills with semantic and keyword retrieval combined.
+
+        The vector query and the BM25 keyword query run concurrently and their
+        rankings are fused, so exact product terms (e.g. "pdf", "gradio") rank
+        well even when embeddings miss them. Similarity is the fused score.
+
+        Args:
+            query: Search query text
+            platforms: Optional platform filters
+            top_k: Number of results to return
+            threshold: Minimum similarity for semantic candidates
+            pricing_types: Optional pricing type filters (free, subscription, per_use)
+            min_rating: Optional minimum rating
+            tags: Optional tags (matches skills having any of them)
+            fusion: "rrf" or "weighted" (defaults to settings)
+
+        Returns:
+            List of skill search results ranked by fused score
+        """
+        top_k = top_k or self.top_k_default
+        threshold = threshold or self.similarity_threshold
+        fusion = fusion or settings.search_hybrid_fusion
+
+        cache_key = self._result_cache_key(
+            f"hybrid:{fusion}", query, platforms, top_k, threshold, pricing_types, min_rating, tags
+        )
+        cached = self._get_cached_results(cache_key)
+        if cached is not None:
+            return cached
+
+        filter_conditions = self._build_filter_conditions(
+            platforms, pricing_types, min_rating, tags
+        )
+        hits, _ = await self._hybrid_hits(query, top_k, threshold, filter_conditions, fusion)
+        with stage_timer("hydrate"):
+            skill_results = await self._hydrate_results(hits)
+
+        logger.info(
+            "Hybrid skill search completed",
+            query=query[:50],
+            results_count=len(skill_results),
+        )
+        self._cache_results(cache_key, skill_results)
+        return skill_results
+
+    def bump_catalog_generation(self) -> int:
+        """
+        Mark the skill catalog as changed.
+
+        Cached search results from earlier generations are never served
+        again, so writes invalidate the cache without scanning it. Changes
+        made by other processes are only picked up once entries expire.
+
+        Returns:
+            The new generation
+        """
+        self._catalog_generation += 1
+        return self._catalog_generation
+
+    def _semantic_mode(self, ranking: str, mmr_lambda: float | None) -> str:
+        """Result cache mode of a semantic search with the given re-ranking"""
+        mode = f"semantic:{ranking}"
+        if mmr_lambda is not None:
+            mode += f":mmr={mmr_lambda}"
+        return mode
+
+    def _semantic_candidates(self, top_k: int, ranking: str, mmr_lambda: float | None) -> int:
+        """Number of candidates to fetch so re-ranking has room to reorder"""
+        candidates = top_k
+        if mmr_lambda is not None:
+            candidates = top_k * settings.search_mmr_candidate_factor
+        if ranking == "blended":
+            candidates = max(candidates, top_k * settings.search_ranking_candidate_factor)
+        return candidates
+
+    async def _rerank(
+        self,
+        hits: list[tuple[str, float]],
+        rows: dict[str, dict],
+        top_k: int,
+        ranking: str,
+        mmr_lambda: float | None,
+    ) -> tuple[list[tuple[str, float]], dict[str, ScoreBreakdown] | None]:
+        """
+        Apply blended ranking and MMR to semantic candidates.
+
+        Returns:
+            Up to top_k hits and their score breakdowns (None unless blended)
+        """
+        breakdowns = None
+        if ranking == "blended":
+            with stage_timer("rank"):
+                hits, breakdowns = self._rank_hits(hits, rows)
+        if mmr_lambda is not None:
+            with stage_timer("mmr"):
+                hits = await self._diversify(hits, top_k, mmr_lambda)
+        return hits[:top_k], breakdowns
+
+    def _result_cache_key(
+        self,
+        mode: str,
+        query: str,
+        platforms: list[PlatformType] | None,
+        top_k: int,
+        threshold: float,
+        pricing_types: list[str] | None,
+        min_rating: float | None,
+        tags: list[str] | None,
+    ) -> str:
+        """Key a search by its normalized request"""
+        return json.dumps(
+            [
+                mode,
+                " ".join(query.split()),
+                sorted(p.value for p in platforms or []),
+                top_k,
+                threshold,
+                sorted(pricing_types or []),
+                min_rating,
+                sorted(tags or []),
+            ]
+        )
+
+    def _get_cached_results(self, cache_key: str) -> list[SkillSearchResult] | None:
+        """
+        Get cached results for the current catalog generation.
+
+        Results are stored and handed out as deep copies, so callers can
+        modify what they get without corrupting later cache hits.
+        """
+        if not settings.search_result_cache_enabled:
+            return None
+        entry = self._result_cache.get(cache_key)
+        if entry is None:
+            return None
+        generation, results = entry
+        if generation != self._catalog_generation:
+            self._result_cache.pop(cache_key)
+            return None
+        return [result.model_copy(deep=True) for result in results]
+
+    def _cache_results(self, cache_key: str, results: list[SkillSearchResult]) -> None:
+        if settings.search_result_cache_enabled:
+            frozen = tuple(result.model_copy(deep=True) for result in results)
+            self._result_cache.set(cache_key, (self._catalog_generation, frozen))
+
+    async def _hybrid_hits(
+        self,
+        query: str,
+        top_k: int,
+        threshold: float,
+        filter_conditions: dict | None,
+        fusion: str | None = None,
+    ) -> tuple[list[tuple[str, float]], list[float] | None]:
+        """
+        Run semantic and keyword retrieval concurrently and fuse the rankings.
+
+        If one side fails the other is used alone.
+
+        Returns:
+            Up to top_k fused (skill_id, score) hits and the query embedding
+            (None if the semantic side failed)
+
+        Raises:
+            Exception: The semantic error if both sides fail
+        """
+        candidates = top_k * settings.search_hybrid_candidate_factor
+
+        async def semantic() -> tuple[list[float], list[tuple[str, float]]]:
+            with stage_timer("embed"):
+                query_embedding = await embedding_service.generate_embedding(query)
+            with stage_timer("ann"):
+                hits = await self._fetch_candidates(
+                    query_embedding, candidates, threshold, filter_conditions
+                )
+            return query_embedding, hits
+
+        async def keyword() -> list[tuple[str, float]]:
+            if not self.keyword_index.loaded:
+                await self.load_keyword_index()
+            with stage_timer("keyword"):
+                return self.keyword_index.search(query, candidates, filter_conditions)
+
+        semantic_result, keyword_result = await asyncio.gather(
+            semantic(), keyword(), return_exceptions=True
+        )
+        if isinstance(semantic_result, Exception) and isinstance(keyword_result, Exception):
+            raise semantic_result
+
+        query_embedding, semantic_hits = None, []
+        if isinstance(semantic_result, Exception):
+            logger.warning("Hybrid search semantic stage failed", error=str(semantic_result))
+        else:
+            query_embedding, semantic_hits = semantic_result
+        keyword_hits = []
+        if isinstance(keyword_result, Exception):
+            logger.warning("Hybrid search keyword stage failed", error=str(keyword_result))
+        else:
+            keyword_hits = keyword_result
+
+        with stage_timer("fusion"):
+            weights = [settings.search_hybrid_semantic_weight, settings.search_hybrid_keyword_weight]
+            if (fusion or settings.search_hybrid_fusion) == "weighted":
+                fused = weighted_score_fusion([semantic_hits, keyword_hits], weights)
+            else:
+                fused = reciprocal_rank_fusion(
+                    [semantic_hits, keyword_hits], weights, k=settings.search_hybrid_rrf_k
+                )
+        return fused[:top_k], query_embedding
+
+    async def search_skills_batch(
+        self, queries: list[SkillSearchQuery]
+    ) -> list[list[SkillSearchResult]]:
+        """
+        Run several semantic searches at once.
+
+        Uncached queries are embedded with one batch call, their vector
+        queries run concurrently, and all hits are hydrated with one multi-get
+        over the union of skill ids. Each query is ranked, diversified and
+        cached exactly as ``search_skills_semantic`` would. A query whose
+        vector search fails falls back to keyword search without failing the
+        batch.
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            Results per query, in request order
+        """
+        results: list[list[SkillSearchResult] | None] = [None] * len(queries)
+        rankings = [request.ranking or settings.search_ranking for request in queries]
+        cache_keys = []
+        pending = []
+        for position, request in enumerate(queries):
+            cache_key = self._result_cache_key(
+                self._semantic_mode(rankings[position], request.mmr_lambda),
+                request.query,
+                request.platforms,
+                request.top_k,
+                request.threshold or self.similarity_threshold,
+                request.pricing_types,
+                request.min_rating,
+                request.tags,
+            )
+            cache_keys.append(cache_key)
+            cached = self._get_cached_results(cache_key)
+            if cached is not None:
+                results[position] = cached
+            else:
+                pending.append(position)
+
+        if pending:
+            texts = list(dict.fromkeys(queries[position].query for position in pending))
+            try:
+                with stage_timer("embed"):
+                    embeddings = await embedding_service.generate_embeddings_batch(texts)
+                vectors = dict(zip(texts, embeddings, strict=True))
+            except Exception as e:
+                logger.error("Batch query embedding failed", queries=len(texts), error=str(e))
+                vectors = {}
+
+            semaphore = asyncio.Semaphore(settings.search_batch_concurrency)
+
+            async def fetch(
+                position: int,
+            ) -> tuple[list[tuple[str, float]], dict[str, ScoreBreakdown] | None]:
+                request = queries[position]
+                if request.query not in vectors:
+                    raise ValueError("Query embedding unavailable")
+                filter_conditions = self._build_filter_conditions(
+                    request.platforms, request.pricing_types, request.min_rating, request.tags
+                )
+                ranking = rankings[position]
+                rows: dict[str, dict] = {}
+                async with semaphore:
+                    hits = await self._fetch_candidates(
+                        vectors[request.query],
+                        self._semantic_candidates(request.top_k, ranking, request.mmr_lambda),
+                        request.threshold or self.similarity_threshold,
+                        filter_conditions,
+                        rows=rows,
+                    )
+                return await self._rerank(hits, rows, request.top_k, ranking, request.mmr_lambda)
+
+            with stage_timer("ann"):
+                fetched = await asyncio.gather(
+                    *(fetch(position) for position in pending), return_exceptions=True
+                )
+
+            succeeded = [
+                (position, ranked)
+                for position, ranked in zip(pending, fetched, strict=True)
+                if not isinstance(ranked, Exception)
+            ]
+            with stage_timer("hydrate"):
+                hydrated = await self._hydrate_many(
+                    [hits for _, (hits, _) in succeeded],
+                    [breakdowns for _, (_, breakdowns) in succeeded],
+                )
+            for (position, _), skill_results in zip(succeeded, hydrated, strict=True):
+                results[position] = skill_results
+                self._cache_results(cache_keys[position], skill_results)
+
+            for position, hits in zip(pending, fetched, strict=True):
+                if isinstance(hits, Exception):
+                    request = queries[position]
+                    logger.error(
+                        "Batch semantic search failed", query=request.query[:50], error=str(hits)
+                    )
+                    results[position] = await self._fallback_keyword_search(
+                        request.query, request.platforms, request.top_k
+                    )
+
+        logger.info(
+            "Batch semantic search completed", queries=len(queries), uncached=len(pending)
+        )
+        return results
+
+    async def search_skills_page(
+        self,
+        query: str,
+        platforms: list[PlatformType] | None = None,
+        limit: int = 20,
+        page: int = 1,
+        cursor: str | None = None,
+        threshold: float | None = None,
+        mode: str = "semantic",
+    ) -> tuple[list[SkillSearchResult], str | None]:
+        """
+        Search skills, one page at a time.
+
+        The first request embeds the query once and caches the query vector
+        and ranked candidate ids under an opaque cursor; later pages are served
+        from that list with only a hydration fetch.
+
+        Args:
+            query: Search query text
+            platforms: Optional platform filters
+            limit: Page size
+            page: Page number, used when no cursor is given
+            cursor: Cursor returned with the previous page
+            threshold: Minimum similarity threshold
+            mode: "semantic" or "hybrid" (semantic + keyword fusion)
+
+        Returns:
+            Page of results and the cursor for the next page (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid or has expired
+        """
+        if cursor:
+            state = decode_cursor(cursor)
+            session = self._search_sessions.get(str(state.get("s")))
+            if session is None:
+                raise ValueError("Search cursor is invalid or has expired")
+            search_id, offset = state["s"], int(state.get("o", 0))
+            limit = int(state.get("l", limit))
+            query = session.get("query", query)
+        else:
+            threshold = threshold or self.similarity_threshold
+            offset = (page - 1) * limit
+            candidates = max(settings.search_cursor_max_candidates, offset + limit)
+            filter_conditions = self._build_filter_conditions(platforms)
+            try:
+                if mode == "hybrid":
+                    hits, query_embedding = await self._hybrid_hits(
+                        query, candidates, threshold, filter_conditions
+                    )
+                else:
+                    with stage_timer("embed"):
+                        query_embedding = await embedding_service.generate_embedding(query)
+                    with stage_timer("ann"):
+                        hits = await self._fetch_candidates(
+                            query_embedding, candidates, threshold, filter_conditions
+                        )
+            except Exception as e:
+                logger.error("Semantic search failed", query=query[:50], error=str(e))
+                results = await self._fallback_keyword_search(query, platforms, offset + limit)
+                return results[offset:], None
+
+            search_id = generate_id("srch_")
+            session = {
+                "query": query,
+                "query_vector": query_embedding,
+                "threshold": threshold,
+                "filter_conditions": filter_conditions,
+                "hits": hits,
+                # Fused rankings can't be widened with the vector query alone
+                "complete": mode == "hybrid" or len(hits) < candidates,
+            }
+            self._search_sessions.set(search_id, session)
+
+        if offset + limit > len(session["hits"]) and not session["complete"]:
+            # Paged past the cached candidates: widen with the cached query vector
+            wanted = offset + limit + settings.search_cursor_max_candidates
+            session["hits"] = await self._fetch_candidates(
+                session["query_vector"],
+                wanted,
+                session["threshold"],
+                session["filter_conditions"],
+            )
+            session["complete"] = len(session["hits"]) < wanted
+
+        page_hits = session["hits"][offset : offset + limit]
+        with stage_timer("hydrate"):
+            results = await self._hydrate_results(page_hits)
+
+        next_offset = offset + limit
+        next_cursor = None
+        if next_offset < len(session["hits"]):
+            next_cursor = encode_cursor({"s": search_id, "o": next_offset, "l": limit})
+
+        logger.info(
+            "Semantic search page served",
+            query=query[:50],
+            offset=offset,
+            returned=len(results),
+            candidates=len(session["hits"]),
+        )
+        return results, next_cursor
+
+    async def _fetch_candidates(
+        self,
+        query_vector: list[float],
+        top_k: int,
+        threshold: float,
+        filter_conditions: dict | None,
+        rows: dict[str, dict] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Fetch up to top_k (skill_id, similarity) hits above the threshold.
+
+        If ``rows`` is given it is filled with each hit's vector query row,
+        which carries the attributes denormalized into skill_vectors.
+
+        Filtered vector queries can return fewer rows than requested (the
+        filter is applied to the nearest candidates), so the window starts at
+        top_k times the overfetch factor learned for this filter combination
+        and doubles until top_k hits pass the threshold, a result falls below
+        the threshold (no later result can pass), a larger window yields no new
+        rows, or the max window is reached.
+        """
+        filter_key = json.dumps(filter_conditions, sort_keys=True) if filter_conditions else "none"
+        entry = self._overfetch.get(filter_key)
+        if entry is None:
+            entry = {"factor": self.overfetch_default, "queries": 0, "expansions": 0}
+            self._overfetch[filter_key] = entry
+            if len(self._overfetch) > self.MAX_OVERFETCH_KEYS:
+                self._overfetch.popitem(last=False)
+        self._overfetch.move_to_end(filter_key)
+
+        max_window = max(top_k, self.overfetch_max_window)
+        window = min(max(top_k, math.ceil(top_k * entry["factor"])), max_window)
+        previous_count = -1
+        while True:
+            results = await self.vector_query(query_vector, window, filter_conditions)
+            self._candidates_fetched += len(results)
+            ranked = sorted(
+                (
+                    (result["skill_id"], result.get("similarity", 0.0))
+                    for result in results
+                    if result.get("skill_id")
+                ),
+                key=lambda hit: hit[1],
+                reverse=True,
+            )
+            hits = [hit for hit in ranked if hit[1] >= threshold]
+
+            floor_crossed = len(hits) < len(ranked)
+            exhausted = len(ranked) <= previous_count
+            if len(hits) >= top_k or floor_crossed or exhausted or window >= max_window:
+                break
+            previous_count = len(ranked)
+            window = min(window * 2, max_window)
+            entry["expansions"] += 1
+
+        # Learn the candidates requested per row returned under this filter
+        observed = window / max(len(ranked), 1)
+        observed = min(max(observed, 1.0), max_window / top_k)
+        alpha = self.overfetch_smoothing
+        entry["factor"] = (1 - alpha) * entry["factor"] + alpha * observed
+        entry["queries"] += 1
+
+        hits = hits[:top_k]
+        if rows is not None:
+            by_id = {result.get("skill_id"): result for result in results}
+            rows.update((skill_id, by_id[skill_id]) for skill_id, _ in hits)
+        return hits
+
+    def search_metrics(self) -> dict:
+        """
+        Get search runtime metrics.
+
+        Returns:
+            Learned overfetch factors per filter combination, fetch/hydration
+            counters and paginated search session stats
+        """
+        return {
+            "candidates_fetched": self._candidates_fetched,
+            "hydrated": self._hydrated,
+            "search_sessions": self._search_sessions.stats(),
+            "result_cache": {
+                **self._result_cache.stats(),
+                "catalog_generation": self._catalog_generation,
+            },
+            "backend": self.backend,
+            "local_index": self.local_index.stats() if self.local_index is not None else None,
+            "local_fallbacks": self._local_fallbacks,
+            "keyword_index": self.keyword_index.stats(),
+            "overfetch": {
+                key: {**entry, "factor": round(entry["factor"], 3)}
+                for key, entry in self._overfetch.items()
+            },
+        }
+
     async def find_similar_skills(
         self, skill_id: str, top_k: int = 5
     ) -> list[SkillSearchResult]:
         """
         Find skills similar to a given skill.
         
+        Served from the materialized neighbor graph when the skill's list is
+        there; otherwise the neighbors are queried live and materialized.
+
         Args:
             skill_id: Source skill ID
             top_k: Number of similar skills to find
@@ -160,43 +839,42 @@ class VectorSearchService:
             List of similar skills
         """
         try:
+            use_graph = settings.similarity_graph_enabled and top_k <= similarity_graph_service.k
+            if use_graph:
+                neighbors = await similarity_graph_service.get_neighbors(skill_id)
+                if neighbors is not None:
+                    return await self._hydrate_top(neighbors, top_k)
+
             # Get the source skill's vector
-            vector_data = await seekdb_client.get("skill_vectors", skill_id)
-            if not vector_data or "skill_vector" not in vector_data:
+            query_vector = await self._get_skill_vector(skill_id)
+            if query_vector is None:
                 logger.warning("Skill vector not found", skill_id=skill_id)
                 return []
             
-            query_vector = vector_data["skill_vector"]
-            
-            # Search for similar skills
-            results = await seekdb_client.vector_search(
-                table="skill_vectors",
-                vector_column="skill_vector",
-                query_vector=query_vector,
-                top_k=top_k + 1,  # +1 to exclude the source skill
-            )
-            
-            # Parse results, excluding the source skill
-            skill_results = []
-            for result in results:
-                result_skill_id = result.get("skill_id")
-                if result_skill_id and result_skill_id != skill_id:
-                    similarity = result.get("similarity", 0.0)
-                    skill = await self._get_skill_by_id(result_skill_id)
-                    if skill:
-                        skill_results.append(
-                            SkillSearchResult(**skill.model_dump(), similarity=similarity)
-                        )
+            # Search for similar skills, materializing them when possible
+            hits = await self._refresh_neighbors(skill_id, query_vector) if use_graph else None
+            if hits is None:
+                results = await self.vector_query(
+                    query_vector, top_k + 1  # +1 to exclude the source skill
+                )
+                hits = [
+                    (result["skill_id"], result.get("similarity", 0.0))
+                    for result in results
+                    if result.get("skill_id") and result["skill_id"] != skill_id
+                ]
+
+            # Hydrate results, excluding the source skill
+            skill_results = await self._hydrate_top(hits, top_k)
             
             logger.info("Similar skills found", skill_id=skill_id, count=len(skill_results))
-            return skill_results[:top_k]
+            return skill_results
             
         except Exception as e:
             logger.error("Find similar skills failed", skill_id=skill_id, error=str(e))
             return []
 
     async def match_skills_to_task(
-        self, task_description: str, top_k: int = 10
+        self, task_description: str, top_k: int = 10, mmr_lambda: float | None = None
     ) -> list[SkillSearchResult]:
         """
         Match skills to a task description for orchestration.
@@ -204,12 +882,15 @@ class VectorSearchService:
         Args:
             task_description: Task description text
             top_k: Number of skills to match
+            mmr_lambda: Optional MMR trade-off for diversifying the matches
             
         Returns:
             List of matched skills ranked by relevance
         """
         # This is essentially a semantic search with task-specific optimization
-        return await self.search_skills_semantic(task_description, top_k=top_k)
+        return await self.search_skills_semantic(
+            task_description, top_k=top_k, mmr_lambda=mmr_lambda
+        )
 
     async def update_skill_embedding(self, skill: Skill) -> bool:
         """
@@ -230,6 +911,402 @@ class VectorSearchService:
         # Index new vector
         return await self.index_skill(skill)
 
+    async def sync_skill_attributes(self, skill: Skill) -> bool:
+        """
+        Refresh the filterable attributes stored alongside a skill's vector.
+
+        Used when a skill changes without needing a new embedding (e.g. pricing).
+
+        Args:
+            skill: Updated skill object
+
+        Returns:
+            True if successful
+        """
+        try:
+            attributes = self._vector_attributes(skill)
+            await seekdb_client.update("skill_vectors", skill.skill_id, attributes)
+            if self.local_index is not None:
+                self.local_index.update_attributes(skill.skill_id, attributes)
+            return True
+        except Exception as e:
+            logger.error("Failed to sync skill vector attributes", skill_id=skill.skill_id, error=str(e))
+            return False
+
+    async def sync_usage_count(self, skill_id: str, usage_count: int) -> bool:
+        """
+        Refresh the usage count stored alongside a skill's vector.
+
+        Args:
+            skill_id: Skill ID
+            usage_count: New usage count
+
+        Returns:
+            True if successful
+        """
+        try:
+            await seekdb_client.update("skill_vectors", skill_id, {"usage_count": usage_count})
+            if self.local_index is not None:
+                self.local_index.update_attributes(skill_id, {"usage_count": usage_count})
+            return True
+        except Exception as e:
+            logger.warning("Failed to sync skill usage count", skill_id=skill_id, error=str(e))
+            return False
+
+    async def remove_skill_vector(self, skill_id: str) -> None:
+        """
+        Remove a skill's vector from SeekDB and the local index.
+
+        Args:
+            skill_id: Skill ID
+        """
+        if self.local_index is not None:
+            self.local_index.delete(skill_id)
+        try:
+            await seekdb_client.delete("skill_vectors", skill_id)
+        except Exception:
+            pass  # Ignore if vector doesn't exist
+
+        if settings.similarity_graph_enabled:
+            try:
+                await similarity_graph_service.remove_skill(skill_id)
+            except Exception as e:
+                logger.warning("Failed to update similarity graph", skill_id=skill_id, error=str(e))
+
+    async def load_local_index(self) -> int:
+        """
+        Load all skill vectors from SeekDB into the in-process index.
+
+        Returns:
+            Number of vectors loaded
+        """
+        if self.local_index is None:
+            return 0
+
+        start = time.perf_counter()
+        self.local_index.clear()
+        loaded = 0
+        try:
+            async with aclosing(self.iter_table("skill_vectors")) as chunks:
+                async for rows in chunks:
+                    loaded += self.local_index.upsert_many(rows)
+        except Exception as e:
+            logger.error("Failed to load local vector index", loaded=loaded, error=str(e))
+            return loaded
+
+        self.local_index.loaded = True
+        logger.info(
+            "Local vector index loaded",
+            vectors=loaded,
+            seconds=round(time.perf_counter() - start, 2),
+        )
+        return loaded
+
+    async def load_keyword_index(self) -> int:
+        """
+        Build the keyword index from the skills table.
+
+        Returns:
+            Number of skills indexed
+        """
+        from skillpilot.core.services.skill import skill_service
+
+        start = time.perf_counter()
+        self.keyword_index.clear()
+        try:
+            async with aclosing(self.iter_table("skills", columns=KEYWORD_INDEX_COLUMNS)) as chunks:
+                async for rows in chunks:
+                    for row in rows:
+                        self.index_skill_keywords(skill_service._parse_skill(row))
+        except Exception as e:
+            logger.error(
+                "Failed to load keyword index", loaded=len(self.keyword_index), error=str(e)
+            )
+            return len(self.keyword_index)
+
+        self.keyword_index.loaded = True
+        logger.info(
+            "Keyword index loaded",
+            skills=len(self.keyword_index),
+            seconds=round(time.perf_counter() - start, 2),
+        )
+        return len(self.keyword_index)
+
+    async def keyword_search(
+        self,
+        query: str,
+        platforms: list[PlatformType] | None = None,
+        top_k: int | None = None,
+    ) -> list[SkillSearchResult]:
+        """
+        Search skills by keywords with BM25 ranking.
+
+        Args:
+            query: Search query text
+            platforms: Optional platform filters
+            top_k: Number of results to return
+
+        Returns:
+            Skills ranked by BM25; similarity is the score relative to the best hit
+        """
+        top_k = top_k or self.top_k_default
+        if not self.keyword_index.loaded:
+            await self.load_keyword_index()
+
+        hits = self.keyword_index.search(query, top_k, self._build_filter_conditions(platforms))
+        if not hits:
+            return []
+
+        best = hits[0][1]
+        results = await self._hydrate_results(
+            [(skill_id, score / best if best > 0 else 0.0) for skill_id, score in hits]
+        )
+        logger.info("Keyword search completed", query=query[:50], results=len(results))
+        return results
+
+    def index_skill_keywords(self, skill: Skill) -> None:
+        """
+        Add or refresh a skill in the keyword index.
+
+        Args:
+            skill: Skill object
+        """
+        self.keyword_index.add(
+            skill.skill_id,
+            {
+                "skill_name": skill.skill_name,
+                "description": skill.description,
+                "capabilities": skill.capabilities,
+                "tags": skill.tags,
+            },
+            self._vector_attributes(skill),
+        )
+
+    def remove_skill_keywords(self, skill_id: str) -> None:
+        """
+        Remove a skill from the keyword index.
+
+        Args:
+            skill_id: Skill ID
+        """
+        self.keyword_index.remove(skill_id)
+
+    async def iter_table(self, table: str, columns: tuple[str, ...] | None = None):
+        """
+        Yield all rows of a table in batches.
+
+        Iterate inside ``contextlib.aclosing`` so an early exit stops the scan.
+
+        Args:
+            table: Table name
+            columns: Columns to fetch (default: all)
+
+        Yields:
+            Lists of up to settings.vector_local_index_load_batch rows
+        """
+        scan = seekdb_client.scan(
+            table, chunk_size=settings.vector_local_index_load_batch, columns=columns
+        )
+        async with aclosing(scan) as chunks:
+            async for rows in chunks:
+                yield rows
+
+    async def vector_query(
+        self, query_vector: list[float], top_k: int, filter_conditions: dict | None = None
+    ) -> list[dict]:
+        """
+        Run a raw vector query on the configured backend.
+
+        SeekDB failures are served from the local index when it's loaded.
+
+        Args:
+            query_vector: Query embedding
+            top_k: Number of hits
+            filter_conditions: Attribute filters
+
+        Returns:
+            Hit rows with skill_id and similarity, best first
+        """
+        if self.backend == "local" and self._local_index_ready():
+            return self.local_index.search(query_vector, top_k, filter_conditions)
+
+        try:
+            return await seekdb_client.vector_search(
+                table="skill_vectors",
+                vector_column="skill_vector",
+                query_vector=query_vector,
+                top_k=top_k,
+                filter_conditions=filter_conditions,
+            )
+        except Exception as e:
+            if not self._local_index_ready():
+                raise
+            self._local_fallbacks += 1
+            logger.warning("SeekDB vector search failed, using local index", error=str(e))
+            return self.local_index.search(query_vector, top_k, filter_conditions)
+
+    def _local_index_ready(self) -> bool:
+        return self.local_index is not None and self.local_index.loaded
+
+    async def _get_skill_vector(self, skill_id: str) -> list[float] | None:
+        """Get a skill's stored vector, from the local index when possible"""
+        if self._local_index_ready() and skill_id in self.local_index:
+            return self.local_index.get_vector(skill_id).tolist()
+
+        vector_data = await seekdb_client.get("skill_vectors", skill_id)
+        if not vector_data or "skill_vector" not in vector_data:
+            return None
+        return vector_data["skill_vector"]
+
+    def _rank_hits(
+        self, hits: list[tuple[str, float]], rows: dict[str, dict]
+    ) -> tuple[list[tuple[str, float]], dict[str, ScoreBreakdown]]:
+        """
+        Re-rank hits by similarity blended with popularity, rating and recency.
+
+        Signals come from the vector query rows (or the local index when a
+        row lacks them); weights and scales are configured in settings.
+
+        Returns:
+            (skill_id, blended score) hits, best first, and each hit's breakdown
+        """
+        if not hits:
+            return hits, {}
+
+        now = datetime.now(UTC)
+        usage, rating, age_days = [], [], []
+        for skill_id, _ in hits:
+            row = rows.get(skill_id) or {}
+            if "usage_count" not in row and self._local_index_ready():
+                row = {**(self.local_index.get_attributes(skill_id) or {}), **row}
+            usage.append(_as_float(row.get("usage_count")))
+            rating.append(_as_float(row.get("rating")))
+            updated_at = _as_datetime(row.get("updated_at"))
+            age_days.append(
+                (now - updated_at).total_seconds() / 86400 if updated_at else float("nan")
+            )
+
+        signals = blend_quality_scores(
+            np.array([similarity for _, similarity in hits]),
+            np.array(usage),
+            np.array(rating),
+            np.array(age_days),
+            weights={
+                "similarity": settings.search_ranking_similarity_weight,
+                "popularity": settings.search_ranking_popularity_weight,
+                "rating": settings.search_ranking_rating_weight,
+                "recency": settings.search_ranking_recency_weight,
+            },
+            usage_saturation=settings.search_ranking_usage_saturation,
+            recency_half_life_days=settings.search_ranking_recency_half_life_days,
+        )
+
+        breakdowns = {
+            skill_id: ScoreBreakdown(
+                **{name: round(float(values[i]), 6) for name, values in signals.items()}
+            )
+            for i, (skill_id, _) in enumerate(hits)
+        }
+        order = np.argsort(-signals["score"], kind="stable")
+        ranked = [(hits[i][0], breakdowns[hits[i][0]].score) for i in order]
+        return ranked, breakdowns
+
+    async def _diversify(
+        self, hits: list[tuple[str, float]], top_k: int, mmr_lambda: float
+    ) -> list[tuple[str, float]]:
+        """Pick top_k of the hits with MMR, using their stored vectors"""
+        if len(hits) <= 1:
+            return hits[:top_k]
+
+        skill_ids = [skill_id for skill_id, _ in hits]
+        vectors: dict[str, np.ndarray] = {}
+        if self._local_index_ready():
+            for skill_id in skill_ids:
+                if skill_id in self.local_index:
+                    vectors[skill_id] = self.local_index.get_vector(skill_id)
+        missing = [skill_id for skill_id in skill_ids if skill_id not in vectors]
+        if missing:
+            rows = await seekdb_client.get_many("skill_vectors", missing)
+            for skill_id, row in rows.items():
+                if row.get("skill_vector"):
+                    vectors[skill_id] = np.asarray(row["skill_vector"], dtype=np.float32)
+
+        if not vectors:
+            return hits[:top_k]
+        dimension = len(next(iter(vectors.values())))
+        matrix = np.zeros((len(hits), dimension), dtype=np.float32)
+        for row, skill_id in enumerate(skill_ids):
+            vector = vectors.get(skill_id)
+            if vector is not None and len(vector) == dimension:
+                matrix[row] = vector
+
+        return maximal_marginal_relevance(hits, matrix, top_k, mmr_lambda)
+
+    async def _refresh_neighbors(
+        self, skill_id: str, vector: list[float]
+    ) -> list[tuple[str, float]] | None:
+        """Refresh a skill's materialized neighbors (failures only logged)"""
+        if not settings.similarity_graph_enabled:
+            return None
+        try:
+            return await similarity_graph_service.refresh_skill(skill_id, vector)
+        except Exception as e:
+            logger.warning("Failed to update similarity graph", skill_id=skill_id, error=str(e))
+            return None
+
+    def _index_locally(self, vector_data: dict) -> None:
+        """Mirror a skill_vectors row into the local index"""
+        if self.local_index is None:
+            return
+        try:
+            self.local_index.upsert(vector_data["skill_id"], vector_data["skill_vector"], vector_data)
+        except ValueError as e:
+            logger.warning(
+                "Local vector index rejected vector",
+                skill_id=vector_data["skill_id"],
+                error=str(e),
+            )
+
+    def _build_vector_row(self, skill: Skill, embedding: list[float]) -> dict:
+        """Build the skill_vectors row for a skill"""
+        return {
+            "skill_id": skill.skill_id,
+            "skill_vector": embedding,
+            "capability_vectors": {},  # Can store per-capability vectors
+            **self._vector_attributes(skill),
+        }
+
+    def _vector_attributes(self, skill: Skill) -> dict:
+        """Skill attributes denormalized into skill_vectors for filter pushdown"""
+        return {
+            "platform": skill.platform.value,
+            "pricing_type": skill.pricing.type,
+            "rating": skill.rating,
+            "tags": skill.tags,
+            "capabilities": skill.capabilities,
+            "usage_count": skill.usage_count,
+            "updated_at": skill.updated_at,
+        }
+
+    def _build_filter_conditions(
+        self,
+        platforms: list[PlatformType] | None = None,
+        pricing_types: list[str] | None = None,
+        min_rating: float | None = None,
+        tags: list[str] | None = None,
+    ) -> dict | None:
+        """Build skill_vectors filter conditions (None when unfiltered)"""
+        conditions = {}
+        if platforms:
+            conditions["platform"] = [p.value for p in platforms]
+        if pricing_types:
+            conditions["pricing_type"] = pricing_types
+        if min_rating is not None:
+            conditions["rating"] = {"gte": min_rating}
+        if tags:
+            conditions["tags"] = {"contains_any": tags}
+        return conditions or None
+
     def _create_skill_search_text(self, skill: Skill) -> str:
         """
         Create searchable text from skill for embedding.
@@ -245,78 +1322,96 @@ class VectorSearchService:
         ]
         return " ".join(filter(None, parts))
 
-    async def _get_skill_by_id(self, skill_id: str) -> Skill | None:
-        """Get skill by ID from database"""
-        skill_data = await seekdb_client.get("skills", skill_id)
-        if not skill_data:
-            return None
-        
-        from skillpilot.core.services.skill import skill_service
-        return skill_service._parse_skill(skill_data)
+    async def _hydrate_results(
+        self,
+        hits: list[tuple[str, float]],
+        breakdowns: dict[str, ScoreBreakdown] | None = None,
+    ) -> list[SkillSearchResult]:
+        """
+        Turn (skill_id, similarity) hits into search results with one multi-get.
 
-    async def _fallback_keyword_search(
-        self, query: str, platforms: list[PlatformType] | None, top_k: int
+        Hits whose skill no longer exists are dropped; order is preserved.
+        With score breakdowns the hit score is the blended score and the
+        similarity is taken from the breakdown.
+        """
+        return (await self._hydrate_many([hits], [breakdowns]))[0]
+
+    async def _hydrate_top(
+        self, hits: list[tuple[str, float]], top_k: int
     ) -> list[SkillSearchResult]:
-        """Fallback to keyword search if vector search fails"""
-        logger.warning("Using fallback keyword search", query=query[:50])
+        """
+        Hydrate the first top_k hits whose skills still exist.
 
-        from skillpilot.core.models.skill import Skill
-        from skillpilot.core.utils.logger import get_logger
+        Only top_k ids are fetched at a time; hits for deleted skills (which
+        a neighbor list may still name) are backfilled from the rest.
+        """
+        results: list[SkillSearchResult] = []
+        start = 0
+        while len(results) < top_k and start < len(hits):
+            end = start + top_k - len(results)
+            results.extend(await self._hydrate_results(hits[start:end]))
+            start = end
+        return results
 
-        fallback_logger = get_logger("vector_search.fallback")
+    async def _hydrate_many(
+        self,
+        hit_lists: list[list[tuple[str, float]]],
+        breakdowns: list[dict[str, ScoreBreakdown] | None] | None = None,
+    ) -> list[list[SkillSearchResult]]:
+        """
+        Hydrate several hit lists with one multi-get over the union of their ids.
 
-        # Direct keyword search without calling skill_service to avoid recursion
-        try:
-            from skillpilot.db.seekdb import seekdb_client
-
-            # Query all skills and do keyword matching locally
-            all_skills_data = await seekdb_client.query("skills", filters={}, limit=1000)
-
-            query_lower = query.lower()
-            results = []
-
-            for skill_data in all_skills_data:
-                # Check if query matches any skill field
-                searchable = (
-                    f"{skill_data.get('skill_name', '')} "
-                    f"{skill_data.get('description', '')} "
-                    f"{' '.join(skill_data.get('capabilities', []))} "
-                    f"{' '.join(skill_data.get('tags', []))}"
-                ).lower()
-
-                if query_lower in searchable:
-                    # Parse skill data
-                    from skillpilot.core.models.common import PlatformType
-                    from skillpilot.core.models.skill import SkillSearchResult
-
-                    skill = Skill(
-                        skill_id=skill_data["skill_id"],
-                        skill_name=skill_data["skill_name"],
-                        platform=PlatformType(skill_data.get("platform", "custom")),
-                        developer=skill_data.get("developer"),
-                        description=skill_data.get("description"),
-                        capabilities=skill_data.get("capabilities", []),
-                        tags=skill_data.get("tags", []),
-                        pricing=skill_data.get("pricing", {}),
-                        rating=skill_data.get("rating", 0.0),
-                        usage_count=skill_data.get("usage_count", 0),
-                        created_at=skill_data.get("created_at"),
-                        updated_at=skill_data.get("updated_at"),
-                    )
+        Hits whose skill no longer exists are dropped; order is preserved.
+        ``breakdowns`` holds optional score breakdowns per hit list.
+        """
+        skill_ids = list(dict.fromkeys(skill_id for hits in hit_lists for skill_id, _ in hits))
+        if not skill_ids:
+            return [[] for _ in hit_lists]
 
-                    results.append(
-                        SkillSearchResult(**skill.model_dump(), similarity=0.5)
-                    )
+        skills_data = await seekdb_client.get_many("skills", skill_ids)
+        self._hydrated += len(skill_ids)
+
+        from skillpilot.core.services.skill import skill_service
 
-                    if len(results) >= top_k:
-                        break
+        skills = {
+            skill_id: skill_service._parse_skill(skill_data).model_dump()
+            for skill_id, skill_data in skills_data.items()
+        }
+        breakdowns = breakdowns or [None] * len(hit_lists)
 
-            fallback_logger.info("Keyword search completed", query=query[:50], results=len(results))
-            return results
+        def result(
+            skill_id: str, score: float, list_breakdowns: dict[str, ScoreBreakdown] | None
+        ) -> SkillSearchResult:
+            breakdown = (list_breakdowns or {}).get(skill_id)
+            if breakdown is None:
+                return SkillSearchResult(**skills[skill_id], similarity=score)
+            return SkillSearchResult(
+                **skills[skill_id],
+                similarity=breakdown.similarity,
+                score=score,
+                score_breakdown=breakdown,
+            )
+
+        return [
+            [
+                result(skill_id, score, list_breakdowns)
+                for skill_id, score in hits
+                if skill_id in skills
+            ]
+            for hits, list_breakdowns in zip(hit_lists, breakdowns, strict=True)
+        ]
 
+    async def _fallback_keyword_search(
+        self, query: str, platforms: list[PlatformType] | None, top_k: int
+    ) -> list[SkillSearchResult]:
+        """Fallback to keyword search if vector search fails"""
+        logger.warning("Using fallback keyword search", query=query[:50])
+        try:
+            return await self.keyword_search(query, platforms, top_k)
         except Exception as e:
-            fallback_logger.error("Keyword search failed", query=query[:50], error=str(e))
+            logger.error("Keyword search failed", query=query[:50], error=str(e))
             return []
 
 
 vector_search_service = VectorSearchService()
+
@@ -1,7 +1,8 @@
 """Utilities Module"""
 
-from .helpers import generate_id, sanitize_string, utc_now
+from .helpers import decode_cursor, encode_cursor, generate_id, sanitize_string, utc_now
 from .logger import configure_logging, get_logger
+from .ttl_cache import TTLCache
 from .validators import validate_email, validate_password_strength
 
 __all__ = [
@@ -10,6 +11,9 @@ __all__ = [
     "generate_id",
     "utc_now",
     "sanitize_string",
+    "encode_cursor",
+    "decode_cursor",
+    "TTLCache",
     "validate_email",
     "validate_password_strength",
 ]
@@ -1,6 +1,9 @@
 """Helper utilities"""
 
+import base64
+import json
 from datetime import UTC, datetime
+from typing import Any
 from uuid import uuid4
 
 
@@ -50,3 +53,40 @@ def sanitize_string(value: str | None, max_length: int = 1000) -> str | None:
         value = value[:max_length]
 
     return value
+
+
+def encode_cursor(state: dict[str, Any]) -> str:
+    """
+    Encode pagination state as an opaque URL-safe cursor.
+
+    Args:
+        state: JSON-serializable pagination state
+
+    Returns:
+        Cursor token
+    """
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor token
+
+    Returns:
+        Pagination state
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(state, dict):
+        raise ValueError("Invalid cursor")
+    return state
@@ -0,0 +1,56 @@
+"""Per-request stage timings reported via the Server-Timing header"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_request_timings: ContextVar[dict[str, float] | None] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> dict[str, float]:
+    """
+    Start collecting stage timings for the current request.
+
+    Tasks spawned while handling the request share the returned dict, so
+    stages timed in concurrent subtasks are collected too.
+
+    Returns:
+        Stage name -> milliseconds, filled in as stages complete
+    """
+    timings: dict[str, float] = {}
+    _request_timings.set(timings)
+    return timings
+
+
+@contextmanager
+def stage_timer(name: str) -> Iterator[None]:
+    """
+    Time a stage of the current request.
+
+    Repeated stages accumulate. Outside a request this is a no-op.
+
+    Args:
+        name: Stage name (a Server-Timing metric name)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _request_timings.get()
+        if timings is not None:
+            elapsed = (time.perf_counter() - start) * 1000
+            timings[name] = timings.get(name, 0.0) + elapsed
+
+
+def format_server_timing(timings: dict[str, float]) -> str:
+    """
+    Format stage timings as a Server-Timing header value.
+
+    Args:
+        timings: Stage name -> milliseconds
+
+    Returns:
+        Header value, e.g. ``embed;dur=3.1, ann;dur=12.4``
+    """
+    return ", ".join(f"{name};dur={duration:.1f}" for name, duration in timings.items())
@@ -0,0 +1,95 @@
+"""In-memory LRU cache with per-entry expiry"""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache whose entries expire after a fixed TTL.
+
+    Least recently used entries are evicted once ``max_entries`` is reached.
+    Not thread-safe; meant for use from the event loop.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a live entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._expired += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        """
+        Store an entry.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Optional TTL overriding the cache default
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: str) -> Any | None:
+        """Remove an entry, returning its value if present"""
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Entry count, hit/miss, expiry and eviction counters
+        """
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "expired": self._expired,
+            "evictions": self._evictions,
+        }
@@ -1,5 +1,5 @@
 """SkillPilot - Database Module"""
 
-from skillpilot.db.seekdb import seekdb_client
+from skillpilot.db.seekdb import BulkWriteResult, seekdb_client
 
-__all__ = ["seekdb_client"]
+__all__ = ["BulkWriteResult", "seekdb_client"]
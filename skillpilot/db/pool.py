@@ -0,0 +1,328 @@
+"""Async connection pool for database clients"""
+
+import asyncio
+import inspect
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from skillpilot.core.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Errors that mean the connection itself is broken, not just the statement
+CONNECTION_ERRORS: tuple[type[BaseException], ...] = (OSError,)  # includes TimeoutError
+
+
+class PoolTimeoutError(Exception):
+    """No connection became available within the acquire timeout"""
+
+
+class PoolClosedError(Exception):
+    """The pool was used after being closed"""
+
+
+class ConnectionPool:
+    """
+    Bounded pool of connections shared by coroutines.
+
+    Connections are opened on demand up to ``max_size`` (``min_size`` are
+    opened up front) and reused most-recently-used first, so surplus
+    connections go idle and are closed after ``idle_timeout`` seconds, by a
+    background reaper started in ``open()`` as well as on checkout.
+    A connection idle for at least ``health_check_interval`` seconds is
+    checked before it is handed out; one that fails the check, or raises a
+    connection error while checked out, is closed and replaced on demand.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        disconnect: Callable[[Any], Any] | None = None,
+        health_check: Callable[[Any], Awaitable[Any]] | None = None,
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 10.0,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        name: str = "pool",
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min={min_size}, max={max_size}")
+
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+
+        self._connect = connect
+        self._disconnect = disconnect
+        self._health_check = health_check
+
+        # (connection, monotonic time it was released)
+        self._idle: deque[tuple[Any, float]] = deque()
+        # Open connections, including ones being opened and checked out
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._closed = False
+        self._condition: asyncio.Condition | None = None
+        self._closing: set[asyncio.Task] = set()
+        self._reaper: asyncio.Task | None = None
+
+        self._acquired = 0
+        self._timeouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._evicted = 0
+        self._health_check_failures = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._peak_in_use = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def open(self) -> None:
+        """Open ``min_size`` connections"""
+        self._closed = False
+        condition = self._get_condition()
+        while self._size < self.min_size:
+            async with condition:
+                self._size += 1
+            try:
+                connection = await self._open_connection()
+            except BaseException:
+                await self._forget(in_use=False)
+                raise
+            async with condition:
+                self._idle.append((connection, time.monotonic()))
+                condition.notify()
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.get_running_loop().create_task(self._reap_idle())
+
+    async def close(self) -> None:
+        """Close idle connections and refuse new checkouts"""
+        self._closed = True
+        reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.cancel()
+            await asyncio.gather(reaper, return_exceptions=True)
+        async with self._get_condition():
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._get_condition().notify_all()
+        for connection in idle:
+            await self._close_connection(connection)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Any]:
+        """
+        Check out a connection for the duration of the block.
+
+        A connection error raised inside the block discards the connection.
+
+        Raises:
+            PoolTimeoutError: If no connection is available in time
+            PoolClosedError: If the pool is closed
+        """
+        connection = await self.acquire()
+        discard = False
+        try:
+            yield connection
+        except CONNECTION_ERRORS:
+            discard = True
+            raise
+        finally:
+            await self.release(connection, discard=discard)
+
+    async def acquire(self) -> Any:
+        """
+        Check out a connection, waiting up to ``acquire_timeout`` seconds.
+
+        Prefer ``connection()``, which always releases it.
+
+        Raises:
+            PoolTimeoutError: If no connection is available in time
+            PoolClosedError: If the pool is closed
+        """
+        start = time.monotonic()
+        deadline = start + self.acquire_timeout
+        condition = self._get_condition()
+
+        while True:
+            connection, idle_since = None, 0.0
+            async with condition:
+                while True:
+                    if self._closed:
+                        raise PoolClosedError(f"Connection pool {self.name} is closed")
+                    self._evict_idle()
+                    if self._idle:
+                        connection, idle_since = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            f"No connection available from {self.name} "
+                            f"within {self.acquire_timeout}s (max_size={self.max_size})"
+                        )
+                    self._waiting += 1
+                    try:
+                        await asyncio.wait_for(condition.wait(), remaining)
+                    except TimeoutError:
+                        pass
+                    finally:
+                        self._waiting -= 1
+                self._in_use += 1
+
+            if connection is None:
+                try:
+                    connection = await self._open_connection()
+                except BaseException:
+                    await self._forget(in_use=True)
+                    raise
+            else:
+                try:
+                    healthy = await self._is_healthy(connection, idle_since)
+                except BaseException:
+                    await self._close_connection(connection)
+                    await self._forget(in_use=True)
+                    raise
+                if not healthy:
+                    await self._close_connection(connection)
+                    await self._forget(in_use=True)
+                    continue
+
+            waited = time.monotonic() - start
+            self._acquired += 1
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+            return connection
+
+    async def release(self, connection: Any, discard: bool = False) -> None:
+        """
+        Return a checked-out connection.
+
+        Args:
+            connection: Connection from ``acquire()``
+            discard: Close the connection instead of reusing it
+        """
+        if discard or self._closed:
+            if discard:
+                self._discarded += 1
+            await self._close_connection(connection)
+            await self._forget(in_use=True)
+            return
+
+        async with self._get_condition():
+            self._in_use -= 1
+            self._idle.append((connection, time.monotonic()))
+            self._get_condition().notify()
+
+    def stats(self) -> dict:
+        """
+        Get pool statistics.
+
+        Returns:
+            Size, utilization, wait times and lifecycle counters
+        """
+        return {
+            "name": self.name,
+            "closed": self._closed,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "size": self._size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "peak_in_use": self._peak_in_use,
+            "waiting": self._waiting,
+            "utilization": round(self._in_use / self.max_size, 3),
+            "acquired": self._acquired,
+            "timeouts": self._timeouts,
+            "avg_wait_ms": (
+                round(self._wait_seconds / self._acquired * 1000, 3) if self._acquired else 0.0
+            ),
+            "max_wait_ms": round(self._max_wait_seconds * 1000, 3),
+            "created": self._created,
+            "discarded": self._discarded,
+            "evicted": self._evicted,
+            "health_check_failures": self._health_check_failures,
+        }
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Created lazily so the pool binds to the running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _evict_idle(self) -> None:
+        """Close connections idle past the timeout, keeping min_size open"""
+        now = time.monotonic()
+        # Oldest idle connections are at the left
+        while (
+            self._idle
+            and self._size > self.min_size
+            and now - self._idle[0][1] >= self.idle_timeout
+        ):
+            connection, _ = self._idle.popleft()
+            self._size -= 1
+            self._evicted += 1
+            task = asyncio.get_running_loop().create_task(self._close_connection(connection))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def _reap_idle(self) -> None:
+        """Evict idle connections periodically, so they close without traffic"""
+        interval = min(max(self.idle_timeout / 2, 0.05), 60.0)
+        while not self._closed:
+            await asyncio.sleep(interval)
+            async with self._get_condition():
+                self._evict_idle()
+
+    async def _forget(self, in_use: bool) -> None:
+        """Account for a connection that was closed or never opened"""
+        async with self._get_condition():
+            self._size -= 1
+            if in_use:
+                self._in_use -= 1
+            self._get_condition().notify()
+
+    async def _open_connection(self) -> Any:
+        connection = await self._connect()
+        self._created += 1
+        return connection
+
+    async def _is_healthy(self, connection: Any, idle_since: float) -> bool:
+        """Check a connection that has been idle for a while"""
+        if self._health_check is None:
+            return True
+        if time.monotonic() - idle_since < self.health_check_interval:
+            return True
+        try:
+            await self._health_check(connection)
+            return True
+        except Exception as e:
+            self._health_check_failures += 1
+            logger.warning("Pooled connection failed health check", pool=self.name, error=str(e))
+            return False
+
+    async def _close_connection(self, connection: Any) -> None:
+        if self._disconnect is None:
+            return
+        try:
+            result = self._disconnect(connection)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning("Error closing pooled connection", pool=self.name, error=str(e))
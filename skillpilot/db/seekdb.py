@@ -1,20 +1,64 @@
 """SeekDB Database Client Module"""
 
-from typing import Any, Optional
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional, TypeVar
 
 import pyseekdb as seekdb
 
 from skillpilot.core.config import settings
+from skillpilot.core.utils.helpers import decode_cursor, encode_cursor
 from skillpilot.core.utils.logger import get_logger
+from skillpilot.core.utils.ttl_cache import TTLCache
+from skillpilot.db.pool import CONNECTION_ERRORS, ConnectionPool
+
+T = TypeVar("T")
 
 logger = get_logger(__name__)
 
+# Primary key column of each table created by create_tables()
+PRIMARY_KEYS = {
+    "skills": "skill_id",
+    "skill_vectors": "skill_id",
+    "users": "user_id",
+    "orchestration_plans": "plan_id",
+    "task_vectors": "task_id",
+    "skill_neighbors": "skill_id",
+}
+
+
+@dataclass
+class BulkWriteResult:
+    """Outcome of a bulk write"""
+
+    total: int = 0
+    succeeded: int = 0
+    # Primary key -> error, for rows that failed
+    failed: dict[str, str] = field(default_factory=dict)
+    round_trips: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def merge(self, other: "BulkWriteResult") -> None:
+        self.total += other.total
+        self.succeeded += other.succeeded
+        self.failed.update(other.failed)
+        self.round_trips += other.round_trips
+
 
 class SeekDBClient:
     """SeekDB database client with connection pooling and error handling"""
 
     _instance: Optional["SeekDBClient"] = None
-    _client: Any | None = None
+    _pool: ConnectionPool | None = None
+    _count_cache: TTLCache | None = None
 
     def __new__(cls):
         """Singleton pattern for database client"""
@@ -22,132 +66,222 @@ class SeekDBClient:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def connect(self) -> Any:
-        """Connect to SeekDB"""
-        if self._client is None:
-            try:
-                logger.info("Connecting to SeekDB", url=settings.seekdb_url)
-                self._client = seekdb.connect(
-                    url=settings.seekdb_url,
-                    vector_dimension=settings.seekdb_vector_dimension,
-                )
-                logger.info("SeekDB connection established")
-            except Exception as e:
-                logger.error("Failed to connect to SeekDB", error=str(e), url=settings.seekdb_url)
-                raise
-        return self._client
+    @property
+    def connected(self) -> bool:
+        """Whether the connection pool is open"""
+        return self._pool is not None and not self._pool.closed
+
+    async def connect(self) -> ConnectionPool:
+        """Open the connection pool (idempotent)"""
+        if self.connected:
+            return self._pool
+
+        logger.info(
+            "Connecting to SeekDB",
+            url=settings.seekdb_url,
+            min_size=settings.seekdb_pool_min_size,
+            max_size=settings.seekdb_pool_max_size,
+        )
+        pool = ConnectionPool(
+            connect=self._open_connection,
+            disconnect=self._close_connection,
+            health_check=self._check_connection,
+            min_size=settings.seekdb_pool_min_size,
+            max_size=settings.seekdb_pool_max_size,
+            acquire_timeout=settings.seekdb_pool_acquire_timeout_seconds,
+            idle_timeout=settings.seekdb_pool_idle_timeout_seconds,
+            health_check_interval=settings.seekdb_pool_health_check_interval_seconds,
+            name="seekdb",
+        )
+        try:
+            await pool.open()
+        except Exception as e:
+            logger.error("Failed to connect to SeekDB", error=str(e), url=settings.seekdb_url)
+            await pool.close()
+            raise
+        self._pool = pool
+        logger.info("SeekDB connection pool opened")
+        return pool
+
+    async def close(self):
+        """Close all pooled connections"""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            logger.info("SeekDB connection pool closed")
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Any]:
+        """Check out a pooled connection, opening the pool on first use"""
+        pool = self._pool if self.connected else await self.connect()
+        async with pool.connection() as client:
+            yield client
+
+    def pool_stats(self) -> dict | None:
+        """Connection pool statistics (None before connecting)"""
+        return self._pool.stats() if self._pool is not None else None
+
+    async def _execute(
+        self, operation: Callable[[Any], Awaitable[T]], retry: bool = True
+    ) -> T:
+        """
+        Run an operation on a pooled connection.
 
-    def close(self):
-        """Close database connection"""
-        if self._client:
+        A connection error discards the connection; with ``retry`` the
+        operation is run once more on a fresh one. Only idempotent reads
+        should retry.
+        """
+        attempts = 2 if retry else 1
+        for attempt in range(attempts):
             try:
-                self._client.close()
-                logger.info("SeekDB connection closed")
-            except Exception as e:
-                logger.warning("Error closing SeekDB connection", error=str(e))
-            finally:
-                self._client = None
+                async with self.connection() as client:
+                    return await operation(client)
+            except CONNECTION_ERRORS as e:
+                if attempt + 1 >= attempts:
+                    raise
+                logger.warning("SeekDB connection failed, retrying on a new one", error=str(e))
+        raise AssertionError("unreachable")
+
+    async def _open_connection(self) -> Any:
+        # pyseekdb connects synchronously; keep it off the event loop
+        return await asyncio.to_thread(
+            seekdb.connect,
+            url=settings.seekdb_url,
+            vector_dimension=settings.seekdb_vector_dimension,
+        )
+
+    def _close_connection(self, client: Any) -> None:
+        client.close()
+
+    async def _check_connection(self, client: Any) -> None:
+        """Raise if a connection is no longer usable"""
+        ping = getattr(client, "ping", None)
+        if ping is not None:
+            result = ping()
+            if asyncio.iscoroutine(result):
+                await result
+        else:
+            await client.query("skills", filters=None, limit=1, offset=0)
 
     async def create_tables(self):
         """Create database tables if they don't exist"""
-        client = self.connect()
+        async with self.connection() as client:
+            try:
+                # Skills table
+                await client.create_table(
+                    "skills",
+                    {
+                        "skill_id": "string",
+                        "skill_name": "string",
+                        "platform": "string",
+                        "developer": "string",
+                        "description": "string",
+                        "capabilities": "json",
+                        "rating": "float",
+                        "usage_count": "int",
+                        "pricing": "json",
+                        "tags": "json",
+                        "created_at": "timestamp",
+                        "updated_at": "timestamp",
+                    },
+                    primary_key="skill_id",
+                )
 
-        try:
-            # Skills table
-            await client.create_table(
-                "skills",
-                {
-                    "skill_id": "string",
-                    "skill_name": "string",
-                    "platform": "string",
-                    "developer": "string",
-                    "description": "string",
-                    "capabilities": "json",
-                    "rating": "float",
-                    "usage_count": "int",
-                    "pricing": "json",
-                    "tags": "json",
-                    "created_at": "timestamp",
-                    "updated_at": "timestamp",
-                },
-                primary_key="skill_id",
-            )
+                # Skill vectors table
+                await client.create_table(
+                    "skill_vectors",
+                    {
+                        "skill_id": "string",
+                        "skill_vector": "vector",
+                        "capability_vectors": "json",
+                        # Denormalized from skills for filter pushdown into the ANN query
+                        "platform": "string",
+                        "pricing_type": "string",
+                        "rating": "float",
+                        "tags": "json",
+                        "capabilities": "json",
+                        # Ranking signals read next to the vectors, without hydration
+                        "usage_count": "int",
+                        "updated_at": "timestamp",
+                    },
+                    primary_key="skill_id",
+                )
 
-            # Skill vectors table
-            await client.create_table(
-                "skill_vectors",
-                {
-                    "skill_id": "string",
-                    "skill_vector": "vector",
-                    "capability_vectors": "json",
-                },
-                primary_key="skill_id",
-            )
+                # Users table
+                await client.create_table(
+                    "users",
+                    {
+                        "user_id": "string",
+                        "email": "string",
+                        "password_hash": "string",
+                        "name": "string",
+                        "avatar_url": "string",
+                        "role": "string",
+                        "created_at": "timestamp",
+                    },
+                    primary_key="user_id",
+                )
 
-            # Users table
-            await client.create_table(
-                "users",
-                {
-                    "user_id": "string",
-                    "email": "string",
-                    "password_hash": "string",
-                    "name": "string",
-                    "avatar_url": "string",
-                    "role": "string",
-                    "created_at": "timestamp",
-                },
-                primary_key="user_id",
-            )
+                # Orchestration plans table
+                await client.create_table(
+                    "orchestration_plans",
+                    {
+                        "plan_id": "string",
+                        "user_id": "string",
+                        "task_description": "string",
+                        "skill_chain": "json",
+                        "status": "string",
+                        "created_at": "timestamp",
+                        "executed_at": "timestamp",
+                    },
+                    primary_key="plan_id",
+                )
 
-            # Orchestration plans table
-            await client.create_table(
-                "orchestration_plans",
-                {
-                    "plan_id": "string",
-                    "user_id": "string",
-                    "task_description": "string",
-                    "skill_chain": "json",
-                    "status": "string",
-                    "created_at": "timestamp",
-                    "executed_at": "timestamp",
-                },
-                primary_key="plan_id",
-            )
+                # Task vectors table
+                await client.create_table(
+                    "task_vectors",
+                    {
+                        "task_id": "string",
+                        "task_description": "string",
+                        "task_vector": "vector",
+                        "required_capabilities": "json",
+                    },
+                    primary_key="task_id",
+                )
 
-            # Task vectors table
-            await client.create_table(
-                "task_vectors",
-                {
-                    "task_id": "string",
-                    "task_description": "string",
-                    "task_vector": "vector",
-                    "required_capabilities": "json",
-                },
-                primary_key="task_id",
-            )
+                # Materialized nearest neighbors of each skill
+                await client.create_table(
+                    "skill_neighbors",
+                    {
+                        "skill_id": "string",
+                        "neighbors": "json",  # [{"skill_id": ..., "similarity": ...}], best first
+                        "updated_at": "timestamp",
+                    },
+                    primary_key="skill_id",
+                )
 
-            # Create vector indexes
-            await client.create_vector_index(
-                "skill_vectors",
-                "idx_skill_vector",
-                index_type=settings.seekdb_index_type,
-                m=settings.seekdb_hnsw_m,
-                ef_construction=settings.seekdb_hnsw_ef_construction,
-            )
+                # Create vector indexes
+                await client.create_vector_index(
+                    "skill_vectors",
+                    "idx_skill_vector",
+                    index_type=settings.seekdb_index_type,
+                    m=settings.seekdb_hnsw_m,
+                    ef_construction=settings.seekdb_hnsw_ef_construction,
+                )
 
-            await client.create_vector_index(
-                "task_vectors",
-                "idx_task_vector",
-                index_type=settings.seekdb_index_type,
-                m=settings.seekdb_hnsw_m,
-                ef_construction=settings.seekdb_hnsw_ef_construction,
-            )
+                await client.create_vector_index(
+                    "task_vectors",
+                    "idx_task_vector",
+                    index_type=settings.seekdb_index_type,
+                    m=settings.seekdb_hnsw_m,
+                    ef_construction=settings.seekdb_hnsw_ef_construction,
+                )
 
-            logger.info("Database tables created successfully")
+                logger.info("Database tables created successfully")
 
-        except Exception as e:
-            logger.error("Failed to create tables", error=str(e))
-            raise
+            except Exception as e:
+                logger.error("Failed to create tables", error=str(e))
+                raise
 
     async def vector_search(
         self,
@@ -157,15 +291,23 @@ class SeekDBClient:
         top_k: int = 10,
         filter_conditions: dict | None = None,
     ) -> list:
-        """Perform vector similarity search"""
-        client = self.connect()
+        """
+        Perform vector similarity search.
+
+        Filter conditions are applied by the index before ranking. Supported forms:
+        ``{"column": value}`` (equality), ``{"column": [v1, v2]}`` (IN),
+        ``{"column": {"gte": x}}`` (range, also gt/lte/lt) and
+        ``{"column": {"contains_any": [v1, v2]}}`` (JSON array overlap).
+        """
         try:
-            return await client.vector_search(
-                table=table,
-                vector_column=vector_column,
-                query_vector=query_vector,
-                top_k=top_k,
-                filter_conditions=filter_conditions,
+            return await self._execute(
+                lambda client: client.vector_search(
+                    table=table,
+                    vector_column=vector_column,
+                    query_vector=query_vector,
+                    top_k=top_k,
+                    filter_conditions=filter_conditions,
+                )
             )
         except Exception as e:
             logger.error("Vector search failed", table=table, error=str(e))
@@ -173,9 +315,8 @@ class SeekDBClient:
 
     async def insert(self, table: str, data: dict) -> None:
         """Insert a record into table"""
-        client = self.connect()
         try:
-            await client.insert(table, data)
+            await self._execute(lambda client: client.insert(table, data), retry=False)
             logger.debug("Record inserted", table=table, id=data.get("id", "unknown"))
         except Exception as e:
             logger.error("Insert failed", table=table, error=str(e))
@@ -183,9 +324,8 @@ class SeekDBClient:
 
     async def update(self, table: str, primary_key: str, data: dict) -> None:
         """Update a record in table"""
-        client = self.connect()
         try:
-            await client.update(table, primary_key, data)
+            await self._execute(lambda client: client.update(table, primary_key, data))
             logger.debug("Record updated", table=table, id=primary_key)
         except Exception as e:
             logger.error("Update failed", table=table, id=primary_key, error=str(e))
@@ -193,9 +333,8 @@ class SeekDBClient:
 
     async def delete(self, table: str, primary_key: str) -> None:
         """Delete a record from table"""
-        client = self.connect()
         try:
-            await client.delete(table, primary_key)
+            await self._execute(lambda client: client.delete(table, primary_key))
             logger.debug("Record deleted", table=table, id=primary_key)
         except Exception as e:
             logger.error("Delete failed", table=table, id=primary_key, error=str(e))
@@ -203,23 +342,559 @@ class SeekDBClient:
 
     async def get(self, table: str, primary_key: str) -> dict | None:
         """Get a single record by primary key"""
-        client = self.connect()
         try:
-            return await client.get(table, primary_key)
+            return await self._execute(lambda client: client.get(table, primary_key))
         except Exception as e:
             logger.error("Get failed", table=table, id=primary_key, error=str(e))
             raise
 
+    async def get_many(
+        self, table: str, primary_keys: list[str], chunk_size: int | None = None
+    ) -> dict[str, dict]:
+        """
+        Get several records by primary key.
+
+        Keys are fetched with one ``IN`` query per chunk, and chunks run
+        concurrently on separate pooled connections.
+
+        Args:
+            table: Table name
+            primary_keys: Primary key values to fetch
+            chunk_size: Max keys per query (defaults to settings.seekdb_get_many_chunk_size)
+
+        Returns:
+            Mapping of primary key to record (missing keys are omitted)
+        """
+        keys = list(dict.fromkeys(primary_keys))
+        if not keys:
+            return {}
+
+        key_column = PRIMARY_KEYS[table]
+        chunk_size = chunk_size or settings.seekdb_get_many_chunk_size
+        chunks = [keys[i : i + chunk_size] for i in range(0, len(keys), chunk_size)]
+
+        def fetch(chunk: list[str]) -> Callable[[Any], Awaitable[list]]:
+            return lambda client: client.query(
+                table, filters={key_column: chunk}, limit=len(chunk), offset=0
+            )
+
+        try:
+            results = await asyncio.gather(*(self._execute(fetch(chunk)) for chunk in chunks))
+        except Exception as e:
+            logger.error("Get many failed", table=table, count=len(keys), error=str(e))
+            raise
+
+        return {row[key_column]: row for rows in results for row in rows}
+
     async def query(
-        self, table: str, filters: dict | None = None, limit: int = 100, offset: int = 0
+        self,
+        table: str,
+        filters: dict | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        columns: Sequence[str] | None = None,
+        order_by: Sequence[str] | None = None,
+        after: Sequence[Any] | None = None,
     ) -> list:
-        """Query records with optional filters"""
-        client = self.connect()
+        """
+        Query records with optional filters.
+
+        Args:
+            table: Table name
+            filters: Optional filters (same forms as ``vector_search``)
+            limit: Max records
+            offset: Records to skip
+            columns: Only return these columns (all when None)
+            order_by: Columns to sort by, ascending
+            after: Keyset position: only rows sorting after these ``order_by``
+                values, so the server seeks instead of skipping ``offset`` rows
+
+        Returns:
+            Matching records
+        """
+        options: dict[str, Any] = {}
+        if columns:
+            options["columns"] = list(columns)
+        if order_by:
+            options["order_by"] = list(order_by)
+        if after is not None:
+            if not order_by or len(after) != len(order_by):
+                raise ValueError("after needs one value per order_by column")
+            options["after"] = list(after)
+
         try:
-            return await client.query(table, filters=filters, limit=limit, offset=offset)
+            return await self._execute(
+                lambda client: client.query(
+                    table, filters=filters, limit=limit, offset=offset, **options
+                )
+            )
         except Exception as e:
             logger.error("Query failed", table=table, filters=filters, error=str(e))
             raise
 
+    async def query_page(
+        self,
+        table: str,
+        order_by: Sequence[str],
+        filters: dict | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[list, str | None]:
+        """
+        Fetch one page of an ordered listing with a cursor for the next page.
+
+        With a cursor the page starts right after the previous page's last
+        row (keyset pagination), so deep pages cost the same as the first;
+        without one it starts at ``offset``. ``order_by`` must end in a
+        unique column so the position is unambiguous.
+
+        Args:
+            table: Table name
+            order_by: Columns to sort by, ascending, e.g. ("created_at", "skill_id")
+            filters: Optional filters
+            limit: Page size
+            offset: Records to skip when no cursor is given
+            cursor: Cursor returned with the previous page
+            columns: Only return these columns (order_by columns are added)
+
+        Returns:
+            Page of records and the cursor for the next page (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid or belongs to another listing
+        """
+        order_by = list(order_by)
+        listing = self._listing_key(table, order_by, filters)
+
+        after = None
+        if cursor:
+            state = decode_cursor(cursor)
+            values = state.get("a")
+            if state.get("k") != listing or not isinstance(values, list):
+                raise ValueError("Cursor does not belong to this listing")
+            after = [_decode_cursor_value(value) for value in values]
+            offset = 0
+        if columns:
+            columns = list(dict.fromkeys([*columns, *order_by]))
+
+        # One extra row tells whether there is a next page
+        rows = await self.query(table, filters, limit + 1, offset, columns, order_by, after)
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        next_cursor = encode_cursor(
+            {"k": listing, "a": [_encode_cursor_value(rows[-1].get(column)) for column in order_by]}
+        )
+        return rows, next_cursor
+
+    async def scan(
+        self,
+        table: str,
+        filters: dict | None = None,
+        chunk_size: int | None = None,
+        columns: Sequence[str] | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Stream a whole table in chunks, seeking by primary key.
+
+        At most two chunks are held at once, so memory stays flat however
+        large the table is. With ``prefetch`` the next chunk is fetched
+        while the caller processes the current one. Callers that may stop
+        early should iterate inside ``contextlib.aclosing`` so the prefetch
+        is cancelled as soon as they stop, not when the generator is
+        garbage collected.
+
+        Args:
+            table: Table name
+            filters: Optional filters
+            chunk_size: Rows per query (defaults to settings.seekdb_scan_chunk_size)
+            columns: Only return these columns (the primary key is added)
+            prefetch: Fetch the next chunk in the background
+
+        Yields:
+            Lists of up to ``chunk_size`` records, in primary key order
+        """
+        key_column = PRIMARY_KEYS[table]
+        chunk_size = chunk_size or settings.seekdb_scan_chunk_size
+        if columns:
+            columns = list(dict.fromkeys([*columns, key_column]))
+
+        def fetch(after: tuple | None) -> asyncio.Task:
+            return asyncio.ensure_future(
+                self.query(table, filters, chunk_size, 0, columns, (key_column,), after)
+            )
+
+        pending: asyncio.Task | None = fetch(None)
+        try:
+            while pending is not None:
+                rows = await pending
+                pending = None
+                more = len(rows) == chunk_size
+                if more and prefetch:
+                    pending = fetch((rows[-1][key_column],))
+                if rows:
+                    yield rows
+                if more and not prefetch:
+                    pending = fetch((rows[-1][key_column],))
+        finally:
+            # The caller stopped early: drop the chunk being prefetched (its
+            # outcome is discarded; cancellation of the caller still propagates)
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    def _listing_key(self, table: str, order_by: list[str], filters: dict | None) -> str:
+        """Short digest identifying a listing, so cursors can't be replayed on another"""
+        raw = json.dumps([table, order_by, filters or {}], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+    async def count(self, table: str, filters: dict | None = None, cached: bool = False) -> int:
+        """
+        Count records matching filters on the server.
+
+        Args:
+            table: Table name
+            filters: Optional filters (same forms as ``query``)
+            cached: Reuse a count for the same filters for up to
+                settings.seekdb_count_cache_ttl_seconds, so it may lag writes
+
+        Returns:
+            Number of matching records
+        """
+        cache_key = self._count_cache_key("count", table, filters)
+        if cached:
+            total = self._get_count_cache().get(cache_key)
+            if total is not None:
+                return total
+
+        try:
+            total = await self._execute(lambda client: client.count(table, filters=filters))
+        except Exception as e:
+            logger.error("Count failed", table=table, filters=filters, error=str(e))
+            raise
+
+        if cached:
+            self._get_count_cache().set(cache_key, total)
+        return total
+
+    async def count_by(
+        self, table: str, column: str, filters: dict | None = None, cached: bool = False
+    ) -> dict[Any, int]:
+        """
+        Count records per distinct value of a column (GROUP BY column).
+
+        Args:
+            table: Table name
+            column: Column to group by
+            filters: Optional filters (same forms as ``query``)
+            cached: Reuse counts for the same filters for up to
+                settings.seekdb_count_cache_ttl_seconds, so they may lag writes
+
+        Returns:
+            Mapping of column value to record count
+        """
+        cache_key = self._count_cache_key(f"count_by:{column}", table, filters)
+        if cached:
+            counts = self._get_count_cache().get(cache_key)
+            if counts is not None:
+                return counts
+
+        try:
+            rows = await self._execute(
+                lambda client: client.aggregate(
+                    table, group_by=[column], aggregates={"count": "count"}, filters=filters
+                )
+            )
+        except Exception as e:
+            logger.error("Aggregate failed", table=table, column=column, error=str(e))
+            raise
+
+        counts = {row[column]: row["count"] for row in rows}
+        if cached:
+            self._get_count_cache().set(cache_key, counts)
+        return counts
+
+    def _get_count_cache(self) -> TTLCache:
+        if self._count_cache is None:
+            self._count_cache = TTLCache(
+                max_entries=settings.seekdb_count_cache_size,
+                ttl_seconds=settings.seekdb_count_cache_ttl_seconds,
+            )
+        return self._count_cache
+
+    def _count_cache_key(self, kind: str, table: str, filters: dict | None) -> str:
+        return f"{kind}:{table}:{json.dumps(filters or {}, sort_keys=True, default=str)}"
+
+    async def insert_many(
+        self,
+        table: str,
+        rows: list[dict],
+        batch_size: int | None = None,
+        key_column: str | None = None,
+    ) -> BulkWriteResult:
+        """
+        Insert many records, one round-trip per chunk.
+
+        A chunk the server rejects is retried row by row so one bad row
+        doesn't fail the rest; those rows are reported in ``failed``.
+
+        Args:
+            table: Table name
+            rows: Records to insert
+            batch_size: Rows per chunk (defaults to settings.seekdb_bulk_batch_size)
+            key_column: Column identifying failed rows (defaults to the
+                table's primary key; needed for tables outside PRIMARY_KEYS)
+
+        Returns:
+            Bulk write result
+        """
+        key_column = key_column or PRIMARY_KEYS[table]
+        return await self._write_many(
+            "insert_many",
+            table,
+            rows,
+            key=lambda row: str(row.get(key_column)),
+            bulk=lambda client, chunk: client.insert_many(table, chunk),
+            single=lambda client, row: client.insert(table, row),
+            batch_size=batch_size,
+        )
+
+    async def update_many(
+        self, table: str, rows: list[dict], batch_size: int | None = None
+    ) -> BulkWriteResult:
+        """
+        Update many records, one round-trip per chunk.
+
+        Args:
+            table: Table name
+            rows: Partial records, each including the primary key column
+            batch_size: Rows per chunk (defaults to settings.seekdb_bulk_batch_size)
+
+        Returns:
+            Bulk write result
+        """
+        key_column = PRIMARY_KEYS[table]
+        return await self._write_many(
+            "update_many",
+            table,
+            rows,
+            key=lambda row: str(row.get(key_column)),
+            bulk=lambda client, chunk: client.update_many(table, chunk),
+            single=lambda client, row: client.update(
+                table, row[key_column], {k: v for k, v in row.items() if k != key_column}
+            ),
+            batch_size=batch_size,
+        )
+
+    async def upsert_many(
+        self, table: str, rows: list[dict], batch_size: int | None = None
+    ) -> BulkWriteResult:
+        """
+        Insert or replace many records.
+
+        Uses the server's bulk upsert when the connection has one. Otherwise
+        each chunk looks up which keys exist and is split into a bulk insert
+        and a bulk update on the same connection, so it still costs a few
+        round-trips per chunk.
+
+        Args:
+            table: Table name
+            rows: Full records, each including the primary key column
+            batch_size: Rows per chunk (defaults to settings.seekdb_bulk_batch_size)
+
+        Returns:
+            Bulk write result
+        """
+        key_column = PRIMARY_KEYS[table]
+
+        def key(row: dict) -> str:
+            return str(row.get(key_column))
+
+        async def split_upsert(client: Any, chunk: list[dict]) -> BulkWriteResult:
+            keys = [row[key_column] for row in chunk]
+            found = await client.query(
+                table, filters={key_column: keys}, limit=len(keys), offset=0
+            )
+            existing = {str(row[key_column]) for row in found}
+            result = BulkWriteResult(round_trips=1)
+            result.merge(
+                await self._write_chunk(
+                    client,
+                    "insert_many",
+                    table,
+                    [row for row in chunk if key(row) not in existing],
+                    key,
+                    bulk=lambda client, rows: client.insert_many(table, rows),
+                    single=lambda client, row: client.insert(table, row),
+                )
+            )
+            result.merge(
+                await self._write_chunk(
+                    client,
+                    "update_many",
+                    table,
+                    [row for row in chunk if key(row) in existing],
+                    key,
+                    bulk=lambda client, rows: client.update_many(table, rows),
+                    single=lambda client, row: client.update(
+                        table, row[key_column], {k: v for k, v in row.items() if k != key_column}
+                    ),
+                )
+            )
+            return result
+
+        return await self._write_many(
+            "upsert_many",
+            table,
+            rows,
+            key=key,
+            bulk=lambda client, chunk: client.upsert_many(table, chunk),
+            single=lambda client, row: client.upsert(table, row),
+            batch_size=batch_size,
+            fallback=split_upsert,
+        )
+
+    async def delete_many(
+        self, table: str, primary_keys: list[str], batch_size: int | None = None
+    ) -> BulkWriteResult:
+        """
+        Delete many records by primary key, one round-trip per chunk.
+
+        Args:
+            table: Table name
+            primary_keys: Primary key values to delete
+            batch_size: Keys per chunk (defaults to settings.seekdb_bulk_batch_size)
+
+        Returns:
+            Bulk write result
+        """
+        return await self._write_many(
+            "delete_many",
+            table,
+            list(dict.fromkeys(primary_keys)),
+            key=str,
+            bulk=lambda client, chunk: client.delete_many(table, chunk),
+            single=lambda client, primary_key: client.delete(table, primary_key),
+            batch_size=batch_size,
+        )
+
+    async def _write_many(
+        self,
+        operation: str,
+        table: str,
+        items: list,
+        key: Callable[[Any], str],
+        bulk: Callable[[Any, list], Awaitable[Any]],
+        single: Callable[[Any, Any], Awaitable[Any]],
+        batch_size: int | None,
+        fallback: Callable[[Any, list], Awaitable[BulkWriteResult]] | None = None,
+    ) -> BulkWriteResult:
+        """
+        Write items in chunks with the bulk call, isolating failures per row.
+
+        Chunks run concurrently on pooled connections. The bulk call is
+        looked up on the connection doing the write; without it the chunk
+        goes to ``fallback`` (on that connection) if given, else row by row.
+        """
+        result = BulkWriteResult(total=len(items))
+        if not items:
+            return result
+
+        batch_size = batch_size or settings.seekdb_bulk_batch_size
+        chunks = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+        async def write_chunk(chunk: list) -> BulkWriteResult:
+            async with self.connection() as client:
+                if fallback is not None and not hasattr(client, operation):
+                    return await fallback(client, chunk)
+                return await self._write_chunk(client, operation, table, chunk, key, bulk, single)
+
+        outcomes = await asyncio.gather(
+            *(write_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+        result.total = 0
+        for chunk, outcome in zip(chunks, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                result.merge(
+                    BulkWriteResult(
+                        total=len(chunk), failed={key(item): str(outcome) for item in chunk}
+                    )
+                )
+            else:
+                result.merge(outcome)
+
+        log = logger.warning if result.failed else logger.debug
+        log(
+            "Bulk write completed",
+            operation=operation,
+            table=table,
+            total=result.total,
+            succeeded=result.succeeded,
+            failed=len(result.failed),
+            round_trips=result.round_trips,
+        )
+        return result
+
+    async def _write_chunk(
+        self,
+        client: Any,
+        operation: str,
+        table: str,
+        chunk: list,
+        key: Callable[[Any], str],
+        bulk: Callable[[Any, list], Awaitable[Any]],
+        single: Callable[[Any, Any], Awaitable[Any]],
+    ) -> BulkWriteResult:
+        """Write one chunk on a connection, row by row if the bulk call is missing or fails"""
+        result = BulkWriteResult(total=len(chunk))
+        if not chunk:
+            return result
+        if hasattr(client, operation):
+            result.round_trips += 1
+            try:
+                await bulk(client, chunk)
+                result.succeeded = len(chunk)
+                return result
+            except CONNECTION_ERRORS:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "Bulk write chunk failed, retrying row by row",
+                    operation=operation,
+                    table=table,
+                    rows=len(chunk),
+                    error=str(e),
+                )
+        for item in chunk:
+            result.round_trips += 1
+            try:
+                await single(client, item)
+                result.succeeded += 1
+            except CONNECTION_ERRORS:
+                raise
+            except Exception as e:
+                result.failed[key(item)] = str(e)
+        return result
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    """Make a keyset value JSON-serializable, keeping datetimes distinguishable"""
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        try:
+            return datetime.fromisoformat(value["dt"])
+        except (TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+    return value
+
 
 seekdb_client = SeekDBClient()
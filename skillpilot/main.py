@@ -8,7 +8,11 @@ from fastapi.responses import JSONResponse
 
 from skillpilot.api.routes import auth, orchestration, skill, vector_search
 from skillpilot.core.config import settings
+from skillpilot.core.services.embedding import embedding_service
+from skillpilot.core.services.similarity_graph import similarity_graph_service
+from skillpilot.core.services.vector_search import vector_search_service
 from skillpilot.core.utils.logger import configure_logging, get_logger
+from skillpilot.core.utils.timing import format_server_timing, start_request_timings
 from skillpilot.db.seekdb import seekdb_client
 
 logger = get_logger(__name__)
@@ -22,8 +26,8 @@ async def lifespan(app: FastAPI):
     logger.info("SkillPilot starting up", version="0.2.0", debug=settings.debug)
     
     try:
-        # Connect to SeekDB
-        seekdb_client.connect()
+        # Open the SeekDB connection pool
+        await seekdb_client.connect()
         logger.info("Database connection established")
         
         # Create tables if they don't exist
@@ -34,11 +38,23 @@ async def lifespan(app: FastAPI):
         logger.error("Failed to initialize database", error=str(e))
         raise
     
+    # Load skill vectors and keywords into the in-process indexes
+    await vector_search_service.load_local_index()
+    await vector_search_service.load_keyword_index()
+
+    # Periodically rebuild the similar-skills graph
+    if settings.similarity_graph_enabled:
+        similarity_graph_service.start_periodic_rebuild(
+            settings.similarity_graph_rebuild_interval_seconds
+        )
+
     yield
     
     # Shutdown
     logger.info("SkillPilot shutting down")
-    seekdb_client.close()
+    await similarity_graph_service.stop()
+    await embedding_service.close()
+    await seekdb_client.close()
     logger.info("Database connection closed")
 
 
@@ -62,6 +78,16 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def server_timing(request: Request, call_next):
+    """Report stage latencies recorded while handling the request"""
+    timings = start_request_timings()
+    response = await call_next(request)
+    if timings:
+        response.headers["Server-Timing"] = format_server_timing(timings)
+    return response
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -101,12 +127,13 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    db_status = "connected" if seekdb_client._client else "disconnected"
+    db_status = "connected" if seekdb_client.connected else "disconnected"
     
     return {
         "status": "healthy",
         "version": "0.2.0",
         "database": db_status,
+        "database_pool": seekdb_client.pool_stats(),
         "debug": settings.debug,
     }
 
@@ -154,6 +154,80 @@ class TestSkillHubAPI:
                     assert "steps" in data
 
 
+    @pytest.mark.asyncio
+    async def test_hybrid_search_reports_stage_timings(self, client):
+        """Test hybrid vector search returns fused results and a Server-Timing header"""
+        skills = {
+            "sk_pdf": {"skill_id": "sk_pdf", "skill_name": "PDF Extractor", "platform": "coze"},
+            "sk_doc": {"skill_id": "sk_doc", "skill_name": "Document Reader", "platform": "coze"},
+        }
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+        ):
+            mock_embedding.generate_embedding = AsyncMock(return_value=[0.1, 0.2])
+            mock_db.vector_search = AsyncMock(return_value=[
+                {"skill_id": "sk_doc", "similarity": 0.8},
+                {"skill_id": "sk_pdf", "similarity": 0.7},
+            ])
+            async def scan(*args, **kwargs):
+                yield list(skills.values())
+
+            mock_db.scan = MagicMock(side_effect=scan)
+            mock_db.get_many = AsyncMock(
+                side_effect=lambda table, ids: {i: skills[i] for i in ids}
+            )
+
+            response = await client.post(
+                "/api/v1/vector/search", params={"query": "pdf", "mode": "hybrid"}
+            )
+
+            assert response.status_code == 200
+            assert response.json()[0]["skill_id"] == "sk_pdf"
+            timing = response.headers["Server-Timing"]
+            for stage in ("embed", "ann", "keyword", "fusion", "hydrate"):
+                assert f"{stage};dur=" in timing
+
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_rejects_semantic_reranking(self, client):
+        """Test that MMR and blended ranking are rejected in hybrid mode"""
+        for params in ({"mmr_lambda": 0.5}, {"ranking": "blended"}):
+            response = await client.post(
+                "/api/v1/vector/search", params={"query": "pdf", "mode": "hybrid", **params}
+            )
+
+            assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_batch_search_endpoint(self, client):
+        """Test batch search returns results per query in request order"""
+        from skillpilot.core.models.skill import SkillSearchResult
+
+        result = SkillSearchResult(skill_name="PDF Extractor", platform=PlatformType.COZE)
+        with patch(
+            "skillpilot.api.routes.vector_search.vector_search_service.search_skills_batch",
+            AsyncMock(return_value=[[result], []]),
+        ):
+            response = await client.post(
+                "/api/v1/vector/search/batch",
+                json={"queries": [{"query": "pdf"}, {"query": "translate", "top_k": 3}]},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["query"] for item in data] == ["pdf", "translate"]
+        assert data[0]["results"][0]["skill_name"] == "PDF Extractor"
+        assert data[1]["results"] == []
+
+    @pytest.mark.asyncio
+    async def test_batch_search_rejects_empty_batch(self, client):
+        """Test that an empty batch is a validation error"""
+        response = await client.post("/api/v1/vector/search/batch", json={"queries": []})
+
+        assert response.status_code == 422
+
+
 class TestSeekDBIntegration:
     """SeekDB Integration Tests"""
 
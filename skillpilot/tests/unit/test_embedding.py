@@ -1,5 +1,8 @@
 """Tests for Embedding Service"""
 
+import random
+
+import numpy as np
 import pytest
 
 from skillpilot.core.services.embedding import embedding_service
@@ -56,6 +59,31 @@ class TestEmbeddingService:
         assert len(embeddings) == len(texts)
         assert all(isinstance(emb, list) for emb in embeddings)
 
+    @pytest.mark.asyncio
+    async def test_mock_batch_matches_single(self):
+        """Test that mock embeddings don't depend on batch composition"""
+        embedding_service.set_provider("mock")
+
+        matrix = embedding_service._mock_embeddings(["alpha", "beta"])
+        single = embedding_service._mock_embeddings(["beta"])
+
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (2, embedding_service.dimension)
+        assert np.array_equal(matrix[1], single[0])
+        assert matrix.min() >= -1.0 and matrix.max() < 1.0
+
+    @pytest.mark.asyncio
+    async def test_mock_leaves_global_random_untouched(self):
+        """Test that mock embeddings don't reseed the global random module"""
+        embedding_service.set_provider("mock")
+
+        random.seed(1234)
+        expected = random.random()
+        random.seed(1234)
+        embedding_service._mock_embeddings(["some text"])
+
+        assert random.random() == expected
+
     @pytest.mark.asyncio
     async def test_provider_switching(self):
         """Test switching between providers"""
@@ -0,0 +1,120 @@
+"""Tests for Embedding Batcher"""
+
+import asyncio
+import gc
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from skillpilot.core.services.embedding import EmbeddingService
+from skillpilot.core.services.embedding_batcher import EmbeddingBatcher
+
+
+def fake_embed(texts, **_):
+    """Embed each text as a one-element vector of its length"""
+    return [[float(len(text))] for text in texts]
+
+
+class TestEmbeddingBatcher:
+    """Test request coalescing"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesced(self):
+        """Test that concurrent requests are merged into one batch call"""
+        embed = AsyncMock(side_effect=fake_embed)
+        batcher = EmbeddingBatcher(embed, max_wait_ms=5, max_batch_size=100)
+
+        results = await asyncio.gather(*(batcher.submit("x" * n) for n in range(1, 11)))
+
+        embed.assert_called_once()
+        assert results == [[float(n)] for n in range(1, 11)]
+
+    @pytest.mark.asyncio
+    async def test_identical_texts_deduplicated(self):
+        """Test that identical in-flight texts are embedded once"""
+        embed = AsyncMock(side_effect=fake_embed)
+        batcher = EmbeddingBatcher(embed, max_wait_ms=5)
+
+        results = await asyncio.gather(*(batcher.submit("same") for _ in range(5)))
+
+        assert embed.call_args.args[0] == ["same"]
+        assert all(r == [4.0] for r in results)
+        assert batcher.stats()["deduplicated"] == 4
+
+    @pytest.mark.asyncio
+    async def test_size_cap_flushes_immediately(self):
+        """Test that reaching the size cap dispatches without waiting"""
+        embed = AsyncMock(side_effect=fake_embed)
+        batcher = EmbeddingBatcher(embed, max_wait_ms=10_000, max_batch_size=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("bb")), timeout=1
+        )
+
+        assert results == [[1.0], [2.0]]
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        """Test that a failed batch fails every waiter"""
+        batcher = EmbeddingBatcher(AsyncMock(side_effect=RuntimeError("boom")), max_wait_ms=1)
+
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_highest_max_retries(self):
+        """Test that a batch is retried as often as its most patient waiter asked"""
+        embed = AsyncMock(side_effect=fake_embed)
+        batcher = EmbeddingBatcher(embed, max_wait_ms=5)
+
+        await asyncio.gather(batcher.submit("a", max_retries=1), batcher.submit("b", max_retries=5))
+        await batcher.submit("c", max_retries=2)
+
+        assert [call.kwargs["max_retries"] for call in embed.call_args_list] == [5, 2]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_fails_waiters(self, caplog):
+        """Test that waiters of a cancelled batch get an error instead of hanging"""
+        started = asyncio.Event()
+
+        async def slow_embed(texts, **_):
+            started.set()
+            await asyncio.sleep(10)
+
+        batcher = EmbeddingBatcher(slow_embed, max_wait_ms=1)
+        waiters = [asyncio.ensure_future(batcher.submit(text)) for text in ("a", "b", "c")]
+        await started.wait()
+        # A caller that gave up must not leave an unretrieved exception behind
+        waiters[0].cancel()
+        for batch in batcher._tasks:
+            batch.cancel()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*waiters[1:], return_exceptions=True), timeout=1
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert waiters[0].cancelled()
+
+        del waiters, batch
+        gc.collect()
+        assert "never retrieved" not in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_service_coalesces_non_mock_providers(self):
+        """Test that the embedding service routes single calls through the batcher"""
+        service = EmbeddingService()
+        service.provider = "openai"
+        service.cache = None
+
+        with patch.object(
+            service,
+            "_embed_batch_uncached",
+            AsyncMock(side_effect=lambda texts, **_: fake_embed(texts)),
+        ) as mock_embed:
+            await asyncio.gather(*(service.generate_embedding(f"q{i}") for i in range(8)))
+
+        mock_embed.assert_called_once()
+        assert len(mock_embed.call_args.args[0]) == 8
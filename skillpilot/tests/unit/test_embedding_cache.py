@@ -0,0 +1,125 @@
+"""Tests for Embedding Cache"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from skillpilot.core.services.embedding import EmbeddingService
+from skillpilot.core.services.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Test embedding cache functionality"""
+
+    def test_key_includes_provider_model_and_dimension(self):
+        """Test that keys differ when any embedding setting differs"""
+        base = EmbeddingCache.make_key("openai", "m1", 1536, "text")
+
+        assert base == EmbeddingCache.make_key("openai", "m1", 1536, "text")
+        assert base != EmbeddingCache.make_key("local", "m1", 1536, "text")
+        assert base != EmbeddingCache.make_key("openai", "m2", 1536, "text")
+        assert base != EmbeddingCache.make_key("openai", "m1", 384, "text")
+        assert base != EmbeddingCache.make_key("openai", "m1", 1536, "other")
+
+    def test_memory_lru_eviction(self):
+        """Test that the memory tier evicts least recently used entries"""
+        cache = EmbeddingCache(memory_size=2)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        cache.get("a")  # a is now most recently used
+        cache.put("c", [3.0])
+
+        assert cache.get("a") == [1.0]
+        assert cache.get("b") is None
+        assert cache.get("c") == [3.0]
+        assert cache.stats()["evictions"] == 1
+
+    def test_disk_tier_persists(self, tmp_path):
+        """Test that the disk tier survives a new cache instance"""
+        path = str(tmp_path / "embeddings.sqlite")
+        cache = EmbeddingCache(disk_path=path)
+        cache.put("k", [0.1, -0.2, 0.3])
+        cache.close()
+
+        reopened = EmbeddingCache(disk_path=path)
+        assert reopened.get("k") == [0.1, -0.2, 0.3]
+        assert reopened.stats()["disk_hits"] == 1
+
+    def test_disk_size_bound(self, tmp_path):
+        """Test that the disk tier is bounded"""
+        cache = EmbeddingCache(
+            memory_size=1, disk_path=str(tmp_path / "e.sqlite"), disk_max_entries=3
+        )
+        cache.put_many({f"k{i}": [float(i)] for i in range(5)})
+
+        assert cache.stats()["disk_entries"] == 3
+
+    def test_hit_rate(self):
+        """Test hit-rate statistics"""
+        cache = EmbeddingCache()
+        cache.put("a", [1.0])
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+
+    @pytest.mark.asyncio
+    async def test_async_disk_tier_tracks_count(self, tmp_path):
+        """Test the async tier API and the disk count kept across reopen"""
+        path = str(tmp_path / "e.sqlite")
+        cache = EmbeddingCache(memory_size=1, disk_path=path, disk_max_entries=200)
+        await cache.aput_many({f"k{i}": [float(i)] for i in range(3)})
+        await cache.aput_many({"k0": [9.0]})  # replacing doesn't add a row
+        assert cache.stats()["disk_entries"] == 3
+        assert await cache.aget_many(["k0", "k1", "missing"]) == {"k0": [9.0], "k1": [1.0]}
+        cache.close()
+
+        reopened = EmbeddingCache(disk_path=path, disk_max_entries=200)
+        assert reopened.stats()["disk_entries"] == 3
+        reopened.put_many({f"n{i}": [0.0] for i in range(198)})
+        # Crossing the bound evicts a batch of the least recently used rows
+        assert reopened.stats()["disk_entries"] == 199
+        assert reopened.get("k2") is None
+        reopened.close()
+
+
+class TestEmbeddingServiceCaching:
+    """Test that the embedding service uses the cache transparently"""
+
+    @pytest.mark.asyncio
+    async def test_single_embedding_cached(self):
+        """Test that repeated single calls hit the provider once"""
+        service = EmbeddingService()
+        service.set_provider("mock")
+
+        with patch.object(
+            service, "_embed_batch_uncached", AsyncMock(return_value=[[0.5] * 4])
+        ) as mock_generate:
+            first = await service.generate_embedding("same text")
+            second = await service.generate_embedding("same text")
+
+        assert first == second
+        mock_generate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_embeds_only_misses(self):
+        """Test that batch calls only embed uncached, deduplicated texts"""
+        service = EmbeddingService()
+        service.set_provider("mock")
+        await service.generate_embedding("cached")
+
+        with patch.object(
+            service,
+            "_embed_batch_uncached",
+            AsyncMock(side_effect=lambda texts, **_: [[float(len(t))] for t in texts]),
+        ) as mock_embed:
+            embeddings = await service.generate_embeddings_batch(["cached", "new", "new"])
+
+        mock_embed.assert_called_once()
+        assert mock_embed.call_args.args[0] == ["new"]
+        assert len(embeddings) == 3
+        assert embeddings[1] == embeddings[2] == [3.0]
@@ -0,0 +1,107 @@
+"""Tests for Embedding Batch Planner"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from skillpilot.core.services.embedding import EmbeddingService
+from skillpilot.core.services.embedding_planner import (
+    BatchLimits,
+    estimate_tokens,
+    plan_embedding_batches,
+    truncate_to_tokens,
+)
+
+
+class TestEmbeddingPlanner:
+    """Test token-aware batch planning"""
+
+    @pytest.fixture(autouse=True)
+    def heuristic_tokens(self):
+        """Pin the character heuristic whether or not tiktoken is installed"""
+        with patch("skillpilot.core.services.embedding_planner._tokenizer", return_value=None):
+            yield
+
+    def test_estimate_tokens(self):
+        """Test token estimation for ASCII and CJK text"""
+        assert estimate_tokens("") == 1
+        assert estimate_tokens("abcd" * 10) == 10
+        assert estimate_tokens("技能搜索") == 4
+        # Non-ASCII text never falls under the four-characters-per-token rule
+        assert estimate_tokens("résumé naïve") >= len("résumé naïve") // 4 + 3
+
+    def test_estimate_tokens_uses_tokenizer(self):
+        """Test that a tokenizer, when available, gives the count"""
+        tokenizer = MagicMock()
+        tokenizer.encode.return_value = list(range(7))
+
+        with patch(
+            "skillpilot.core.services.embedding_planner._tokenizer", return_value=tokenizer
+        ):
+            assert estimate_tokens("anything") == 7
+            tokenizer.encode.return_value = []
+            assert estimate_tokens("") == 1
+
+    def test_truncate_is_deterministic(self):
+        """Test that oversized texts are truncated to the same prefix"""
+        text = "word " * 1000
+
+        truncated = truncate_to_tokens(text, 100)
+
+        assert estimate_tokens(truncated) <= 100
+        assert text.startswith(truncated)
+        assert truncated == truncate_to_tokens(text, 100)
+        assert truncate_to_tokens("short", 100) == "short"
+
+    def test_packs_by_tokens(self):
+        """Test that batches respect the per-request token limit"""
+        texts = ["a" * 400] * 10  # 100 tokens each
+        batches = plan_embedding_batches(texts, BatchLimits(max_items=100, max_tokens=350))
+
+        assert [len(b.texts) for b in batches] == [3, 3, 3, 1]
+        assert all(b.tokens <= 350 for b in batches)
+
+    def test_packs_by_items_and_keeps_order(self):
+        """Test item limits and that indices preserve input order"""
+        texts = [f"text {i}" for i in range(7)]
+        batches = plan_embedding_batches(texts, BatchLimits(max_items=3))
+
+        assert [b.indices for b in batches] == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_oversized_input_truncated(self):
+        """Test that one oversized text doesn't exceed the per-input limit"""
+        batches = plan_embedding_batches(
+            ["ok", "x" * 10000], BatchLimits(max_items=10, max_input_tokens=50)
+        )
+
+        assert len(batches) == 1
+        assert estimate_tokens(batches[0].texts[1]) <= 50
+
+
+class TestConcurrentBatching:
+    """Test concurrent dispatch in the embedding service"""
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently_in_order(self):
+        """Test that planned requests overlap and results keep input order"""
+        service = EmbeddingService()
+        service.set_provider("mock")
+        service.cache = None
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(texts, max_retries=3):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[float(t.split()[1])] for t in texts]
+
+        texts = [f"text {i}" for i in range(20)]
+        with patch.object(service, "_embed_batch_uncached", side_effect=fake_request):
+            embeddings = await service.generate_embeddings_batch(texts, batch_size=4)
+
+        assert embeddings == [[float(i)] for i in range(20)]
+        assert peak > 1
@@ -0,0 +1,66 @@
+"""Keyword Index Unit Tests"""
+
+from skillpilot.core.services.keyword_index import KeywordIndex, tokenize
+
+
+def _fields(name: str, description: str = "", capabilities=None, tags=None) -> dict:
+    return {
+        "skill_name": name,
+        "description": description,
+        "capabilities": capabilities or [],
+        "tags": tags or [],
+    }
+
+
+class TestKeywordIndex:
+    """Keyword index tests"""
+
+    def test_tokenize(self):
+        """Test word splitting and CJK bigrams"""
+        assert tokenize("Code-Review, PDF_tools!") == ["code", "review", "pdf", "tools"]
+        assert tokenize("代码审查") == ["代码", "码审", "审查"]
+
+    def test_word_boundaries(self):
+        """Test that queries match whole terms, not substrings"""
+        index = KeywordIndex()
+        index.add("sk_1", _fields("Cat translator"))
+        index.add("sk_2", _fields("Concatenate files"))
+
+        assert [skill_id for skill_id, _ in index.search("cat", 10)] == ["sk_1"]
+
+    def test_bm25_ranking(self):
+        """Test that rarer terms and name matches rank higher"""
+        index = KeywordIndex()
+        index.add("sk_review", _fields("Code review", "Reviews pull requests"))
+        index.add("sk_format", _fields("Formatter", "Formats code"))
+        index.add("sk_lint", _fields("Linter", "Checks code style"))
+
+        hits = index.search("code review", 10)
+
+        assert hits[0][0] == "sk_review"
+        assert {skill_id for skill_id, _ in hits} == {"sk_review", "sk_format", "sk_lint"}
+        assert hits[0][1] > hits[1][1]
+
+    def test_incremental_update_and_remove(self):
+        """Test that re-adding replaces terms and removing drops postings"""
+        index = KeywordIndex()
+        index.add("sk_1", _fields("PDF parser"))
+        index.add("sk_1", _fields("Image resizer"))
+
+        assert index.search("pdf", 10) == []
+        assert index.search("image", 10)[0][0] == "sk_1"
+
+        assert index.remove("sk_1")
+        assert not index.remove("sk_1")
+        assert index.search("image", 10) == []
+        assert index.stats()["terms"] == 0
+
+    def test_filters(self):
+        """Test filter conditions on keyword results"""
+        index = KeywordIndex()
+        index.add("sk_coze", _fields("Translator"), {"platform": "coze"})
+        index.add("sk_dify", _fields("Translator"), {"platform": "dify"})
+
+        hits = index.search("translator", 10, {"platform": ["dify"]})
+
+        assert [skill_id for skill_id, _ in hits] == ["sk_dify"]
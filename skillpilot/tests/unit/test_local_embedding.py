@@ -0,0 +1,104 @@
+"""Tests for Local Embedding Executor"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from skillpilot.core.services.local_embedding import LocalEmbeddingExecutor
+
+
+class TestLocalEmbeddingExecutor:
+    """Test off-loop local embedding execution"""
+
+    @pytest.mark.asyncio
+    async def test_encode_runs_off_event_loop(self):
+        """Test that encoding doesn't block other coroutines"""
+        loop_thread = threading.get_ident()
+        encode_threads = []
+
+        def slow_encoder(texts):
+            encode_threads.append(threading.get_ident())
+            time.sleep(0.2)
+            return [[1.0] for _ in texts]
+
+        executor = LocalEmbeddingExecutor("test-model", encoder=slow_encoder)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        await executor.encode(["text"])
+        ticker_task.cancel()
+        executor.shutdown()
+
+        assert ticks >= 5
+        assert encode_threads and encode_threads[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_pending_requests_batched(self):
+        """Test that queued requests are merged into one encode call and split back"""
+        calls = []
+        gate = threading.Event()
+
+        def encoder(texts):
+            calls.append(list(texts))
+            gate.wait(timeout=1)
+            return [[float(len(t))] for t in texts]
+
+        executor = LocalEmbeddingExecutor("test-model", encoder=encoder, max_batch_size=64)
+
+        first = asyncio.create_task(executor.encode(["a"]))
+        await asyncio.sleep(0.05)  # first call occupies the worker
+        rest = [asyncio.create_task(executor.encode(["bb", "ccc"])) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        gate.set()
+
+        assert await first == [[1.0]]
+        assert [await task for task in rest] == [[[2.0], [3.0]]] * 3
+        assert len(calls) == 2
+        assert len(calls[1]) == 6
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_encoder_errors_propagate(self):
+        """Test that encoder failures reach the caller"""
+
+        def failing_encoder(texts):
+            raise RuntimeError("model failure")
+
+        executor = LocalEmbeddingExecutor("test-model", encoder=failing_encoder)
+
+        with pytest.raises(RuntimeError, match="model failure"):
+            await executor.encode(["text"])
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_fails_pending_requests(self):
+        """Test that shutdown fails queued and in-flight requests instead of leaving them hanging"""
+        gate = threading.Event()
+
+        def blocking_encoder(texts):
+            gate.wait(timeout=1)
+            return [[1.0] for _ in texts]
+
+        executor = LocalEmbeddingExecutor(
+            "test-model", encoder=blocking_encoder, max_batch_size=1
+        )
+        in_flight = asyncio.create_task(executor.encode(["a"]))
+        await asyncio.sleep(0.05)  # the worker is now encoding "a"
+        queued = asyncio.create_task(executor.encode(["b"]))
+        await asyncio.sleep(0.01)
+
+        executor.shutdown()
+        gate.set()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(in_flight, queued, return_exceptions=True), timeout=1
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
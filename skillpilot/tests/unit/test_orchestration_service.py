@@ -197,13 +197,20 @@ class TestOrchestrationService:
         ]
 
         with patch("skillpilot.core.services.orchestration.seekdb_client") as mock_db:
-            mock_db.query = AsyncMock(return_value=mock_plans)
+            mock_db.query_page = AsyncMock(return_value=(mock_plans, "next"))
+            mock_db.count = AsyncMock(return_value=45)
 
             plans, pagination = await service.list_plans("usr_test", page=1, limit=20)
 
             assert len(plans) == 2
             assert pagination["page"] == 1
             assert pagination["limit"] == 20
+            assert pagination["total"] == 45
+            assert pagination["total_pages"] == 3
+            assert pagination["next_cursor"] == "next"
+            mock_db.count.assert_called_once_with(
+                "orchestration_plans", filters={"user_id": "usr_test"}, cached=True
+            )
 
     @pytest.mark.asyncio
     async def test_generate_skill_chain_with_web_scraping(self):
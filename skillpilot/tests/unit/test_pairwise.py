@@ -0,0 +1,66 @@
+"""Pairwise Similarity Unit Tests"""
+
+import numpy as np
+import pytest
+
+from skillpilot.core.services.pairwise import blocked_top_k, plan_blocks
+
+
+def _normalized(count: int, dimension: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).normal(size=(count, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class TestPlanBlocks:
+    """Block planning tests"""
+
+    def test_block_fits_budget(self):
+        """Test that the chosen block keeps peak memory under the budget"""
+        plan = plan_blocks(500_000, 384, 20, 1024 * 1024 * 1024)
+
+        assert plan.peak_bytes <= 1024 * 1024 * 1024
+        assert plan.block_size >= 1024
+        assert plan.blocks == -(-500_000 // plan.block_size)
+
+    def test_budget_too_small(self):
+        """Test that a budget below the top-K buffers is rejected"""
+        with pytest.raises(ValueError):
+            plan_blocks(500_000, 384, 20, 1024 * 1024)
+
+
+class TestBlockedTopK:
+    """Blocked top-K tests"""
+
+    def test_matches_brute_force(self):
+        """Test that blocking gives the same neighbors as a full matrix"""
+        vectors = _normalized(300, 16)
+        k = 5
+
+        # Small budget forces many blocks
+        indices, scores = blocked_top_k(vectors, k, memory_bytes=300_000)
+
+        similarities = vectors @ vectors.T
+        np.fill_diagonal(similarities, -np.inf)
+        expected = np.argsort(-similarities, axis=1)[:, :k]
+
+        assert plan_blocks(300, 16, k, 300_000).blocks > 1
+        np.testing.assert_array_equal(indices, expected)
+        np.testing.assert_allclose(
+            scores, np.take_along_axis(similarities, expected, axis=1), rtol=1e-5
+        )
+
+    def test_pads_when_fewer_than_k(self):
+        """Test that rows with fewer than k other vectors are padded"""
+        indices, scores = blocked_top_k(_normalized(3, 4), 5, memory_bytes=1024 * 1024)
+
+        assert (indices[:, :2] >= 0).all()
+        assert (indices[:, 2:] == -1).all()
+        assert np.isneginf(scores[:, 2:]).all()
+
+    def test_reports_progress(self):
+        """Test that progress covers every block pair"""
+        reports = []
+        blocked_top_k(_normalized(100, 8), 3, memory_bytes=60_000, progress=reports.append)
+
+        assert reports[-1].block_pairs_done == reports[-1].block_pairs_total
+        assert reports[-1].pairs_done > 0
@@ -0,0 +1,179 @@
+"""Connection Pool Unit Tests"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from skillpilot.core.config import settings  # noqa: F401  (import before skillpilot.db)
+from skillpilot.db.pool import ConnectionPool, PoolClosedError, PoolTimeoutError
+
+
+def _pool(**kwargs) -> tuple[ConnectionPool, list[MagicMock]]:
+    """Pool of MagicMock connections, with the list of every connection opened"""
+    opened: list[MagicMock] = []
+
+    async def connect() -> MagicMock:
+        connection = MagicMock(name=f"conn{len(opened)}")
+        opened.append(connection)
+        return connection
+
+    return ConnectionPool(connect=connect, disconnect=lambda c: c.close(), **kwargs), opened
+
+
+class TestConnectionPool:
+    """Connection pool tests"""
+
+    @pytest.mark.asyncio
+    async def test_open_and_reuse(self):
+        """Test that min_size connections open up front and are reused"""
+        pool, opened = _pool(min_size=2, max_size=4)
+        await pool.open()
+        assert len(opened) == 2
+
+        async with pool.connection() as first:
+            pass
+        async with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert len(opened) == 2
+        assert pool.stats()["acquired"] == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_grows_to_max_then_waits(self):
+        """Test that concurrent checkouts open up to max_size and then time out"""
+        pool, opened = _pool(min_size=0, max_size=2, acquire_timeout=0.05)
+
+        first = await pool.acquire()
+        second = await pool.acquire()
+        assert len(opened) == 2
+        assert pool.stats()["utilization"] == 1.0
+
+        with pytest.raises(PoolTimeoutError):
+            await pool.acquire()
+        assert pool.stats()["timeouts"] == 1
+
+        # A waiter gets the next released connection
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        await pool.release(first)
+        assert await asyncio.wait_for(waiter, 1) is first
+        await pool.release(second)
+
+    @pytest.mark.asyncio
+    async def test_connection_error_discards(self):
+        """Test that a connection error inside the block closes the connection"""
+        pool, opened = _pool(min_size=1, max_size=2)
+        await pool.open()
+
+        with pytest.raises(ConnectionResetError):
+            async with pool.connection():
+                raise ConnectionResetError("reset")
+
+        opened[0].close.assert_called_once()
+        async with pool.connection() as connection:
+            assert connection is opened[1]
+        assert pool.stats()["discarded"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_replaces_broken_connection(self):
+        """Test that an idle connection failing its check is replaced on checkout"""
+        checked = []
+
+        async def health_check(connection):
+            checked.append(connection)
+            if len(checked) == 1:
+                raise ConnectionError("gone")
+
+        pool, opened = _pool(
+            min_size=1, max_size=2, health_check=health_check, health_check_interval=0
+        )
+        await pool.open()
+
+        async with pool.connection() as connection:
+            assert connection is opened[1]
+        opened[0].close.assert_called_once()
+        assert pool.stats()["health_check_failures"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_health_check_frees_slot(self):
+        """Test that cancelling a checkout during its health check closes the connection"""
+        started = asyncio.Event()
+
+        async def health_check(connection):
+            started.set()
+            await asyncio.sleep(10)
+
+        pool, opened = _pool(
+            min_size=1,
+            max_size=1,
+            acquire_timeout=0.5,
+            health_check=health_check,
+            health_check_interval=0,
+        )
+        await pool.open()
+
+        checkout = asyncio.create_task(pool.acquire())
+        await started.wait()
+        checkout.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await checkout
+
+        opened[0].close.assert_called_once()
+        assert pool.stats()["size"] == 0
+        assert pool.stats()["in_use"] == 0
+
+        # The slot is free again: the next checkout opens a new connection
+        pool._health_check = None
+        async with pool.connection() as connection:
+            assert connection is opened[1]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_eviction_keeps_min_size(self):
+        """Test that surplus idle connections are closed after the idle timeout"""
+        pool, opened = _pool(min_size=1, max_size=3, idle_timeout=0)
+
+        connections = [await pool.acquire() for _ in range(3)]
+        for connection in connections:
+            await pool.release(connection)
+
+        async with pool.connection():
+            pass
+        await asyncio.sleep(0)
+
+        assert pool.stats()["size"] == 1
+        assert pool.stats()["evicted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_reaped_without_traffic(self):
+        """Test that idle connections are closed even when nothing checks out"""
+        pool, opened = _pool(min_size=0, max_size=2, idle_timeout=0.05)
+        await pool.open()
+
+        connections = [await pool.acquire() for _ in range(2)]
+        for connection in connections:
+            await pool.release(connection)
+
+        await asyncio.sleep(0.2)
+
+        assert pool.stats()["size"] == 0
+        assert pool.stats()["evicted"] == 2
+        for connection in opened:
+            connection.close.assert_called_once()
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_pool_rejects_checkout(self):
+        """Test that closing the pool closes idle connections"""
+        pool, opened = _pool(min_size=1, max_size=1)
+        await pool.open()
+        await pool.close()
+
+        opened[0].close.assert_called_once()
+        with pytest.raises(PoolClosedError):
+            await pool.acquire()
@@ -0,0 +1,99 @@
+"""Ranking Unit Tests"""
+
+import numpy as np
+import pytest
+
+from skillpilot.core.services.ranking import (
+    blend_quality_scores,
+    maximal_marginal_relevance,
+    reciprocal_rank_fusion,
+    weighted_score_fusion,
+)
+
+
+class TestFusion:
+    """Result fusion tests"""
+
+    def test_rrf_rewards_items_in_both_lists(self):
+        """Test that items ranked by both lists beat items ranked by one"""
+        semantic = [("sk_a", 0.9), ("sk_b", 0.8), ("sk_c", 0.7)]
+        keyword = [("sk_c", 12.0), ("sk_d", 8.0)]
+
+        fused = reciprocal_rank_fusion([semantic, keyword])
+
+        assert fused[0][0] == "sk_c"
+        assert {item_id for item_id, _ in fused} == {"sk_a", "sk_b", "sk_c", "sk_d"}
+
+    def test_rrf_scale_and_weights(self):
+        """Test that a top item in every list scores 1.0 and weights shift ranking"""
+        fused = reciprocal_rank_fusion([[("sk_a", 1.0)], [("sk_a", 5.0)]])
+        assert fused == [("sk_a", pytest.approx(1.0))]
+
+        semantic = [("sk_a", 0.9)]
+        keyword = [("sk_b", 3.0)]
+        assert reciprocal_rank_fusion([semantic, keyword], [2.0, 1.0])[0][0] == "sk_a"
+        assert reciprocal_rank_fusion([semantic, keyword], [1.0, 2.0])[0][0] == "sk_b"
+
+    def test_weighted_fusion_normalizes_scales(self):
+        """Test that raw BM25 magnitudes don't dominate score blending"""
+        semantic = [("sk_a", 0.9), ("sk_b", 0.45)]
+        keyword = [("sk_b", 40.0), ("sk_a", 4.0)]
+
+        fused = dict(weighted_score_fusion([semantic, keyword], [0.7, 0.3]))
+
+        assert fused["sk_a"] == pytest.approx(0.7 * 1.0 + 0.3 * 0.1)
+        assert fused["sk_b"] == pytest.approx(0.7 * 0.5 + 0.3 * 1.0)
+        assert weighted_score_fusion([[], []]) == []
+
+
+class TestMaximalMarginalRelevance:
+    """MMR re-ranking tests"""
+
+    candidates = [("sk_a", 0.95), ("sk_a_clone", 0.94), ("sk_b", 0.80)]
+    vectors = np.array([[1.0, 0.0], [0.99, 0.01], [0.0, 1.0]])
+
+    def test_demotes_near_duplicates(self):
+        """Test that a clone of the top hit gives way to a different skill"""
+        picked = maximal_marginal_relevance(self.candidates, self.vectors, top_k=2, lambda_=0.5)
+
+        assert picked == [("sk_a", 0.95), ("sk_b", 0.80)]
+
+    def test_lambda_one_keeps_relevance_order(self):
+        """Test that lambda 1.0 is plain relevance ranking"""
+        picked = maximal_marginal_relevance(self.candidates, self.vectors, top_k=3, lambda_=1.0)
+
+        assert picked == self.candidates
+        assert maximal_marginal_relevance([], np.zeros((0, 2)), top_k=3) == []
+
+
+class TestQualityBlending:
+    """Popularity/quality score blending tests"""
+
+    def test_signals_scaled_and_blended(self):
+        """Test signal scaling and that the score is the weighted mean"""
+        signals = blend_quality_scores(
+            similarity=np.array([0.8, 0.8]),
+            usage_count=np.array([9999.0, 0.0]),
+            rating=np.array([5.0, 2.5]),
+            age_days=np.array([0.0, 90.0]),
+            weights={"similarity": 1.0, "popularity": 1.0, "rating": 1.0, "recency": 1.0},
+            usage_saturation=9999,
+            recency_half_life_days=90,
+        )
+
+        np.testing.assert_allclose(signals["popularity"], [1.0, 0.0])
+        np.testing.assert_allclose(signals["rating"], [1.0, 0.5])
+        np.testing.assert_allclose(signals["recency"], [1.0, 0.5])
+        np.testing.assert_allclose(signals["score"], [0.95, 0.45])
+
+    def test_unknown_signals_contribute_nothing(self):
+        """Test that missing attributes don't produce NaN scores"""
+        signals = blend_quality_scores(
+            similarity=np.array([0.6]),
+            usage_count=np.array([np.nan]),
+            rating=np.array([np.nan]),
+            age_days=np.array([np.nan]),
+            weights={"similarity": 1.0, "popularity": 1.0},
+        )
+
+        assert signals["score"][0] == pytest.approx(0.3)
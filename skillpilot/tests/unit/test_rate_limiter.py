@@ -0,0 +1,96 @@
+"""Tests for Provider Rate Limiter"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from skillpilot.core.services.rate_limiter import (
+    ProviderRateLimiter,
+    call_with_rate_limit,
+    retry_after_seconds,
+)
+
+
+class FakeAPIError(Exception):
+    """Stand-in for SDK errors carrying an HTTP response"""
+
+    def __init__(self, status_code: int, headers: dict | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+class TestProviderRateLimiter:
+    """Test token-bucket limiting"""
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute(self):
+        """Test that requests beyond the bucket wait for refill"""
+        limiter = ProviderRateLimiter("test", requests_per_minute=600)  # 10/s
+        limiter._requests._level = 1
+
+        start = time.monotonic()
+        await limiter.acquire()
+        await limiter.acquire()
+
+        assert time.monotonic() - start >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_tokens_per_minute(self):
+        """Test that large requests wait for token budget"""
+        limiter = ProviderRateLimiter("test", tokens_per_minute=6000)  # 100/s
+        limiter._tokens._level = 0
+
+        start = time.monotonic()
+        await limiter.acquire(tokens=10)
+
+        assert time.monotonic() - start >= 0.08
+
+    def test_headers_clamp_and_pause(self):
+        """Test that exhausted x-ratelimit headers pause callers until reset"""
+        limiter = ProviderRateLimiter("test", requests_per_minute=100)
+        limiter.update_from_headers(
+            {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "2s"}
+        )
+
+        assert limiter._requests._level < 1
+        assert limiter._blocked_until - time.monotonic() > 1.5
+
+    def test_retry_after_parsing(self):
+        """Test Retry-After style header parsing"""
+        assert retry_after_seconds({"retry-after-ms": "250"}) == 0.25
+        assert retry_after_seconds({"Retry-After": "3"}) == 3.0
+        assert retry_after_seconds({"x-ratelimit-reset-tokens": "1m30s"}) == 90.0
+        assert retry_after_seconds({"x-ratelimit-reset-requests": "20ms"}) == 0.02
+        assert retry_after_seconds({}) is None
+
+
+class TestCallWithRateLimit:
+    """Test retries around provider calls"""
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_with_retry_after(self):
+        """Test that 429s are retried after the provider's Retry-After"""
+        request = AsyncMock(
+            side_effect=[FakeAPIError(429, {"retry-after-ms": "50"}), "ok"]
+        )
+
+        with patch.dict("skillpilot.core.services.rate_limiter._limiters", clear=True):
+            start = time.monotonic()
+            result = await call_with_rate_limit("openai", request)
+
+        assert result == "ok"
+        assert request.call_count == 2
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self):
+        """Test that non-retryable errors raise immediately"""
+        request = AsyncMock(side_effect=FakeAPIError(400))
+
+        with pytest.raises(FakeAPIError):
+            await call_with_rate_limit("mock", request)
+
+        assert request.call_count == 1
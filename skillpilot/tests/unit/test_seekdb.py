@@ -0,0 +1,302 @@
+"""SeekDB Client Unit Tests"""
+
+import asyncio
+from contextlib import aclosing, asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skillpilot.core.config import settings
+from skillpilot.db.seekdb import SeekDBClient
+
+
+def _pooled(raw):
+    """Stand-in for SeekDBClient.connection that always yields ``raw``"""
+
+    @asynccontextmanager
+    async def connection():
+        yield raw
+
+    return connection
+
+
+class TestSeekDBClient:
+    """SeekDB client tests"""
+
+    @pytest.mark.asyncio
+    async def test_get_many_chunks_keys(self):
+        """Test that get_many issues one IN query per chunk and maps rows by key"""
+        client = SeekDBClient()
+        raw = MagicMock()
+        raw.query = AsyncMock(
+            side_effect=lambda table, filters, limit, offset: [
+                {"skill_id": key} for key in filters["skill_id"] if key != "sk_missing"
+            ]
+        )
+
+        with patch.object(client, "connection", _pooled(raw)):
+            rows = await client.get_many(
+                "skills", ["sk_1", "sk_2", "sk_1", "sk_missing", "sk_3"], chunk_size=2
+            )
+
+        assert set(rows) == {"sk_1", "sk_2", "sk_3"}
+        assert raw.query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_many_default_chunk_size(self):
+        """Test that get_many falls back to the configured chunk size"""
+        client = SeekDBClient()
+        raw = MagicMock()
+        raw.query = AsyncMock(return_value=[])
+        keys = [f"sk_{i}" for i in range(settings.seekdb_get_many_chunk_size + 1)]
+
+        with patch.object(client, "connection", _pooled(raw)):
+            await client.get_many("skills", keys)
+
+        assert raw.query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_many_empty(self):
+        """Test that get_many with no keys makes no query"""
+        client = SeekDBClient()
+        raw = MagicMock()
+
+        with patch.object(client, "connection", _pooled(raw)):
+            assert await client.get_many("skills", []) == {}
+
+        raw.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reads_retry_on_connection_error(self):
+        """Test that a read is retried once on a fresh connection after a connection error"""
+        client = SeekDBClient()
+        raw = MagicMock()
+        raw.get = AsyncMock(side_effect=[ConnectionResetError("reset"), {"skill_id": "sk_1"}])
+        raw.insert = AsyncMock(side_effect=ConnectionResetError("reset"))
+
+        with patch.object(client, "connection", _pooled(raw)):
+            assert await client.get("skills", "sk_1") == {"skill_id": "sk_1"}
+            # Inserts aren't idempotent, so they aren't retried
+            with pytest.raises(ConnectionResetError):
+                await client.insert("skills", {"skill_id": "sk_2"})
+
+        assert raw.get.call_count == 2
+        assert raw.insert.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_insert_many_chunks_rows(self):
+        """Test that insert_many makes one bulk call per chunk"""
+        client = SeekDBClient()
+        raw = MagicMock(spec=["insert_many", "insert"])
+        raw.insert_many = AsyncMock()
+        rows = [{"skill_id": f"sk_{i}"} for i in range(5)]
+
+        with patch.object(client, "connection", _pooled(raw)):
+            result = await client.insert_many("skills", rows, batch_size=2)
+
+        assert raw.insert_many.call_count == 3
+        assert result.total == result.succeeded == 5
+        assert result.ok
+        assert result.round_trips == 3
+
+    @pytest.mark.asyncio
+    async def test_insert_many_reports_failed_rows(self):
+        """Test that a rejected chunk is retried row by row and bad rows reported"""
+        client = SeekDBClient()
+        raw = MagicMock(spec=["insert_many", "insert"])
+
+        async def insert_many(table, chunk):
+            if any(row["skill_id"] == "sk_bad" for row in chunk):
+                raise ValueError("duplicate key")
+
+        async def insert(table, row):
+            if row["skill_id"] == "sk_bad":
+                raise ValueError("duplicate key")
+
+        raw.insert_many = AsyncMock(side_effect=insert_many)
+        raw.insert = AsyncMock(side_effect=insert)
+        rows = [{"skill_id": key} for key in ["sk_1", "sk_bad", "sk_2", "sk_3"]]
+
+        with patch.object(client, "connection", _pooled(raw)):
+            result = await client.insert_many("skills", rows, batch_size=2)
+
+        assert result.succeeded == 3
+        assert result.failed == {"sk_bad": "duplicate key"}
+        assert raw.insert.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_splits_inserts_and_updates(self):
+        """Test that upsert_many without a native upsert splits by existing keys"""
+        client = SeekDBClient()
+        raw = MagicMock(spec=["query", "insert_many", "update_many"])
+        raw.query = AsyncMock(return_value=[{"skill_id": "sk_1"}])
+        raw.insert_many = AsyncMock()
+        raw.update_many = AsyncMock()
+        rows = [{"skill_id": "sk_1", "rating": 4.0}, {"skill_id": "sk_2", "rating": 3.0}]
+
+        with patch.object(client, "connection", _pooled(raw)):
+            result = await client.upsert_many("skills", rows)
+
+        assert result.succeeded == 2
+        assert raw.insert_many.call_args.args[1] == [rows[1]]
+        assert raw.update_many.call_args.args[1] == [rows[0]]
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_checks_capability_on_write_connection(self):
+        """Test that upsert_many checks out one connection per chunk and nothing more"""
+        client = SeekDBClient()
+        raw = MagicMock(spec=["upsert_many"])
+        raw.upsert_many = AsyncMock()
+        checkouts = 0
+
+        @asynccontextmanager
+        async def connection():
+            nonlocal checkouts
+            checkouts += 1
+            yield raw
+
+        rows = [{"skill_id": f"sk_{i}"} for i in range(5)]
+        with patch.object(client, "connection", connection):
+            result = await client.upsert_many("skills", rows, batch_size=2)
+
+        assert result.succeeded == 5
+        assert raw.upsert_many.call_count == checkouts == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_many_without_bulk_call(self):
+        """Test that delete_many falls back to row deletes and dedupes keys"""
+        client = SeekDBClient()
+        raw = MagicMock(spec=["delete"])
+        raw.delete = AsyncMock()
+
+        with patch.object(client, "connection", _pooled(raw)):
+            result = await client.delete_many("skills", ["sk_1", "sk_2", "sk_1"])
+
+        assert raw.delete.call_count == 2
+        assert result.total == result.succeeded == 2
+
+    @pytest.mark.asyncio
+    async def test_count_is_cached_per_filter(self):
+        """Test that cached counts are reused per table and filters"""
+        client = SeekDBClient()
+        client._count_cache = None
+        raw = MagicMock()
+        raw.count = AsyncMock(side_effect=[3, 7, 9])
+
+        with patch.object(client, "connection", _pooled(raw)):
+            assert await client.count("skills", {"platform": "coze"}, cached=True) == 3
+            assert await client.count("skills", {"platform": "coze"}, cached=True) == 3
+            assert await client.count("skills", {"platform": "dify"}, cached=True) == 7
+            assert await client.count("skills", {"platform": "coze"}) == 9
+
+        assert raw.count.call_count == 3
+        client._count_cache = None
+
+    @pytest.mark.asyncio
+    async def test_count_by_groups_rows(self):
+        """Test that count_by maps group values to counts"""
+        client = SeekDBClient()
+        raw = MagicMock()
+        raw.aggregate = AsyncMock(
+            return_value=[{"platform": "coze", "count": 4}, {"platform": "dify", "count": 1}]
+        )
+
+        with patch.object(client, "connection", _pooled(raw)):
+            counts = await client.count_by("skills", "platform")
+
+        assert counts == {"coze": 4, "dify": 1}
+        assert raw.aggregate.call_args.kwargs["group_by"] == ["platform"]
+
+    @pytest.mark.asyncio
+    async def test_query_page_seeks_with_cursor(self):
+        """Test that the next page seeks after the last row instead of using offset"""
+        client = SeekDBClient()
+        raw = MagicMock()
+        created = datetime(2026, 1, 1, tzinfo=UTC)
+        rows = [{"skill_id": f"sk_{i}", "created_at": created} for i in range(3)]
+        raw.query = AsyncMock(side_effect=[rows, rows[2:]])
+        order_by = ("created_at", "skill_id")
+
+        with patch.object(client, "connection", _pooled(raw)):
+            page, cursor = await client.query_page(
+                "skills", order_by, limit=2, columns=["skill_name"]
+            )
+            assert [row["skill_id"] for row in page] == ["sk_0", "sk_1"]
+            assert cursor is not None
+
+            page, next_cursor = await client.query_page(
+                "skills", order_by, limit=2, offset=40, cursor=cursor
+            )
+
+        assert [row["skill_id"] for row in page] == ["sk_2"]
+        assert next_cursor is None
+        first, second = raw.query.call_args_list
+        assert first.kwargs["limit"] == 3
+        assert first.kwargs["columns"] == ["skill_name", "created_at", "skill_id"]
+        assert second.kwargs["offset"] == 0
+        assert second.kwargs["after"] == [created, "sk_1"]
+
+    @pytest.mark.asyncio
+    async def test_query_page_rejects_cursor_from_other_listing(self):
+        """Test that a cursor can't be replayed with different filters"""
+        client = SeekDBClient()
+        raw = MagicMock()
+        raw.query = AsyncMock(return_value=[{"skill_id": "sk_0"}, {"skill_id": "sk_1"}])
+
+        with patch.object(client, "connection", _pooled(raw)):
+            _, cursor = await client.query_page("skills", ("skill_id",), limit=1)
+            with pytest.raises(ValueError):
+                await client.query_page(
+                    "skills", ("skill_id",), filters={"platform": "coze"}, cursor=cursor
+                )
+
+    @pytest.mark.asyncio
+    async def test_scan_pages_by_primary_key(self):
+        """Test that scan seeks after each chunk's last key until a short chunk"""
+        client = SeekDBClient()
+        raw = MagicMock()
+        chunks = [
+            [{"skill_id": "sk_1"}, {"skill_id": "sk_2"}],
+            [{"skill_id": "sk_3"}, {"skill_id": "sk_4"}],
+            [{"skill_id": "sk_5"}],
+        ]
+        raw.query = AsyncMock(side_effect=chunks)
+
+        with patch.object(client, "connection", _pooled(raw)):
+            seen = [rows async for rows in client.scan("skills", chunk_size=2, columns=["tags"])]
+
+        assert seen == chunks
+        calls = raw.query.call_args_list
+        assert [call.kwargs.get("after") for call in calls] == [None, ["sk_2"], ["sk_4"]]
+        assert calls[0].kwargs["order_by"] == ["skill_id"]
+        assert calls[0].kwargs["columns"] == ["tags", "skill_id"]
+
+    @pytest.mark.asyncio
+    async def test_scan_stops_early_without_leaking_prefetch(self):
+        """Test that leaving an aclosing scan early cancels the prefetched chunk"""
+        client = SeekDBClient()
+        raw = MagicMock()
+        prefetch_cancelled = asyncio.Event()
+
+        async def query(*args, **kwargs):
+            if kwargs.get("after") is None:
+                return [{"skill_id": "sk_1"}, {"skill_id": "sk_2"}]
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                prefetch_cancelled.set()
+                raise
+
+        raw.query = AsyncMock(side_effect=query)
+
+        with patch.object(client, "connection", _pooled(raw)):
+            with pytest.raises(RuntimeError):
+                async with aclosing(client.scan("skills", chunk_size=2)) as chunks:
+                    async for rows in chunks:
+                        assert len(rows) == 2
+                        await asyncio.sleep(0)  # let the prefetch start
+                        raise RuntimeError("consumer failed")
+
+        assert prefetch_cancelled.is_set()
+        assert raw.query.call_count == 2
@@ -0,0 +1,187 @@
+"""Similarity Graph Unit Tests"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from skillpilot.core.services.similarity_graph import SimilarityGraphService
+from skillpilot.core.services.vector_search import vector_search_service
+from skillpilot.db.seekdb import BulkWriteResult
+
+
+def _row(skill_id: str, neighbors: list[tuple[str, float]]) -> dict:
+    return {
+        "skill_id": skill_id,
+        "neighbors": [{"skill_id": n, "similarity": s} for n, s in neighbors],
+    }
+
+
+class TestSimilarityGraphService:
+    """Similarity graph tests"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_stores_list_and_updates_neighbors(self):
+        """Test that a refreshed skill is offered to its neighbors' lists"""
+        graph = SimilarityGraphService()
+        graph.k = 2
+
+        with (
+            patch("skillpilot.core.services.similarity_graph.seekdb_client") as mock_db,
+            patch.object(
+                vector_search_service,
+                "vector_query",
+                AsyncMock(return_value=[
+                    {"skill_id": "sk_new", "similarity": 1.0},
+                    {"skill_id": "sk_a", "similarity": 0.9},
+                    {"skill_id": "sk_b", "similarity": 0.5},
+                ]),
+            ),
+        ):
+            mock_db.upsert_many = AsyncMock(return_value=BulkWriteResult(total=2, succeeded=2))
+            mock_db.get_many = AsyncMock(return_value={
+                # sk_new (0.9) beats sk_a's current second neighbor
+                "sk_a": _row("sk_a", [("sk_x", 0.95), ("sk_y", 0.4)]),
+                # sk_new (0.5) doesn't make sk_b's full list
+                "sk_b": _row("sk_b", [("sk_x", 0.8), ("sk_y", 0.7)]),
+            })
+
+            neighbors = await graph.refresh_skill("sk_new", [0.1, 0.2])
+
+            assert neighbors == [("sk_a", 0.9), ("sk_b", 0.5)]
+            # The new list and the changed neighbor list go out in one bulk write
+            mock_db.upsert_many.assert_called_once()
+            table, rows = mock_db.upsert_many.call_args.args[:2]
+            assert table == "skill_neighbors"
+            assert [row["skill_id"] for row in rows] == ["sk_new", "sk_a"]
+            assert [n["skill_id"] for n in rows[0]["neighbors"]] == ["sk_a", "sk_b"]
+            assert [n["skill_id"] for n in rows[1]["neighbors"]] == ["sk_x", "sk_new"]
+
+    @pytest.mark.asyncio
+    async def test_remove_recomputes_neighbor_lists(self):
+        """Test that deleting a skill recomputes the lists of its neighbors"""
+        graph = SimilarityGraphService()
+
+        with (
+            patch("skillpilot.core.services.similarity_graph.seekdb_client") as mock_db,
+            patch.object(
+                vector_search_service,
+                "vector_query",
+                AsyncMock(return_value=[{"skill_id": "sk_b", "similarity": 0.7}]),
+            ),
+        ):
+            mock_db.get = AsyncMock(return_value=_row("sk_gone", [("sk_a", 0.9)]))
+            mock_db.delete = AsyncMock()
+            mock_db.get_many = AsyncMock(
+                return_value={"sk_a": {"skill_id": "sk_a", "skill_vector": [0.3, 0.4]}}
+            )
+            mock_db.upsert_many = AsyncMock(return_value=BulkWriteResult(total=1, succeeded=1))
+
+            await graph.remove_skill("sk_gone")
+
+            mock_db.delete.assert_called_once_with("skill_neighbors", "sk_gone")
+            [row] = mock_db.upsert_many.call_args.args[1]
+            assert row["skill_id"] == "sk_a"
+            assert row["neighbors"] == [{"skill_id": "sk_b", "similarity": 0.7}]
+
+    @pytest.mark.asyncio
+    async def test_similar_skills_served_from_graph(self):
+        """Test that similar skills are a primary-key read when materialized"""
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch(
+                "skillpilot.core.services.vector_search.similarity_graph_service.get_neighbors",
+                AsyncMock(return_value=[("sk_a", 0.9), ("sk_b", 0.8)]),
+            ),
+            patch.object(vector_search_service, "vector_query", AsyncMock()) as vector_query,
+        ):
+            mock_db.get_many = AsyncMock(side_effect=lambda table, ids: {
+                i: {"skill_id": i, "skill_name": i, "platform": "coze"} for i in ids
+            })
+
+            results = await vector_search_service.find_similar_skills("sk_src", top_k=1)
+
+            assert [r.skill_id for r in results] == ["sk_a"]
+            vector_query.assert_not_called()
+            # Only the requested neighbors are hydrated
+            mock_db.get_many.assert_called_once_with("skills", ["sk_a"])
+
+    @pytest.mark.asyncio
+    async def test_similar_skills_backfill_deleted_neighbors(self):
+        """Test that listed neighbors whose skills are gone are replaced by the next ones"""
+        live = {"sk_b", "sk_c"}
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch(
+                "skillpilot.core.services.vector_search.similarity_graph_service.get_neighbors",
+                AsyncMock(return_value=[("sk_a", 0.9), ("sk_b", 0.8), ("sk_c", 0.7)]),
+            ),
+        ):
+            mock_db.get_many = AsyncMock(side_effect=lambda table, ids: {
+                i: {"skill_id": i, "skill_name": i, "platform": "coze"} for i in ids if i in live
+            })
+
+            results = await vector_search_service.find_similar_skills("sk_src", top_k=2)
+
+            assert [r.skill_id for r in results] == ["sk_b", "sk_c"]
+            assert [call.args[1] for call in mock_db.get_many.call_args_list] == [
+                ["sk_a", "sk_b"],
+                ["sk_c"],
+            ]
+
+    @pytest.mark.asyncio
+    async def test_store_many_upserts_in_bulk(self):
+        """Test that bulk writes go through one upsert and count failed rows"""
+        graph = SimilarityGraphService()
+
+        with patch("skillpilot.core.services.similarity_graph.seekdb_client") as mock_db:
+            mock_db.upsert_many = AsyncMock(
+                return_value=BulkWriteResult(total=2, succeeded=1, failed={"sk_b": "boom"})
+            )
+            mock_db.insert = AsyncMock()
+            mock_db.update = AsyncMock()
+
+            written = await graph.store_many({"sk_a": [("sk_b", 0.9)], "sk_b": [("sk_a", 0.9)]})
+
+            assert written == 1
+            mock_db.upsert_many.assert_called_once()
+            rows = mock_db.upsert_many.call_args.args[1]
+            assert [row["skill_id"] for row in rows] == ["sk_a", "sk_b"]
+            assert rows[0]["neighbors"] == [{"skill_id": "sk_b", "similarity": 0.9}]
+            mock_db.insert.assert_not_called()
+            mock_db.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rebuild_writes_each_chunk_in_bulk(self):
+        """Test that a full rebuild writes one bulk upsert per scanned chunk"""
+        graph = SimilarityGraphService()
+        chunks = [
+            [{"skill_id": "sk_a", "skill_vector": [0.1]}, {"skill_id": "sk_b", "skill_vector": [0.2]}],
+            [{"skill_id": "sk_c", "skill_vector": [0.3]}, {"skill_id": "sk_d", "skill_vector": None}],
+        ]
+
+        async def iter_table(*args, **kwargs):
+            for chunk in chunks:
+                yield chunk
+
+        with (
+            patch("skillpilot.core.services.similarity_graph.seekdb_client") as mock_db,
+            patch.object(vector_search_service, "iter_table", iter_table),
+            patch.object(
+                vector_search_service,
+                "vector_query",
+                AsyncMock(return_value=[{"skill_id": "sk_x", "similarity": 0.5}]),
+            ),
+        ):
+            mock_db.upsert_many = AsyncMock(
+                side_effect=lambda table, rows, chunk_size=None: BulkWriteResult(
+                    total=len(rows), succeeded=len(rows)
+                )
+            )
+
+            rebuilt = await graph.rebuild_all()
+
+            assert rebuilt == 3
+            assert [
+                [row["skill_id"] for row in call.args[1]]
+                for call in mock_db.upsert_many.call_args_list
+            ] == [["sk_a", "sk_b"], ["sk_c"]]
@@ -4,8 +4,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from skillpilot.core.models import PlatformType, Pricing, SkillCreate
+from skillpilot.core.models import PlatformType, Pricing, SkillCreate, SkillUpdate
 from skillpilot.core.services.skill import SkillService
+from skillpilot.db.seekdb import BulkWriteResult
 
 
 class TestSkillService:
@@ -40,6 +41,34 @@ class TestSkillService:
                 assert skill is not None
                 mock_db.insert.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_skills_in_bulk(self):
+        """Test bulk creation reports failed rows by input position"""
+        service = SkillService()
+        skills_data = [
+            SkillCreate(skill_name=f"Skill {i}", platform=PlatformType.COZE) for i in range(3)
+        ]
+
+        async def insert_many(table, rows):
+            return BulkWriteResult(
+                total=len(rows), succeeded=len(rows) - 1, failed={rows[1]["skill_id"]: "boom"}
+            )
+
+        with (
+            patch("skillpilot.core.services.skill.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.skill.vector_search_service") as mock_vector,
+        ):
+            mock_db.insert_many = AsyncMock(side_effect=insert_many)
+            mock_vector.index_skills_batch = AsyncMock(return_value=2)
+
+            created, failed = await service.create_skills(skills_data, "usr_test")
+
+            assert [skill.skill_name for skill in created] == ["Skill 0", "Skill 2"]
+            assert failed == {1: "boom"}
+            mock_db.insert_many.assert_called_once()
+            mock_vector.bump_catalog_generation.assert_called_once()
+            mock_vector.index_skills_batch.assert_called_once_with(created, refresh_neighbors=False)
+
     @pytest.mark.asyncio
     async def test_get_skill(self):
         """Test getting skill details"""
@@ -83,15 +112,20 @@ class TestSkillService:
         """Test deleting skill"""
         service = SkillService()
 
-        with patch("skillpilot.core.services.skill.seekdb_client") as mock_db:
+        with (
+            patch("skillpilot.core.services.skill.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_vector_db,
+        ):
             mock_db.get = AsyncMock(return_value={"skill_id": "sk_test123"})
             mock_db.delete = AsyncMock()
+            mock_vector_db.delete = AsyncMock()
 
             result = await service.delete_skill("sk_test123")
 
             assert result is True
             # Should delete from both skills and skill_vectors tables
-            assert mock_db.delete.call_count == 2
+            mock_db.delete.assert_called_once_with("skills", "sk_test123")
+            mock_vector_db.delete.assert_called_once_with("skill_vectors", "sk_test123")
 
     @pytest.mark.asyncio
     async def test_delete_skill_not_found(self):
@@ -132,13 +166,26 @@ class TestSkillService:
         ]
 
         with patch("skillpilot.core.services.skill.seekdb_client") as mock_db:
-            mock_db.query = AsyncMock(return_value=mock_skills)
+            mock_db.query_page = AsyncMock(return_value=(mock_skills, "next"))
+            mock_db.count = AsyncMock(return_value=42)
 
             skills, pagination = await service.list_skills(page=1, limit=20)
 
             assert len(skills) == 2
             assert pagination.page == 1
             assert pagination.limit == 20
+            assert pagination.total == 42
+            assert pagination.total_pages == 3
+            assert pagination.next_cursor == "next"
+            # Only the requested page is fetched
+            mock_db.query_page.assert_called_once_with(
+                "skills",
+                order_by=("created_at", "skill_id"),
+                filters={},
+                limit=20,
+                offset=0,
+                cursor=None,
+            )
 
     @pytest.mark.asyncio
     async def test_search_skills(self):
@@ -175,12 +222,37 @@ class TestSkillService:
                 updated_at=datetime.now(UTC),
                 similarity=0.8,
             )
-            mock_vector.search_skills_semantic = AsyncMock(return_value=[mock_result])
+            mock_vector.search_skills_page = AsyncMock(return_value=([mock_result], "cursor"))
 
-            results = await service.search_skills(query="code", page=1, limit=10)
+            results, next_cursor = await service.search_skills(query="code", page=1, limit=10)
 
             assert len(results) >= 1
             assert results[0].skill_name == "Code Review Pro"
+            assert next_cursor == "cursor"
+
+    @pytest.mark.asyncio
+    async def test_update_skill_syncs_vector_by_fields_set(self):
+        """Test that cleared text fields re-embed and other updates sync attributes"""
+        service = SkillService()
+        row = {"skill_id": "sk_1", "skill_name": "Skill 1", "platform": "coze", "tags": []}
+
+        with (
+            patch("skillpilot.core.services.skill.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.skill.vector_search_service") as mock_vector,
+        ):
+            mock_db.get = AsyncMock(return_value=row)
+            mock_db.update = AsyncMock()
+            mock_vector.update_skill_embedding = AsyncMock(return_value=True)
+            mock_vector.sync_skill_attributes = AsyncMock(return_value=True)
+
+            await service.update_skill("sk_1", SkillUpdate(tags=[]))
+            mock_vector.update_skill_embedding.assert_called_once()
+            mock_vector.sync_skill_attributes.assert_not_called()
+
+            mock_vector.update_skill_embedding.reset_mock()
+            await service.update_skill("sk_1", SkillUpdate(pricing=Pricing(type="per_use")))
+            mock_vector.update_skill_embedding.assert_not_called()
+            mock_vector.sync_skill_attributes.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_increment_usage(self):
@@ -189,10 +261,17 @@ class TestSkillService:
 
         mock_skill = {"skill_id": "sk_test", "usage_count": 10}
 
-        with patch("skillpilot.core.services.skill.seekdb_client") as mock_db:
+        with (
+            patch("skillpilot.core.services.skill.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_vector_db,
+        ):
             mock_db.get = AsyncMock(return_value=mock_skill)
             mock_db.update = AsyncMock()
+            mock_vector_db.update = AsyncMock()
 
             await service.increment_usage("sk_test")
 
             mock_db.update.assert_called_once_with("skills", "sk_test", {"usage_count": 11})
+            mock_vector_db.update.assert_called_once_with(
+                "skill_vectors", "sk_test", {"usage_count": 11}
+            )
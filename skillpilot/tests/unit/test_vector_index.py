@@ -0,0 +1,122 @@
+"""In-Memory Vector Index Unit Tests"""
+
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+
+from skillpilot.core.services.search_filters import matches_filters
+from skillpilot.core.services.vector_index import InMemoryVectorIndex
+
+
+def _vector(*values: float) -> list[float]:
+    return list(values)
+
+
+class TestInMemoryVectorIndex:
+    """In-memory vector index tests"""
+
+    def test_search_ranks_by_cosine_similarity(self):
+        """Test that results are ordered by cosine similarity"""
+        index = InMemoryVectorIndex()
+        index.upsert("sk_x", _vector(1, 0, 0))
+        index.upsert("sk_xy", _vector(1, 1, 0))
+        index.upsert("sk_z", _vector(0, 0, 1))
+
+        results = index.search(_vector(2, 0, 0), top_k=2)
+
+        assert [r["skill_id"] for r in results] == ["sk_x", "sk_xy"]
+        assert results[0]["similarity"] == pytest.approx(1.0)
+        assert results[1]["similarity"] == pytest.approx(1 / np.sqrt(2))
+
+    def test_upsert_replaces_vector(self):
+        """Test that upserting an existing ID replaces its vector"""
+        index = InMemoryVectorIndex()
+        index.upsert("sk_1", _vector(1, 0))
+        index.upsert("sk_1", _vector(0, 1))
+
+        assert len(index) == 1
+        assert index.search(_vector(0, 1), top_k=1)[0]["similarity"] == pytest.approx(1.0)
+
+    def test_delete_keeps_remaining_rows(self):
+        """Test that deleting a row moves the last row into its slot"""
+        index = InMemoryVectorIndex()
+        for i in range(5):
+            index.upsert(f"sk_{i}", _vector(1, i))
+
+        assert index.delete("sk_1")
+        assert not index.delete("sk_1")
+
+        assert len(index) == 4
+        assert "sk_1" not in index
+        ids = {r["skill_id"] for r in index.search(_vector(1, 0), top_k=10)}
+        assert ids == {"sk_0", "sk_2", "sk_3", "sk_4"}
+        # The moved row still returns its own vector
+        assert index.search(_vector(1, 4), top_k=1)[0]["skill_id"] == "sk_4"
+
+    def test_grows_past_initial_capacity(self):
+        """Test that the matrix grows as vectors are added"""
+        index = InMemoryVectorIndex(initial_capacity=2)
+        rng = np.random.default_rng(0)
+        for i in range(50):
+            index.upsert(f"sk_{i}", rng.standard_normal(8).tolist())
+
+        assert len(index) == 50
+        assert len(index.search(rng.standard_normal(8), top_k=10)) == 10
+
+    def test_filters(self):
+        """Test filter conditions restrict results"""
+        index = InMemoryVectorIndex()
+        index.upsert("sk_a", _vector(1, 0), {"platform": "coze", "rating": 4.5, "tags": ["pdf"]})
+        index.upsert("sk_b", _vector(1, 0.1), {"platform": "dify", "rating": 3.0, "tags": []})
+        index.upsert("sk_c", _vector(1, 0.2), {"platform": "coze", "rating": None, "tags": ["x"]})
+
+        def ids(conditions):
+            return [r["skill_id"] for r in index.search(_vector(1, 0), 10, conditions)]
+
+        assert ids({"platform": ["coze"]}) == ["sk_a", "sk_c"]
+        assert ids({"rating": {"gte": 4.0}}) == ["sk_a"]
+        assert ids({"tags": {"contains_any": ["x", "pdf"]}}) == ["sk_a", "sk_c"]
+        assert ids({"platform": "github"}) == []
+
+        index.update_attributes("sk_b", {"platform": "coze"})
+        assert ids({"platform": ["coze"]}) == ["sk_a", "sk_b", "sk_c"]
+
+    def test_dimension_mismatch_rejected(self):
+        """Test that vectors of another dimension are rejected"""
+        index = InMemoryVectorIndex()
+        index.upsert("sk_1", _vector(1, 0, 0))
+
+        with pytest.raises(ValueError):
+            index.upsert("sk_2", _vector(1, 0))
+        assert index.upsert_many([{"skill_id": "sk_3", "skill_vector": [1.0]}]) == 0
+
+    def test_matches_filters(self):
+        """Test single-row filter evaluation"""
+        row = {"platform": "coze", "rating": 4.0, "tags": ["pdf", "ocr"]}
+
+        assert matches_filters(row, None)
+        assert matches_filters(row, {"platform": ["coze", "dify"], "rating": {"gt": 3.5}})
+        assert not matches_filters(row, {"rating": {"lt": 4.0}})
+        assert not matches_filters(row, {"tags": {"contains_any": ["image"]}})
+
+    def test_filters_follow_updates_and_deletes(self):
+        """Test that typed filter columns stay in sync when rows move"""
+        index = InMemoryVectorIndex()
+        now = datetime(2026, 1, 1, tzinfo=UTC)
+        index.upsert("sk_a", _vector(1, 0), {"tags": ["pdf"], "updated_at": now})
+        index.upsert("sk_b", _vector(1, 0.1), {"tags": ["ocr"], "updated_at": now})
+        index.upsert("sk_c", _vector(1, 0.2), {"tags": ["pdf", "x"], "usage_count": 5})
+
+        def ids(conditions):
+            return sorted(r["skill_id"] for r in index.search(_vector(1, 0), 10, conditions))
+
+        # sk_c moves into sk_a's row
+        index.delete("sk_a")
+        assert ids({"tags": {"contains_any": ["pdf"]}}) == ["sk_c"]
+        assert ids({"usage_count": {"gte": 5}}) == ["sk_c"]
+        assert ids({"updated_at": {"gte": now}}) == ["sk_b"]
+
+        index.update_attributes("sk_c", {"tags": []})
+        assert ids({"tags": {"contains_any": ["pdf", "x"]}}) == []
+        assert index.get_attributes("sk_c")["tags"] == []
@@ -1,16 +1,31 @@
 """Tests for Vector Search Service"""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from skillpilot.core.models.common import PlatformType
 from skillpilot.core.models.skill import Pricing, Skill
 from skillpilot.core.services.vector_search import vector_search_service
 
 
+def _scan(rows: list[dict]) -> MagicMock:
+    """Stand-in for seekdb_client.scan yielding ``rows`` as one chunk"""
+
+    async def scan(*args, **kwargs):
+        if rows:
+            yield rows
+
+    return MagicMock(side_effect=scan)
+
+
 class TestVectorSearchService:
     """Test vector search service functionality"""
 
+    @pytest.fixture(autouse=True)
+    def fresh_result_cache(self):
+        """Keep cached results from leaking between tests"""
+        vector_search_service.bump_catalog_generation()
+
     @pytest.mark.asyncio
     async def test_create_skill_search_text(self):
         """Test searchable text creation from skill"""
@@ -57,7 +72,7 @@ class TestVectorSearchService:
         # Mock seekdb_client to simulate failure
         with patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db:
             mock_db.vector_search = AsyncMock(side_effect=Exception("Vector search unavailable"))
-            mock_db.query = AsyncMock(return_value=[])
+            mock_db.scan = _scan([])
 
             # This tests the fallback mechanism
             results = await vector_search_service.search_skills_semantic(
@@ -81,15 +96,18 @@ class TestVectorSearchService:
                 {"skill_id": "sk_3", "similarity": 0.3},
             ])
 
-            # Mock get to return skill data
-            mock_db.get = AsyncMock(return_value={
-                "skill_id": "sk_1",
-                "skill_name": "Test Skill",
-                "platform": "coze",
-                "description": "Test",
-                "capabilities": [],
-                "tags": [],
-                "pricing": {"type": "free"},
+            # Mock get_many to return skill data for every hit
+            mock_db.get_many = AsyncMock(return_value={
+                skill_id: {
+                    "skill_id": skill_id,
+                    "skill_name": "Test Skill",
+                    "platform": "coze",
+                    "description": "Test",
+                    "capabilities": [],
+                    "tags": [],
+                    "pricing": {"type": "free"},
+                }
+                for skill_id in ["sk_1", "sk_2", "sk_3"]
             })
 
             # Test with high threshold (0.95) - should filter out most
@@ -108,3 +126,525 @@ class TestVectorSearchService:
 
             # High threshold should return fewer or equal results
             assert len(results_high) <= len(results_low)
+            assert len(results_low) == 3
+
+    @pytest.mark.asyncio
+    async def test_search_hydrates_in_one_multi_get(self):
+        """Test that search hits are hydrated with a single get_many call"""
+        with patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db:
+            mock_db.vector_search = AsyncMock(return_value=[
+                {"skill_id": f"sk_{i}", "similarity": 0.9 - i * 0.01} for i in range(20)
+            ])
+            mock_db.get_many = AsyncMock(return_value={
+                f"sk_{i}": {"skill_id": f"sk_{i}", "skill_name": f"Skill {i}", "platform": "coze"}
+                for i in range(20)
+            })
+            mock_db.get = AsyncMock()
+
+            results = await vector_search_service.search_skills_semantic(
+                query="test", threshold=0.1, top_k=10
+            )
+
+            mock_db.get_many.assert_called_once()
+            mock_db.get.assert_not_called()
+            assert [r.skill_id for r in results] == [f"sk_{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_mmr_diversifies_results(self):
+        """Test that MMR re-ranking skips near-duplicate candidates"""
+        vectors = {"sk_a": [1.0, 0.0], "sk_a_clone": [0.99, 0.01], "sk_b": [0.0, 1.0]}
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch.object(vector_search_service, "_local_index_ready", return_value=False),
+        ):
+            mock_db.vector_search = AsyncMock(return_value=[
+                {"skill_id": "sk_a", "similarity": 0.95},
+                {"skill_id": "sk_a_clone", "similarity": 0.94},
+                {"skill_id": "sk_b", "similarity": 0.80},
+            ])
+            mock_db.get_many = AsyncMock(side_effect=lambda table, ids: {
+                i: (
+                    {"skill_id": i, "skill_vector": vectors[i]}
+                    if table == "skill_vectors"
+                    else {"skill_id": i, "skill_name": i, "platform": "coze"}
+                )
+                for i in ids
+            })
+
+            plain = await vector_search_service.search_skills_semantic(
+                query="test", threshold=0.1, top_k=2
+            )
+            diverse = await vector_search_service.search_skills_semantic(
+                query="test", threshold=0.1, top_k=2, mmr_lambda=0.5
+            )
+
+            assert [r.skill_id for r in plain] == ["sk_a", "sk_a_clone"]
+            assert [r.skill_id for r in diverse] == ["sk_a", "sk_b"]
+            assert diverse[1].similarity == pytest.approx(0.80)
+
+    @pytest.mark.asyncio
+    async def test_blended_ranking_uses_vector_row_attributes(self):
+        """Test that blended ranking promotes popular, well-rated skills without extra reads"""
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch.object(vector_search_service, "_local_index_ready", return_value=False),
+        ):
+            mock_db.vector_search = AsyncMock(return_value=[
+                {"skill_id": "sk_niche", "similarity": 0.82, "usage_count": 0, "rating": 0.0},
+                {
+                    "skill_id": "sk_popular",
+                    "similarity": 0.80,
+                    "usage_count": 5000,
+                    "rating": 4.8,
+                    "updated_at": "2026-01-01T00:00:00",
+                },
+            ])
+            mock_db.get_many = AsyncMock(side_effect=lambda table, ids: {
+                i: {"skill_id": i, "skill_name": i, "platform": "coze"} for i in ids
+            })
+
+            results = await vector_search_service.search_skills_semantic(
+                query="test", threshold=0.1, top_k=2, ranking="blended"
+            )
+
+            assert [r.skill_id for r in results] == ["sk_popular", "sk_niche"]
+            top = results[0]
+            assert top.similarity == pytest.approx(0.80)
+            assert top.score == top.score_breakdown.score
+            assert top.score_breakdown.popularity > 0.9
+            assert results[1].score_breakdown.recency == 0.0
+            # Only the skills table is read, once, for hydration
+            mock_db.get_many.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_filters_pushed_down(self):
+        """Test that filters are passed to the vector query as conditions"""
+        with patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db:
+            mock_db.vector_search = AsyncMock(return_value=[])
+            mock_db.get_many = AsyncMock(return_value={})
+
+            await vector_search_service.search_skills_semantic(
+                query="test",
+                platforms=[PlatformType.COZE],
+                pricing_types=["free"],
+                min_rating=4.0,
+                tags=["pdf"],
+            )
+
+            conditions = mock_db.vector_search.call_args.kwargs["filter_conditions"]
+            assert conditions == {
+                "platform": ["coze"],
+                "pricing_type": ["free"],
+                "rating": {"gte": 4.0},
+                "tags": {"contains_any": ["pdf"]},
+            }
+
+    @pytest.mark.asyncio
+    async def test_overfetch_window_grows_until_enough_hits(self):
+        """Test that the candidate window doubles while filtered results fall short"""
+        def selective_search(**kwargs):
+            # Filter keeps one row in four of the nearest candidates
+            return [
+                {"skill_id": f"sk_{i}", "similarity": 0.99 - i * 0.001}
+                for i in range(kwargs["top_k"] // 4)
+            ]
+
+        with patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db:
+            mock_db.vector_search = AsyncMock(side_effect=selective_search)
+            mock_db.get_many = AsyncMock(return_value={
+                f"sk_{i}": {"skill_id": f"sk_{i}", "skill_name": f"Skill {i}", "platform": "coze"}
+                for i in range(10)
+            })
+
+            results = await vector_search_service.search_skills_semantic(
+                query="test", threshold=0.1, top_k=10, tags=["rare-grow"]
+            )
+
+            windows = [c.kwargs["top_k"] for c in mock_db.vector_search.call_args_list]
+            assert windows == [20, 40]
+            assert len(results) == 10
+
+            key = '{"tags": {"contains_any": ["rare-grow"]}}'
+            entry = vector_search_service.search_metrics()["overfetch"][key]
+            assert entry["expansions"] == 1
+            assert entry["factor"] > 2.0
+
+    @pytest.mark.asyncio
+    async def test_overfetch_stops_at_similarity_floor(self):
+        """Test that the window doesn't grow once results fall below the threshold"""
+        with patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db:
+            mock_db.vector_search = AsyncMock(return_value=[
+                {"skill_id": "sk_1", "similarity": 0.9},
+                {"skill_id": "sk_2", "similarity": 0.2},
+            ])
+            mock_db.get_many = AsyncMock(return_value={
+                "sk_1": {"skill_id": "sk_1", "skill_name": "Skill 1", "platform": "coze"}
+            })
+
+            results = await vector_search_service.search_skills_semantic(
+                query="test", threshold=0.5, top_k=10, tags=["floor"]
+            )
+
+            mock_db.vector_search.assert_called_once()
+            assert [r.skill_id for r in results] == ["sk_1"]
+
+    @pytest.mark.asyncio
+    async def test_overfetch_factor_learned_per_filter(self):
+        """Test that later queries with the same filter start from a larger window"""
+        def selective_search(**kwargs):
+            return [
+                {"skill_id": f"sk_{i}", "similarity": 0.9}
+                for i in range(kwargs["top_k"] // 8)
+            ]
+
+        with patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db:
+            mock_db.vector_search = AsyncMock(side_effect=selective_search)
+            mock_db.get_many = AsyncMock(return_value={})
+
+            for _ in range(5):
+                await vector_search_service.search_skills_semantic(
+                    query="test", threshold=0.1, top_k=10, tags=["rare-learn"]
+                )
+
+            windows = [c.kwargs["top_k"] for c in mock_db.vector_search.call_args_list]
+            assert windows[0] == 20
+            assert windows[-1] > 20
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_reuses_candidates(self):
+        """Test that later pages are served from the cached ranking"""
+        skills = {
+            f"sk_{i}": {"skill_id": f"sk_{i}", "skill_name": f"Skill {i}", "platform": "coze"}
+            for i in range(25)
+        }
+
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+        ):
+            mock_embedding.generate_embedding = AsyncMock(return_value=[0.1, 0.2])
+            mock_db.vector_search = AsyncMock(return_value=[
+                {"skill_id": f"sk_{i}", "similarity": 0.9 - i * 0.01} for i in range(25)
+            ])
+            mock_db.get_many = AsyncMock(
+                side_effect=lambda table, ids: {i: skills[i] for i in ids}
+            )
+
+            first, cursor = await vector_search_service.search_skills_page(
+                query="test", limit=10
+            )
+            second, cursor2 = await vector_search_service.search_skills_page(
+                query="test", limit=10, cursor=cursor
+            )
+            third, cursor3 = await vector_search_service.search_skills_page(
+                query="test", limit=10, cursor=cursor2
+            )
+
+            assert [r.skill_id for r in first] == [f"sk_{i}" for i in range(10)]
+            assert [r.skill_id for r in second] == [f"sk_{i}" for i in range(10, 20)]
+            assert [r.skill_id for r in third] == [f"sk_{i}" for i in range(20, 25)]
+            assert cursor3 is None
+            mock_embedding.generate_embedding.assert_called_once()
+            mock_db.vector_search.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_page_number_without_cursor(self):
+        """Test that page > 1 returns the matching slice instead of nothing"""
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+        ):
+            mock_embedding.generate_embedding = AsyncMock(return_value=[0.1, 0.2])
+            mock_db.vector_search = AsyncMock(return_value=[
+                {"skill_id": f"sk_{i}", "similarity": 0.9} for i in range(15)
+            ])
+            mock_db.get_many = AsyncMock(side_effect=lambda table, ids: {
+                i: {"skill_id": i, "skill_name": i, "platform": "coze"} for i in ids
+            })
+
+            results, next_cursor = await vector_search_service.search_skills_page(
+                query="test", limit=10, page=2
+            )
+
+            assert [r.skill_id for r in results] == [f"sk_{i}" for i in range(10, 15)]
+            assert next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self):
+        """Test that unknown or malformed cursors raise ValueError"""
+        from skillpilot.core.utils.helpers import encode_cursor
+
+        with pytest.raises(ValueError):
+            await vector_search_service.search_skills_page(query="test", cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            await vector_search_service.search_skills_page(
+                query="test", cursor=encode_cursor({"s": "srch_missing", "o": 10})
+            )
+
+    @pytest.mark.asyncio
+    async def test_local_index_serves_search_during_outage(self):
+        """Test that a SeekDB vector search failure is served from the local index"""
+        from skillpilot.core.services.vector_search import VectorSearchService
+
+        service = VectorSearchService()
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+        ):
+            mock_db.scan = _scan([
+                {"skill_id": "sk_1", "skill_vector": [1.0, 0.0], "platform": "coze"},
+                {"skill_id": "sk_2", "skill_vector": [0.0, 1.0], "platform": "coze"},
+            ])
+            assert await service.load_local_index() == 2
+
+            mock_embedding.generate_embedding = AsyncMock(return_value=[1.0, 0.1])
+            mock_db.vector_search = AsyncMock(side_effect=ConnectionError("down"))
+            mock_db.get_many = AsyncMock(return_value={
+                "sk_1": {"skill_id": "sk_1", "skill_name": "Skill 1", "platform": "coze"}
+            })
+
+            results = await service.search_skills_semantic(query="test", threshold=0.5)
+
+            assert [r.skill_id for r in results] == ["sk_1"]
+            assert service.search_metrics()["local_fallbacks"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_uses_keyword_index(self):
+        """Test that the keyword fallback ranks skills from the BM25 index"""
+        from skillpilot.core.services.vector_search import VectorSearchService
+
+        service = VectorSearchService()
+        skills = {
+            "sk_pdf": {"skill_id": "sk_pdf", "skill_name": "PDF Extractor", "platform": "coze"},
+            "sk_img": {"skill_id": "sk_img", "skill_name": "Image Resizer", "platform": "coze"},
+        }
+        with patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db:
+            mock_db.scan = _scan(list(skills.values()))
+            mock_db.vector_search = AsyncMock(side_effect=Exception("Vector search unavailable"))
+            mock_db.get_many = AsyncMock(
+                side_effect=lambda table, ids: {i: skills[i] for i in ids}
+            )
+
+            results = await service.search_skills_semantic(query="pdf extractor", top_k=5)
+
+            assert [r.skill_id for r in results] == ["sk_pdf"]
+            assert results[0].similarity == 1.0
+            # The index is built once and reused
+            await service.keyword_search("image")
+            assert mock_db.scan.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_survives_semantic_failure(self):
+        """Test that hybrid search falls back to keyword ranking alone"""
+        from skillpilot.core.services.vector_search import VectorSearchService
+
+        service = VectorSearchService()
+        skills = {
+            "sk_gradio": {"skill_id": "sk_gradio", "skill_name": "Gradio UI", "platform": "coze"},
+            "sk_other": {"skill_id": "sk_other", "skill_name": "Other", "platform": "coze"},
+        }
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+        ):
+            mock_embedding.generate_embedding = AsyncMock(side_effect=Exception("provider down"))
+            mock_db.scan = _scan(list(skills.values()))
+            mock_db.get_many = AsyncMock(
+                side_effect=lambda table, ids: {i: skills[i] for i in ids}
+            )
+
+            results = await service.search_skills_hybrid(query="gradio", top_k=5)
+
+            assert [r.skill_id for r in results] == ["sk_gradio"]
+
+    @pytest.mark.asyncio
+    async def test_result_cache_invalidated_by_catalog_generation(self):
+        """Test that repeated searches are cached until the catalog changes"""
+        from skillpilot.core.services.vector_search import VectorSearchService
+
+        service = VectorSearchService()
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+        ):
+            mock_embedding.generate_embedding = AsyncMock(return_value=[0.1, 0.2])
+            mock_db.vector_search = AsyncMock(return_value=[{"skill_id": "sk_1", "similarity": 0.9}])
+            mock_db.get_many = AsyncMock(return_value={
+                "sk_1": {"skill_id": "sk_1", "skill_name": "Skill 1", "platform": "coze"}
+            })
+
+            first = await service.search_skills_semantic(query="pdf  tools", top_k=5)
+            second = await service.search_skills_semantic(query=" pdf tools ", top_k=5)
+
+            assert [r.skill_id for r in second] == [r.skill_id for r in first] == ["sk_1"]
+            mock_embedding.generate_embedding.assert_called_once()
+            mock_db.get_many.assert_called_once()
+
+            # Different request parameters miss the cache
+            await service.search_skills_semantic(query="pdf tools", top_k=3)
+            assert mock_embedding.generate_embedding.call_count == 2
+
+            # A catalog write invalidates every cached search
+            service.bump_catalog_generation()
+            await service.search_skills_semantic(query="pdf tools", top_k=5)
+            assert mock_embedding.generate_embedding.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_results_isolated_from_callers(self):
+        """Test that mutating returned results doesn't change later cache hits"""
+        from skillpilot.core.services.vector_search import VectorSearchService
+
+        service = VectorSearchService()
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+        ):
+            mock_embedding.generate_embedding = AsyncMock(return_value=[0.1, 0.2])
+            mock_db.vector_search = AsyncMock(return_value=[{"skill_id": "sk_1", "similarity": 0.9}])
+            mock_db.get_many = AsyncMock(return_value={
+                "sk_1": {"skill_id": "sk_1", "skill_name": "Skill 1", "platform": "coze", "tags": ["pdf"]}
+            })
+
+            first = await service.search_skills_semantic(query="pdf", top_k=5)
+            first[0].tags.append("mutated")
+            first[0].similarity = 0.0
+            first.clear()
+
+            second = await service.search_skills_semantic(query="pdf", top_k=5)
+            second[0].tags.append("again")
+            third = await service.search_skills_semantic(query="pdf", top_k=5)
+
+            mock_embedding.generate_embedding.assert_called_once()
+            assert third[0].tags == ["pdf"]
+            assert third[0].similarity == 0.9
+
+    @pytest.mark.asyncio
+    async def test_batch_search_embeds_and_hydrates_once(self):
+        """Test that a batch search makes one embedding call and one multi-get"""
+        from skillpilot.core.models.skill import SkillSearchQuery
+        from skillpilot.core.services.vector_search import VectorSearchService
+
+        service = VectorSearchService()
+        hits_by_vector = {
+            0.1: [{"skill_id": "sk_a", "similarity": 0.9}, {"skill_id": "sk_b", "similarity": 0.8}],
+            0.2: [{"skill_id": "sk_b", "similarity": 0.95}, {"skill_id": "sk_c", "similarity": 0.7}],
+        }
+        skills = {
+            i: {"skill_id": i, "skill_name": i, "platform": "coze"} for i in ("sk_a", "sk_b", "sk_c")
+        }
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+        ):
+            mock_embedding.generate_embeddings_batch = AsyncMock(return_value=[[0.1], [0.2]])
+            mock_db.vector_search = AsyncMock(
+                side_effect=lambda **kwargs: hits_by_vector[kwargs["query_vector"][0]]
+            )
+            mock_db.get_many = AsyncMock(
+                side_effect=lambda table, ids: {i: skills[i] for i in ids}
+            )
+
+            results = await service.search_skills_batch([
+                SkillSearchQuery(query="extract pdf", top_k=2),
+                SkillSearchQuery(query="summarize", top_k=2),
+                SkillSearchQuery(query="extract pdf", top_k=1),
+            ])
+
+            mock_embedding.generate_embeddings_batch.assert_called_once_with(
+                ["extract pdf", "summarize"]
+            )
+            mock_db.get_many.assert_called_once()
+            assert sorted(mock_db.get_many.call_args.args[1]) == ["sk_a", "sk_b", "sk_c"]
+            assert [[r.skill_id for r in query_results] for query_results in results] == [
+                ["sk_a", "sk_b"],
+                ["sk_b", "sk_c"],
+                ["sk_a"],
+            ]
+
+    @pytest.mark.asyncio
+    async def test_batch_search_falls_back_per_query(self):
+        """Test that one failed vector query doesn't fail the batch"""
+        from skillpilot.core.models.skill import SkillSearchQuery
+        from skillpilot.core.services.vector_search import VectorSearchService
+
+        service = VectorSearchService()
+
+        def vector_search(**kwargs):
+            if kwargs["query_vector"][0] == 0.2:
+                raise ConnectionError("timeout")
+            return [{"skill_id": "sk_a", "similarity": 0.9}]
+
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+            patch.object(service, "_fallback_keyword_search", AsyncMock(return_value=[])),
+        ):
+            mock_embedding.generate_embeddings_batch = AsyncMock(return_value=[[0.1], [0.2]])
+            mock_db.vector_search = AsyncMock(side_effect=vector_search)
+            mock_db.get_many = AsyncMock(return_value={
+                "sk_a": {"skill_id": "sk_a", "skill_name": "A", "platform": "coze"}
+            })
+
+            results = await service.search_skills_batch([
+                SkillSearchQuery(query="first", top_k=1),
+                SkillSearchQuery(query="second", top_k=1),
+            ])
+
+            assert [r.skill_id for r in results[0]] == ["sk_a"]
+            assert results[1] == []
+            service._fallback_keyword_search.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_search_ranks_like_single_search(self):
+        """Test that batch queries are re-ranked and cached like single searches"""
+        from skillpilot.core.models.skill import SkillSearchQuery
+        from skillpilot.core.services.vector_search import VectorSearchService
+
+        service = VectorSearchService()
+        with (
+            patch("skillpilot.core.services.vector_search.seekdb_client") as mock_db,
+            patch("skillpilot.core.services.vector_search.embedding_service") as mock_embedding,
+            patch.object(service, "_local_index_ready", return_value=False),
+        ):
+            mock_embedding.generate_embeddings_batch = AsyncMock(return_value=[[0.1]])
+            mock_db.vector_search = AsyncMock(return_value=[
+                {"skill_id": "sk_niche", "similarity": 0.82, "usage_count": 0, "rating": 0.0},
+                {"skill_id": "sk_popular", "similarity": 0.80, "usage_count": 5000, "rating": 4.8},
+            ])
+            mock_db.get_many = AsyncMock(side_effect=lambda table, ids: {
+                i: {"skill_id": i, "skill_name": i, "platform": "coze"} for i in ids
+            })
+
+            [results] = await service.search_skills_batch([
+                SkillSearchQuery(query="test", threshold=0.1, top_k=2, ranking="blended")
+            ])
+            assert [r.skill_id for r in results] == ["sk_popular", "sk_niche"]
+            assert results[0].score_breakdown is not None
+            vector_calls = mock_db.vector_search.call_count
+
+            # The single search shares the batch's cache entry
+            single = await service.search_skills_semantic(
+                query="test", threshold=0.1, top_k=2, ranking="blended"
+            )
+            assert [r.skill_id for r in single] == ["sk_popular", "sk_niche"]
+            assert mock_db.vector_search.call_count == vector_calls
+
+    def test_vector_row_denormalizes_attributes(self):
+        """Test that skill_vectors rows carry filterable skill attributes"""
+        skill = Skill(
+            skill_id="sk_attrs",
+            skill_name="PDF Tool",
+            platform=PlatformType.DIFY,
+            capabilities=["pdf"],
+            tags=["documents"],
+            pricing=Pricing(type="subscription"),
+            rating=4.5,
+        )
+
+        row = vector_search_service._build_vector_row(skill, [0.1, 0.2])
+
+        assert row["platform"] == "dify"
+        assert row["pricing_type"] == "subscription"
+        assert row["rating"] == 4.5
+        assert row["tags"] == ["documents"]
+        assert row["capabilities"] == ["pdf"]